@@ -0,0 +1,54 @@
+"""
+Measures the number of messages encoded and parsed per second, with the generic methods and with the methods generated
+by the ``codegen_codecs`` option.
+
+Run from the ``aristaproto`` directory, once the test outputs are generated, with ``python -m benchmarks.bench_codecs``.
+"""
+
+import timeit
+
+from tests.outputs.conformance.protobuf_test_messages import proto3 as generic
+from tests.outputs.conformance_codecs.protobuf_test_messages import proto3 as codecs
+
+# A small message, as found in most requests, and one setting many fields of all the kinds
+CASES = {
+    "small": {"optionalInt32": 42, "optionalString": "name", "optionalForeignMessage": {"c": 3}},
+    "large": {
+        "optionalInt64": "-1234567890123",
+        "optionalSint32": -17,
+        "optionalFixed64": "8",
+        "optionalDouble": -2.25,
+        "optionalBool": True,
+        "optionalString": "description",
+        "optionalBytes": "AAECAwQFBgcICQ==",
+        "optionalNestedMessage": {"a": 3},
+        "optionalNestedEnum": "BAR",
+        "repeatedInt32": list(range(50)),
+        "repeatedString": [f"item-{i}" for i in range(20)],
+        "repeatedNestedMessage": [{"a": i} for i in range(20)],
+        "packedDouble": [i / 3 for i in range(50)],
+        "mapStringString": {f"key-{i}": f"value-{i}" for i in range(10)},
+        "optionalTimestamp": "2024-02-29T12:34:56.123456789Z",
+    },
+}
+
+
+def _rate(func, items) -> float:
+    number = 20
+    elapsed = timeit.timeit(lambda: [func(item) for item in items], number=number)
+    return number * len(items) / elapsed
+
+
+def main() -> None:
+    for name, document in CASES.items():
+        print(f"{name}:")
+        for label, module in (("generic", generic), ("codecs", codecs)):
+            messages = [module.TestAllTypesProto3.from_dict(document) for _ in range(200)]
+            data = [bytes(message) for message in messages]
+
+            print(f"  {label:<8} bytes {_rate(bytes, messages):>12,.0f}/s")
+            print(f"  {label:<8} parse {_rate(module.TestAllTypesProto3.parse, data):>12,.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Measures the number of durations converted per second between ``google.protobuf.Duration`` and its JSON representation.
+
+Run from the ``aristaproto`` directory, once the test outputs are generated, with
+``python -m benchmarks.bench_duration``.
+"""
+
+import timeit
+
+from tests.outputs.google.google.protobuf import Duration
+
+# Latencies, as found in histograms
+CASES = {
+    "seconds": [Duration(i, 0) for i in range(1000)],
+    "milliseconds": [Duration(i // 1000, i % 1000 * 1_000_000) for i in range(1000)],
+    "nanoseconds": [Duration(i // 1000, 123_456_789 + i) for i in range(1000)],
+    "negative": [Duration(-i // 1000, -(123_456_000 + i)) for i in range(1000)],
+}
+
+
+def _rate(func, items) -> float:
+    number = 20
+    elapsed = timeit.timeit(lambda: [func(item) for item in items], number=number)
+    return number * len(items) / elapsed
+
+
+def main() -> None:
+    for name, durations in CASES.items():
+        texts = [duration.to_dict() for duration in durations]
+        deltas = [duration.to_timedelta() for duration in durations]
+
+        print(f"{name}:")
+        print(f"  to_dict       {_rate(Duration.to_dict, durations):>12,.0f}/s")
+        print(f"  from_dict     {_rate(Duration.from_dict, texts):>12,.0f}/s")
+        print(f"  delta_to_json {_rate(Duration.delta_to_json, deltas):>12,.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Measures the time taken to create an enum of many members, and to create its members on first use, with the standard
+enum creation and with the lazy members of the ``lazy_enums`` option.
+
+Run from the ``aristaproto`` directory with ``python -m benchmarks.bench_large_enum``.
+"""
+
+import timeit
+
+import aristaproto
+
+MEMBERS = 5000
+
+STANDARD = "class ErrorCode(aristaproto.Enum):\n" + "".join(f"    ERROR_{i} = {i}\n" for i in range(MEMBERS))
+LAZY = (
+    "class ErrorCode(aristaproto.Enum):\n"
+    "    @staticmethod\n"
+    "    def _aristaproto_members() -> dict[str, int]:\n"
+    "        return {" + ", ".join(f'"ERROR_{i}": {i}' for i in range(MEMBERS)) + "}\n"
+)
+
+
+def _time(code, use: bool) -> float:
+    compiled = compile(code, "<enum>", "exec")
+
+    def create():
+        namespace = {"aristaproto": aristaproto}
+        exec(compiled, namespace)
+        if use:
+            namespace["ErrorCode"].ERROR_0
+
+    number = 10
+    return timeit.timeit(create, number=number) / number
+
+
+def main() -> None:
+    print(f"{MEMBERS} members:")
+    for label, code in (("standard", STANDARD), ("lazy", LAZY)):
+        print(f"  {label:<8} create         {_time(code, False) * 1000:>8.1f} ms")
+        print(f"  {label:<8} create and use {_time(code, True) * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
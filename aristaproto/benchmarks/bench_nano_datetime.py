@@ -0,0 +1,39 @@
+"""
+Measures the number of timestamps converted per second between their (seconds, nanos) and RFC 3339 representations.
+
+Run from the ``aristaproto`` directory with ``python -m benchmarks.bench_nano_datetime``.
+"""
+
+import timeit
+
+from aristaproto.nano_datetime import NanoDatetime
+
+# (seconds, nanos) of consecutive events, as in an event stream
+CASES = {
+    "seconds": [(1_700_000_000 + i, 0) for i in range(1000)],
+    "milliseconds": [(1_700_000_000 + i // 10, i % 10 * 100_000_000) for i in range(1000)],
+    "microseconds": [(1_700_000_000 + i // 10, 123_456_000 + i) for i in range(1000)],
+    "nanoseconds": [(1_700_000_000 + i // 10, 123_456_789 + i) for i in range(1000)],
+}
+
+
+def _rate(func, items) -> float:
+    number = 20
+    elapsed = timeit.timeit(lambda: [func(item) for item in items], number=number)
+    return number * len(items) / elapsed
+
+
+def main() -> None:
+    for name, timestamps in CASES.items():
+        texts = [NanoDatetime.timestamp_to_rfc3339(*timestamp) for timestamp in timestamps]
+        datetimes = [NanoDatetime.from_timestamp(*timestamp) for timestamp in timestamps]
+
+        print(f"{name}:")
+        print(f"  timestamp_to_rfc3339 {_rate(lambda t: NanoDatetime.timestamp_to_rfc3339(*t), timestamps):>12,.0f}/s")
+        print(f"  rfc3339_to_timestamp {_rate(NanoDatetime.rfc3339_to_timestamp, texts):>12,.0f}/s")
+        print(f"  to_json              {_rate(NanoDatetime.to_json, datetimes):>12,.0f}/s")
+        print(f"  from_rfc3339         {_rate(NanoDatetime.from_rfc3339, texts):>12,.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
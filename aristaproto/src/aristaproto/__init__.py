@@ -7,23 +7,35 @@ __all__ = [
     "staticproperty",
     "unwrap",
     "MessagePool",
+    "DescriptorFiles",
+    "InternTable",
+    "JsonBackend",
+    "set_json_backend",
+    "set_string_interning",
+    "warmup",
     "validators",
 ]
 
 import dataclasses
 import enum as builtin_enum
+import gc
+import importlib
 import json
 import math
+import pkgutil
 import struct
 import sys
+import threading
 import warnings
 from abc import ABC
 from base64 import b64decode, b64encode
-from collections.abc import Callable, Generator, Iterable, Mapping
+from collections.abc import Callable, Generator, Iterable, Iterator, Mapping
 from copy import deepcopy
 from enum import IntEnum
 from io import BytesIO
 from itertools import count
+from json.encoder import encode_basestring_ascii
+from types import ModuleType
 from typing import TYPE_CHECKING, Any, ClassVar, get_type_hints
 
 from typing_extensions import Self
@@ -36,6 +48,9 @@ except ImportError:
     pydantic_core = None
 
 import aristaproto.validators as validators
+from aristaproto.descriptor_files import DescriptorFiles
+from aristaproto.interning import InternTable, default_intern_table
+from aristaproto.json_backend import JsonBackend, get_json_backend, set_json_backend
 from aristaproto.message_pool import MessagePool
 from aristaproto.utils import unwrap
 
@@ -48,6 +63,8 @@ from .utils import classproperty, staticproperty
 if TYPE_CHECKING:
     from _typeshed import SupportsRead, SupportsWrite
 
+    from aristaproto.transcode import _BinaryWriter, _JsonWriter
+
 # Proto 3 data types
 TYPE_ENUM = "enum"
 TYPE_BOOL = "bool"
@@ -154,6 +171,23 @@ class Casing(builtin_enum.Enum):
             raise ValueError(f"Unknown casing style: {self}")
 
 
+class _LazyContainer:
+    """
+    Placeholder default of the repeated and map fields.
+
+    The placeholder is dropped when the message is initialized, the actual container is only allocated when the field is
+    accessed for the first time.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<lazy container>"
+
+
+_LAZY_CONTAINER: Any = _LazyContainer()
+
+
 @dataclasses.dataclass(frozen=True)
 class FieldMetadata:
     """Stores internal metadata used for parsing & serialization."""
@@ -177,6 +211,12 @@ class FieldMetadata:
     # Is the field repeated
     repeated: bool | None = False
 
+    # Is the field deprecated
+    deprecated: bool = False
+
+    # Are the parsed strings interned
+    intern: bool = False
+
     @staticmethod
     def get(field: dataclasses.Field) -> FieldMetadata:
         """Returns the field metadata for a dataclass field."""
@@ -205,12 +245,21 @@ def field(
     unwrap: Callable[[], type] | None = None,
     optional: bool = False,
     repeated: bool = False,
+    deprecated: bool = False,
+    intern: bool = False,
 ) -> Any:  # Return type is Any to pass type checking
     """Creates a dataclass field with attached protobuf metadata."""
-    if repeated:
-        default_factory = list
+    metadata = {
+        "aristaproto": FieldMetadata(
+            number, proto_type, map_meta, group, unwrap, optional, repeated, deprecated, intern
+        )
+    }
+
+    if repeated or proto_type == TYPE_MAP:
+        # Containers are allocated lazily, see `Message.__getattr__`
+        return dataclasses.field(default=_LAZY_CONTAINER, metadata=metadata)
 
-    elif optional or group:
+    if optional or group:
         default_factory = type(None)
 
     else:
@@ -232,13 +281,9 @@ def field(
             TYPE_STRING: str,
             TYPE_BYTES: bytes,
             TYPE_MESSAGE: type(None),
-            TYPE_MAP: dict,
         }[proto_type]
 
-    return dataclasses.field(
-        default_factory=default_factory or dataclasses.MISSING,
-        metadata={"aristaproto": FieldMetadata(number, proto_type, map_meta, group, unwrap, optional, repeated)},
-    )
+    return dataclasses.field(default_factory=default_factory or dataclasses.MISSING, metadata=metadata)
 
 
 def _pack_fmt(proto_type: str) -> str:
@@ -255,6 +300,11 @@ def _pack_fmt(proto_type: str) -> str:
 
 def dump_varint(value: int, stream: SupportsWrite[bytes]) -> None:
     """Encodes a single varint and dumps it into the provided stream."""
+    stream.write(encode_varint(value))
+
+
+def encode_varint(value: int) -> bytes:
+    """Encodes a single varint value for serialization."""
     if value < -(1 << 63):
         raise ValueError(
             "Negative value is not representable as a 64-bit integer - unable to encode a varint within 10 bytes."
@@ -262,20 +312,15 @@ def dump_varint(value: int, stream: SupportsWrite[bytes]) -> None:
     elif value < 0:
         value += 1 << 64
 
-    bits = value & 0x7F
-    value >>= 7
-    while value:
-        stream.write((0x80 | bits).to_bytes(1, "little"))
-        bits = value & 0x7F
-        value >>= 7
-    stream.write(bits.to_bytes(1, "little"))
-
+    if value < 0x80:
+        return bytes((value,))
 
-def encode_varint(value: int) -> bytes:
-    """Encodes a single varint value for serialization."""
-    with BytesIO() as stream:
-        dump_varint(value, stream)
-        return stream.getvalue()
+    output = bytearray()
+    while value > 0x7F:
+        output.append(0x80 | (value & 0x7F))
+        value >>= 7
+    output.append(value)
+    return bytes(output)
 
 
 def _preprocess_single(proto_type: str, unwrap: Callable[[], type] | None, value: Any) -> bytes:
@@ -298,7 +343,12 @@ def _preprocess_single(proto_type: str, unwrap: Callable[[], type] | None, value
         return value.encode("utf-8")
     elif proto_type == TYPE_MESSAGE:
         if unwrap is not None:
-            value = unwrap().from_wrapped(value)
+            wrapper_cls = unwrap()
+            # The well-known wrapper types write their wrapped value directly to the wire
+            encode_wrapped = getattr(wrapper_cls, "encode_wrapped", None)
+            if encode_wrapped is not None:
+                return encode_wrapped(value)
+            value = wrapper_cls.from_wrapped(value)
 
         return bytes(value)
 
@@ -334,6 +384,131 @@ def _serialize_single(
     return bytes(output)
 
 
+def _dump_bytes(field_number: int, value: bytes, stream: SupportsWrite[bytes]) -> None:
+    """Dumps a bytes field into the stream, without intermediate copies of the value."""
+    stream.write(encode_varint((field_number << 3) | WIRE_LEN_DELIM))
+    dump_varint(len(value), stream)
+    stream.write(value)
+
+
+def _decode_single(
+    wire_type: int,
+    proto_type: str,
+    value: Any,
+    field_cls: type | None,
+    unwrap: Callable[[], type] | None,
+    zero_copy: bool = False,
+) -> Any:
+    """Adjusts a single value after parsing."""
+    if wire_type == WIRE_VARINT:
+        if proto_type in (TYPE_INT32, TYPE_INT64, TYPE_ENUM):
+            bits = 32 if proto_type == TYPE_INT32 else 64
+            value = value & ((1 << bits) - 1)
+            signbit = 1 << (bits - 1)
+            value = int((value ^ signbit) - signbit)
+
+            if proto_type == TYPE_ENUM:
+                # Convert enum ints to python enum instances
+                assert field_cls is not None
+                value = field_cls._from_value(value)
+        elif proto_type in (TYPE_UINT32, TYPE_UINT64):
+            bits = 32 if proto_type == TYPE_UINT32 else 64
+            value = value & ((1 << bits) - 1)
+        elif proto_type in (TYPE_SINT32, TYPE_SINT64):
+            bits = 32 if proto_type == TYPE_SINT32 else 64
+            value = value & ((1 << bits) - 1)
+            value = (value >> 1) ^ (-(value & 1))  # Undo zig-zag encoding
+        elif proto_type == TYPE_BOOL:
+            # Booleans use a varint encoding, so convert it to true/false.
+            value = value > 0
+    elif wire_type in (WIRE_FIXED_32, WIRE_FIXED_64):
+        fmt = _pack_fmt(proto_type)
+        value = struct.unpack(fmt, value)[0]
+    elif wire_type == WIRE_LEN_DELIM:
+        if proto_type == TYPE_STRING:
+            value = str(value, "utf-8")
+        elif proto_type == TYPE_MESSAGE:
+            msg_cls = unwrap() if unwrap else field_cls
+            assert msg_cls is not None
+
+            # The well-known wrapper types read their wrapped value directly from the wire
+            decode_wrapped = getattr(msg_cls, "decode_wrapped", None) if unwrap else None
+            if decode_wrapped is not None:
+                return decode_wrapped(value)
+
+            value = msg_cls.parse(value, zero_copy=zero_copy)
+
+            if unwrap:
+                value = value.to_wrapped()
+
+    return value
+
+
+def _decode_packed(data: bytes | memoryview, proto_type: str, field_cls: type | None) -> list[Any]:
+    """Decodes the items of a packed repeated field."""
+    pos = 0
+    items = []
+    while pos < len(data):
+        if proto_type in (TYPE_FLOAT, TYPE_FIXED32, TYPE_SFIXED32):
+            decoded, pos = data[pos : pos + 4], pos + 4
+            wire_type = WIRE_FIXED_32
+        elif proto_type in (TYPE_DOUBLE, TYPE_FIXED64, TYPE_SFIXED64):
+            decoded, pos = data[pos : pos + 8], pos + 8
+            wire_type = WIRE_FIXED_64
+        else:
+            decoded, pos = decode_varint(data, pos)
+            wire_type = WIRE_VARINT
+        items.append(_decode_single(wire_type, proto_type, decoded, field_cls, None))
+    return items
+
+
+def _dump_field(
+    meta: FieldMetadata, value: Any, map_codec: _MapEntryCodec | None, stream: SupportsWrite[bytes]
+) -> None:
+    """Dumps the value of a field into the stream. The value must not be the default value of the field."""
+    if meta.repeated:
+        if meta.proto_type in PACKED_TYPES:
+            # Packed lists look like a length-delimited field. First,
+            # preprocess/encode each value into a buffer and then
+            # treat it like a field of raw bytes.
+            buf = bytearray()
+            for item in value:
+                buf += _preprocess_single(meta.proto_type, None, item)
+            stream.write(_serialize_single(meta.number, TYPE_BYTES, buf))
+        elif meta.proto_type == TYPE_BYTES:
+            for item in value:
+                _dump_bytes(meta.number, item, stream)
+        else:
+            for item in value:
+                stream.write(
+                    _serialize_single(
+                        meta.number,
+                        meta.proto_type,
+                        item,
+                        unwrap=meta.unwrap,
+                    )
+                    # if it's an empty message it still needs to be
+                    # represented as an item in the repeated list
+                    or b"\n\x00"
+                )
+
+    elif meta.map_meta:
+        assert map_codec is not None
+        for k, v in value.items():
+            stream.write(map_codec.encode(k, v))
+    elif meta.proto_type == TYPE_BYTES:
+        _dump_bytes(meta.number, value, stream)
+    else:
+        stream.write(
+            _serialize_single(
+                meta.number,
+                meta.proto_type,
+                value,
+                unwrap=meta.unwrap,
+            )
+        )
+
+
 def _parse_float(value: Any) -> float:
     """Parse the given value to a float
 
@@ -404,10 +579,35 @@ def decode_varint(buffer: bytes, pos: int) -> tuple[int, int]:
     Decode a single varint value from a byte buffer. Returns the value and the
     new position in the buffer.
     """
-    with BytesIO(buffer) as stream:
-        stream.seek(pos)
-        value, raw = load_varint(stream)
-    return value, pos + len(raw)
+    result = 0
+    for shift in range(0, 64, 7):
+        try:
+            b_int = buffer[pos]
+        except IndexError:
+            raise EOFError("Buffer ended unexpectedly while attempting to decode varint.") from None
+        pos += 1
+        result |= (b_int & 0x7F) << shift
+        if not (b_int & 0x80):
+            return result, pos
+
+    raise ValueError("Too many bytes when decoding varint.")
+
+
+def skip_field(buffer: bytes, pos: int, wire_type: int) -> int:
+    """
+    Skip the value of a field in a byte buffer, given the position following its key. Returns the position following
+    the value.
+    """
+    if wire_type == WIRE_VARINT:
+        _, pos = decode_varint(buffer, pos)
+    elif wire_type == WIRE_LEN_DELIM:
+        length, pos = decode_varint(buffer, pos)
+        pos += length
+    elif wire_type == WIRE_FIXED_64:
+        pos += 8
+    elif wire_type == WIRE_FIXED_32:
+        pos += 4
+    return pos
 
 
 @dataclasses.dataclass(frozen=True)
@@ -469,22 +669,266 @@ def parse_fields(value: bytes) -> Generator[ParsedField, None, None]:
         yield ParsedField(number=number, wire_type=wire_type, value=decoded, raw=value[start:i])
 
 
+def _wire_type_for(proto_type: str) -> int:
+    """Returns the wire type used to encode the given protobuf type."""
+    if proto_type in WIRE_VARINT_TYPES:
+        return WIRE_VARINT
+    elif proto_type in WIRE_FIXED_32_TYPES:
+        return WIRE_FIXED_32
+    elif proto_type in WIRE_FIXED_64_TYPES:
+        return WIRE_FIXED_64
+    elif proto_type in WIRE_LEN_DELIM_TYPES:
+        return WIRE_LEN_DELIM
+    raise NotImplementedError(proto_type)
+
+
+# Encoded zero value of each wire type, used when the key or the value is missing from a map entry
+_WIRE_ZERO_VALUES = {
+    WIRE_VARINT: 0,
+    WIRE_FIXED_32: b"\x00" * 4,
+    WIRE_FIXED_64: b"\x00" * 8,
+    WIRE_LEN_DELIM: b"",
+}
+
+
+def decode_scalar_fields(data: bytes, proto_types: tuple[str, ...]) -> list[Any]:
+    """
+    Decodes the scalar fields of a binary encoded message, without building the message. The fields must be numbered
+    1, 2, ... in the order of ``proto_types``. Those that are missing take the default value of their type, and the
+    other fields are skipped.
+
+    This is used by the well-known wrapper types (``Timestamp``, ``Int32Value``, ...) to read their wrapped value
+    directly from the wire.
+    """
+    values = list(_scalar_defaults(proto_types))
+    pos = 0
+    end = len(data)
+    while pos < end:
+        num_wire, pos = decode_varint(data, pos)
+        wire_type = num_wire & 0x7
+
+        decoded: Any = None
+        if wire_type == WIRE_VARINT:
+            decoded, pos = decode_varint(data, pos)
+        elif wire_type == WIRE_LEN_DELIM:
+            length, pos = decode_varint(data, pos)
+            decoded, pos = data[pos : pos + length], pos + length
+        elif wire_type == WIRE_FIXED_64:
+            decoded, pos = data[pos : pos + 8], pos + 8
+        elif wire_type == WIRE_FIXED_32:
+            decoded, pos = data[pos : pos + 4], pos + 4
+
+        index = (num_wire >> 3) - 1
+        if 0 <= index < len(proto_types):
+            values[index] = _decode_single(wire_type, proto_types[index], decoded, None, None)
+
+    return values
+
+
+def encode_scalar_fields(values: Iterable[Any], proto_types: tuple[str, ...]) -> bytes:
+    """
+    Encodes scalar values as the fields of a binary encoded message, the reverse of `decode_scalar_fields`. As with
+    `Message.__bytes__`, the default values are not written.
+    """
+    return b"".join(
+        _serialize_single(number, proto_type, value)
+        for number, (value, proto_type, default) in enumerate(
+            zip(values, proto_types, _scalar_defaults(proto_types)), 1
+        )
+        if value != default
+    )
+
+
+_scalar_defaults_cache: dict[tuple[str, ...], tuple[Any, ...]] = {}
+
+
+def _scalar_defaults(proto_types: tuple[str, ...]) -> tuple[Any, ...]:
+    """Returns the default value of each of the given scalar types."""
+    try:
+        return _scalar_defaults_cache[proto_types]
+    except KeyError:
+        defaults = _scalar_defaults_cache[proto_types] = tuple(
+            _decode_single(
+                _wire_type_for(proto_type), proto_type, _WIRE_ZERO_VALUES[_wire_type_for(proto_type)], None, None
+            )
+            for proto_type in proto_types
+        )
+        return defaults
+
+
+class _MapEntryCodec:
+    """
+    Decodes and encodes the entries of a map field.
+
+    The entries are read into and written from the key/value pairs directly, without going through an intermediate entry
+    message.
+    """
+
+    __slots__ = (
+        "key_type",
+        "value_type",
+        "value_cls",
+        "value_unwrap",
+        "key_wire_type",
+        "value_wire_type",
+        "key_tag",
+        "value_tag",
+        "entry_tag",
+    )
+
+    def __init__(self, number: int, key_meta: FieldMetadata, value_meta: FieldMetadata, value_cls: type):
+        self.key_type = key_meta.proto_type
+        self.value_type = value_meta.proto_type
+        self.value_cls = value_cls
+        self.value_unwrap = value_meta.unwrap
+        self.key_wire_type = _wire_type_for(self.key_type)
+        self.value_wire_type = _wire_type_for(self.value_type)
+        self.key_tag = encode_varint((1 << 3) | self.key_wire_type)
+        self.value_tag = encode_varint((2 << 3) | self.value_wire_type)
+        self.entry_tag = encode_varint((number << 3) | WIRE_LEN_DELIM)
+
+    def decode(
+        self, data: bytes, intern: bool = False, zero_copy: bool = False, raw_value: bool = False
+    ) -> tuple[Any, Any]:
+        """
+        Decodes the key and the value of a serialized map entry, interning the strings if requested. The value is left
+        as it was read from the wire if ``raw_value`` is set.
+        """
+        key = value = _LAZY_CONTAINER
+        pos = 0
+        end = len(data)
+        while pos < end:
+            num_wire, pos = decode_varint(data, pos)
+            wire_type = num_wire & 0x7
+
+            decoded: Any = None
+            if wire_type == WIRE_VARINT:
+                decoded, pos = decode_varint(data, pos)
+            elif wire_type == WIRE_LEN_DELIM:
+                length, pos = decode_varint(data, pos)
+                decoded, pos = data[pos : pos + length], pos + length
+            elif wire_type == WIRE_FIXED_64:
+                decoded, pos = data[pos : pos + 8], pos + 8
+            elif wire_type == WIRE_FIXED_32:
+                decoded, pos = data[pos : pos + 4], pos + 4
+
+            number = num_wire >> 3
+            if number == 1:
+                key = _decode_single(wire_type, self.key_type, decoded, None, None)
+                if intern and self.key_type == TYPE_STRING:
+                    key = default_intern_table(key)
+            elif number == 2:
+                if raw_value:
+                    value = decoded
+                    continue
+                value = _decode_single(
+                    wire_type, self.value_type, decoded, self.value_cls, self.value_unwrap, zero_copy
+                )
+                if intern and self.value_type == TYPE_STRING:
+                    value = default_intern_table(value)
+
+        # Missing keys and values take the default value of their type
+        if key is _LAZY_CONTAINER:
+            key = _decode_single(self.key_wire_type, self.key_type, _WIRE_ZERO_VALUES[self.key_wire_type], None, None)
+        if value is _LAZY_CONTAINER and raw_value:
+            value = _WIRE_ZERO_VALUES[self.value_wire_type]
+        elif value is _LAZY_CONTAINER:
+            value = _decode_single(
+                self.value_wire_type,
+                self.value_type,
+                _WIRE_ZERO_VALUES[self.value_wire_type],
+                self.value_cls,
+                self.value_unwrap,
+            )
+
+        return key, value
+
+    def encode(self, key: Any, value: Any) -> bytes:
+        """Encodes a key/value pair as a serialized map entry, including the tag of the map field."""
+        key_bytes = _preprocess_single(self.key_type, None, key)
+        key_size = encode_varint(len(key_bytes)) if self.key_wire_type == WIRE_LEN_DELIM else b""
+
+        value_bytes = _preprocess_single(self.value_type, self.value_unwrap, value)
+        value_size = encode_varint(len(value_bytes)) if self.value_wire_type == WIRE_LEN_DELIM else b""
+
+        size = (
+            len(self.key_tag)
+            + len(key_size)
+            + len(key_bytes)
+            + len(self.value_tag)
+            + len(value_size)
+            + len(value_bytes)
+        )
+        return b"".join(
+            (
+                self.entry_tag,
+                encode_varint(size),
+                self.key_tag,
+                key_size,
+                key_bytes,
+                self.value_tag,
+                value_size,
+                value_bytes,
+            )
+        )
+
+
+def _deepcopy_value(value: Any, meta: FieldMetadata) -> Any:
+    """Deep copies a field value, turning the zero-copy memoryview slices into bytes since they can't be copied."""
+    if meta.proto_type == TYPE_BYTES:
+        if meta.repeated:
+            return [bytes(item) for item in value]
+        return value if value is None else bytes(value)
+    elif meta.map_meta and meta.map_meta[1].proto_type == TYPE_BYTES:
+        return {key: bytes(item) for key, item in value.items()}
+    return deepcopy(value)
+
+
+# Held while publishing the metadata of a message class. The metadata is built without it, since building it can
+# import other modules or require the metadata of other classes.
+_metadata_lock = threading.Lock()
+
+
 class ProtoClassMetadata:
     __slots__ = (
         "oneof_field_by_group",
         "default_gen",
         "cls_by_field",
+        "map_codecs",
+        "type_hints",
+        "to_dict_converters",
+        "from_dict_converters",
+        "json_writers",
+        "binary_writers",
         "field_name_by_number",
         "meta_by_field_name",
         "sorted_field_names",
+        "container_field_names",
+        "default_values",
+        "warn_deprecated_message",
+        "pending_deprecated_fields",
+        "generated_encode",
+        "generated_decode",
     )
 
     oneof_field_by_group: dict[str, set[dataclasses.Field]]
     field_name_by_number: dict[int, str]
     meta_by_field_name: dict[str, FieldMetadata]
     sorted_field_names: tuple[str, ...]
+    container_field_names: tuple[str, ...]
     default_gen: dict[str, Callable[[], Any]]
+    default_values: dict[str, Any]
+    warn_deprecated_message: bool
+    pending_deprecated_fields: set[str]
+    generated_encode: Callable[[Message], bytes] | None
+    generated_decode: Callable[[bytes], Message] | None
     cls_by_field: dict[str, type]
+    map_codecs: dict[str, _MapEntryCodec]
+    type_hints: dict[str, type]
+    to_dict_converters: dict[tuple[OutputFormat, Casing, bool], _ToDictConverter]
+    from_dict_converters: dict[bool, _FromDictConverter]
+    json_writers: dict[tuple[Casing, bool], _JsonWriter]
+    binary_writers: dict[bool, _BinaryWriter]
 
     def __init__(self, cls: type[Message]):
         by_group: dict[str, set] = {}
@@ -509,41 +953,99 @@ class ProtoClassMetadata:
 
         self.default_gen = {}
         for field in fields:
-            assert field.default_factory is not dataclasses.MISSING
-            self.default_gen[field.name] = field.default_factory
-
-        self.cls_by_field = self._get_cls_by_field(cls, fields)
+            if field.default is _LAZY_CONTAINER:
+                self.default_gen[field.name] = dict if by_field_name[field.name].proto_type == TYPE_MAP else list
+            else:
+                assert field.default_factory is not dataclasses.MISSING
+                self.default_gen[field.name] = field.default_factory
+
+        self.container_field_names = tuple(field.name for field in fields if field.default is _LAZY_CONTAINER)
+
+        # The dataclass decorator stores the placeholder as a class attribute, which would hide `Message.__getattr__`.
+        # The metadata is always built before the first instance is initialized, so it's safe to remove them here.
+        # Only the class itself is changed: the placeholders of the messages it inherits from are removed when their
+        # own metadata is built, and the other classes are left untouched.
+        for field_name in self.container_field_names:
+            if vars(cls).get(field_name) is _LAZY_CONTAINER:
+                # Another thread building the metadata at the same moment may have removed it already
+                try:
+                    delattr(cls, field_name)
+                except AttributeError:
+                    pass
+        for klass in cls.__mro__[1:]:
+            if issubclass(klass, Message) and any(
+                vars(klass).get(field_name) is _LAZY_CONTAINER for field_name in self.container_field_names
+            ):
+                klass._aristaproto
+
+        # Apart from the containers, all the default values are immutable and can be shared between the instances
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", category=DeprecationWarning)
+            self.default_values = {
+                field_name: default_gen()
+                for field_name, default_gen in self.default_gen.items()
+                if field_name not in self.container_field_names
+            }
+
+        # Deprecation warnings of the messages built with `Message.construct` are only emitted once per class
+        self.warn_deprecated_message = cls._aristaproto_deprecated
+        self.pending_deprecated_fields = {field.name for field in fields if by_field_name[field.name].deprecated}
+
+        self.type_hints = cls._type_hints()
+        self.cls_by_field = self._get_cls_by_field(fields, self.type_hints)
+        self.map_codecs = self._get_map_codecs(fields, self.type_hints)
+
+        # The encoding and decoding methods generated with the `codegen_codecs` option, only used by the class defining
+        # them since they don't know the fields of the subclasses
+        encode = cls.__dict__.get("_aristaproto_encode")
+        decode = cls.__dict__.get("_aristaproto_decode")
+        self.generated_encode = encode
+        self.generated_decode = decode.__get__(None, cls) if decode is not None else None
+
+        # The dict converters and the writers of `aristaproto.transcode` are compiled when they are first used
+        self.to_dict_converters = {}
+        self.from_dict_converters = {}
+        self.json_writers = {}
+        self.binary_writers = {}
 
     @staticmethod
-    def _get_cls_by_field(cls: type[Message], fields: Iterable[dataclasses.Field]) -> dict[str, type]:  # type: ignore[reportSelfClsParameterName]
+    def _get_cls_by_field(fields: Iterable[dataclasses.Field], type_hints: dict[str, type]) -> dict[str, type]:
         field_cls = {}
 
         for field_ in fields:
             meta = FieldMetadata.get(field_)
             if meta.proto_type == TYPE_MAP:
-                assert meta.map_meta
-                kt = cls._cls_for(field_, index=0)
-                vt = cls._cls_for(field_, index=1)
-
-                if meta.map_meta[1].proto_type == TYPE_ENUM:
-                    value_field = field(2, meta.map_meta[1].proto_type, default_factory=lambda: vt(0))
-                else:
-                    value_field = field(2, meta.map_meta[1].proto_type, unwrap=meta.map_meta[1].unwrap)
-
-                field_cls[field_.name] = dataclasses.make_dataclass(
-                    "Entry",
-                    [
-                        ("key", kt, field(1, meta.map_meta[0].proto_type)),
-                        ("value", vt, value_field),
-                    ],
-                    bases=(Message,),
-                )
-                field_cls[f"{field_.name}.value"] = vt
+                field_cls[field_.name] = dict
+                field_cls[f"{field_.name}.value"] = _cls_from_type_hint(type_hints[field_.name], index=1)
             else:
-                field_cls[field_.name] = cls._cls_for(field_)
+                field_cls[field_.name] = _cls_from_type_hint(type_hints[field_.name])
 
         return field_cls
 
+    @staticmethod
+    def _get_map_codecs(fields: Iterable[dataclasses.Field], type_hints: dict[str, type]) -> dict[str, _MapEntryCodec]:
+        map_codecs = {}
+
+        for field_ in fields:
+            meta = FieldMetadata.get(field_)
+            if meta.proto_type == TYPE_MAP:
+                assert meta.map_meta
+                map_codecs[field_.name] = _MapEntryCodec(
+                    meta.number,
+                    meta.map_meta[0],
+                    meta.map_meta[1],
+                    _cls_from_type_hint(type_hints[field_.name], index=1),
+                )
+
+        return map_codecs
+
+
+def _cls_from_type_hint(field_type: Any, index: int = 0) -> type:
+    """Get the message class for a field from its type hint."""
+    if hasattr(field_type, "__args__") and index >= 0 and field_type.__args__ is not None:
+        return field_type.__args__[index]
+    return field_type
+
 
 class OutputFormat(IntEnum):
     """
@@ -594,18 +1096,65 @@ def _value_to_dict(
     if proto_type == TYPE_BYTES:
         return b64encode(value).decode("utf8"), not bool(value)
     if proto_type == TYPE_ENUM:
-        enum_value = field_type(value)
-
         # If we don't know the definition of this variant, we fall back to the value.
-        if not enum_value.name:
-            return enum_value.value, not bool(value)
-
-        return enum_value.proto_name or enum_value.name, not bool(value)
+        return field_type._aristaproto_json_names.get(value, int(value)), not bool(value)
     if proto_type in (TYPE_FLOAT, TYPE_DOUBLE):
         return _dump_float(value), not bool(value)
     return value, not bool(value)
 
 
+def _encode_json(value: Any) -> str:
+    """Encodes a value returned by `_value_to_dict` as JSON, the same way `json.dumps` does."""
+    if isinstance(value, str):
+        return encode_basestring_ascii(value)
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if isinstance(value, float):
+        return float.__repr__(value)
+    # Containers returned by the known types
+    return json.dumps(value)
+
+
+def _encode_json_key(key: Any) -> str:
+    """Encodes a map key as a JSON object key, the same way `json.dumps` does."""
+    if isinstance(key, str):
+        return encode_basestring_ascii(key)
+    return f'"{_encode_json(key)}"'
+
+
+def _iter_value_json(
+    value: Any,
+    proto_type: str,
+    field_type: type,
+    unwrapped_type: Callable[[], type] | None,
+    casing: Casing,
+    include_default_values: bool,
+) -> Iterator[str]:
+    """Encodes a single item as JSON chunks. This function is called by `Message.iter_json` on each value."""
+    if proto_type != TYPE_MESSAGE:
+        yield _encode_json(
+            _value_to_dict(
+                value, proto_type, field_type, None, OutputFormat.PROTO_JSON, casing, include_default_values
+            )[0]
+        )
+        return
+
+    if unwrapped_type is not None:
+        value = unwrapped_type().from_wrapped(value)
+
+    if type(value).to_dict is Message.to_dict:
+        yield from value.iter_json(casing=casing, include_default_values=include_default_values)
+    else:
+        # The known types have their own JSON representation, which is small enough to be built in memory
+        yield _encode_json(value.to_dict(casing=casing, include_default_values=include_default_values))
+
+
 def _value_from_dict(value: Any, meta: FieldMetadata, field_type: type, ignore_unknown_fields: bool) -> Any:
     if meta.proto_type == TYPE_MESSAGE:
         msg_cls = meta.unwrap() if meta.unwrap else field_type
@@ -618,8 +1167,8 @@ def _value_from_dict(value: Any, meta: FieldMetadata, field_type: type, ignore_u
 
     if meta.proto_type == TYPE_ENUM:
         if isinstance(value, str):
-            if (int_value := field_type.aristaproto_renamed_proto_names_to_value().get(value)) is not None:
-                return field_type(int_value)
+            if (member := field_type._aristaproto_members_by_json_name.get(value)) is not None:
+                return member
             return field_type.from_string(value)
         if isinstance(value, int):
             return field_type(value)
@@ -639,6 +1188,319 @@ def _value_from_dict(value: Any, meta: FieldMetadata, field_type: type, ignore_u
     return value
 
 
+# Marker of the fields left out of the output of the converters
+_SKIP: Any = object()
+
+
+def _compile_value_to_dict(
+    proto_type: str,
+    field_type: type,
+    unwrapped_type: Callable[[], type] | None,
+    output_format: OutputFormat,
+    casing: Casing,
+    include_default_values: bool,
+) -> Callable[[Any], Any]:
+    """
+    Returns the function converting a single item to a Python dictionnary, see `_value_to_dict`. The conversion is
+    chosen once for all the items of the field.
+    """
+    if proto_type == TYPE_MESSAGE:
+        if unwrapped_type is not None and output_format == OutputFormat.PYTHON:
+            return _identity
+
+        def message_to_dict(value: Any) -> Any:
+            return value.to_dict(
+                output_format=output_format, casing=casing, include_default_values=include_default_values
+            )
+
+        if unwrapped_type is not None:
+            wrapper_cls = unwrapped_type()
+            return lambda value: message_to_dict(wrapper_cls.from_wrapped(value))
+        return message_to_dict
+
+    if output_format == OutputFormat.PYTHON:
+        return _identity
+
+    # PROTO_JSON
+    if proto_type in INT_64_TYPES:
+        return str
+    if proto_type == TYPE_BYTES:
+        return lambda value: b64encode(value).decode("utf8")
+    if proto_type == TYPE_ENUM:
+        json_names = field_type._aristaproto_json_names
+
+        def enum_to_dict(value: Any) -> Any:
+            try:
+                return json_names[value]
+            except KeyError:
+                # If we don't know the definition of this variant, we fall back to the value.
+                return int(value)
+
+        return enum_to_dict
+    if proto_type in (TYPE_FLOAT, TYPE_DOUBLE):
+        return _dump_float
+    return _identity
+
+
+def _compile_value_from_dict(
+    meta: FieldMetadata, field_type: type, ignore_unknown_fields: bool
+) -> Callable[[Any], Any]:
+    """
+    Returns the function converting a single item from a Python dictionnary, see `_value_from_dict`. The conversion is
+    chosen once for all the items of the field.
+    """
+    if meta.proto_type == TYPE_MESSAGE:
+        if meta.unwrap:
+            wrapper_cls = meta.unwrap()
+            return lambda value: wrapper_cls.from_dict(value, ignore_unknown_fields=ignore_unknown_fields).to_wrapped()
+        return lambda value: field_type.from_dict(value, ignore_unknown_fields=ignore_unknown_fields)
+
+    if meta.proto_type == TYPE_ENUM:
+        members_by_json_name = field_type._aristaproto_members_by_json_name
+
+        def enum_from_dict(value: Any) -> Any:
+            if type(value) is int:
+                return field_type._from_value(value)
+            try:
+                return members_by_json_name[value]
+            except (KeyError, TypeError):
+                return _value_from_dict(value, meta, field_type, ignore_unknown_fields)
+
+        return enum_from_dict
+
+    if meta.proto_type in ALL_INT_TYPES:
+        return int
+
+    if meta.proto_type == TYPE_BYTES:
+        return b64decode
+
+    if meta.proto_type in (TYPE_FLOAT, TYPE_DOUBLE):
+        return _parse_float
+
+    return _identity
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+class _ToDictConverter:
+    """
+    Converts the instances of a message class to dictionnaries, see `Message.to_dict`.
+
+    The conversion of each field is compiled once per class and per set of options, so that converting a message is a
+    straight sequence of field conversions.
+    """
+
+    __slots__ = ("fields",)
+
+    fields: list[tuple[str, str, Callable[[Any], Any]]]
+
+    def __init__(self, cls: type[Message], output_format: OutputFormat, casing: Casing, include_default_values: bool):
+        options = (output_format, casing, include_default_values)
+        field_types = cls._aristaproto.type_hints
+
+        self.fields = []
+        for field_name, meta in cls._aristaproto.meta_by_field_name.items():
+            cased_name = casing(field_name).rstrip("_")  # type: ignore
+
+            if meta.repeated or meta.optional:
+                field_type = field_types[field_name].__args__[0]
+            else:
+                field_type = field_types[field_name]
+
+            if meta.repeated:
+                convert = self._repeated(
+                    _compile_value_to_dict(meta.proto_type, field_type, meta.unwrap, *options), include_default_values
+                )
+            elif meta.proto_type == TYPE_MAP:
+                assert meta.map_meta is not None
+                convert = self._map(
+                    _compile_value_to_dict(
+                        meta.map_meta[0].proto_type, field_types[field_name].__args__[0], None, *options
+                    ),
+                    _compile_value_to_dict(
+                        meta.map_meta[1].proto_type,
+                        field_types[field_name].__args__[1],
+                        meta.map_meta[1].unwrap,
+                        *options,
+                    ),
+                    include_default_values,
+                )
+            else:
+                convert = self._single(
+                    _compile_value_to_dict(meta.proto_type, field_type, meta.unwrap, *options),
+                    # Messages and optional values are never considered as default values when they are set
+                    meta.proto_type == TYPE_MESSAGE or bool(meta.optional),
+                    include_default_values,
+                )
+
+            self.fields.append((field_name, cased_name, convert))
+
+    @staticmethod
+    def of(
+        cls: type[Message], output_format: OutputFormat, casing: Casing, include_default_values: bool
+    ) -> _ToDictConverter:
+        """Returns the converter of a message class for the given options, compiling it on first use."""
+        options = (output_format, casing, include_default_values)
+        try:
+            return cls._aristaproto.to_dict_converters[options]
+        except KeyError:
+            converter = cls._aristaproto.to_dict_converters[options] = _ToDictConverter(cls, *options)
+            return converter
+
+    @staticmethod
+    def _repeated(convert_item: Callable[[Any], Any], include_default_values: bool) -> Callable[[Any], Any]:
+        def convert(value: Any) -> Any:
+            output_value = [convert_item(item) for item in value or ()]
+            return output_value if output_value or include_default_values else _SKIP
+
+        return convert
+
+    @staticmethod
+    def _map(
+        convert_key: Callable[[Any], Any], convert_value: Callable[[Any], Any], include_default_values: bool
+    ) -> Callable[[Any], Any]:
+        def convert(value: Any) -> Any:
+            output_map = {convert_key(k): convert_value(v) for k, v in (value or {}).items()}
+            return output_map if output_map or include_default_values else _SKIP
+
+        return convert
+
+    @staticmethod
+    def _single(
+        convert_value: Callable[[Any], Any], always_set: bool, include_default_values: bool
+    ) -> Callable[[Any], Any]:
+        if include_default_values:
+            return lambda value: None if value is None else convert_value(value)
+
+        def convert(value: Any) -> Any:
+            if value is None or not (always_set or value):
+                return _SKIP
+            return convert_value(value)
+
+        return convert
+
+    def __call__(self, message: Message) -> dict[str, Any]:
+        output: dict[str, Any] = {}
+        values = message.__dict__
+        for field_name, cased_name, convert in self.fields:
+            output_value = convert(values.get(field_name))
+            if output_value is not _SKIP:
+                output[cased_name] = output_value
+        return output
+
+
+class _FromDictConverter:
+    """
+    Converts dictionnaries to the init arguments of a message class, see `Message._from_dict_init`.
+
+    The conversion of each field is compiled once per class, and the keys of the dictionnaries are matched to the
+    fields once per distinct key.
+    """
+
+    __slots__ = ("cls", "ignore_unknown_fields", "by_field_name", "by_key")
+
+    by_field_name: dict[str, Callable[[Any], Any]]
+    by_key: dict[str, tuple[str, Callable[[Any], Any]]]
+
+    def __init__(self, cls: type[Message], ignore_unknown_fields: bool):
+        self.cls = cls
+        self.ignore_unknown_fields = ignore_unknown_fields
+        self.by_key = {}
+
+        proto_meta = cls._aristaproto
+        self.by_field_name = {}
+        for field_name, meta in proto_meta.meta_by_field_name.items():
+            field_cls = proto_meta.cls_by_field[field_name]
+
+            if meta.proto_type == TYPE_MAP:
+                assert meta.map_meta
+                convert = self._map(
+                    _compile_value_from_dict(meta.map_meta[0], type(None), ignore_unknown_fields),
+                    _compile_value_from_dict(
+                        meta.map_meta[1], proto_meta.cls_by_field[f"{field_name}.value"], ignore_unknown_fields
+                    ),
+                )
+            elif meta.repeated:
+                convert = self._repeated(_compile_value_from_dict(meta, field_cls, ignore_unknown_fields))
+            else:
+                convert = _compile_value_from_dict(meta, field_cls, ignore_unknown_fields)
+
+            # Edge case: None shouldn't be ignored for google.protobuf.Value
+            # See https://protobuf.dev/programming-guides/json/
+            name, module = field_cls.__name__, field_cls.__module__
+            if not (module.endswith("google.protobuf") and name == "Value"):
+                convert = self._skip_none(convert)
+
+            self.by_field_name[field_name] = convert
+
+    @staticmethod
+    def of(cls: type[Message], ignore_unknown_fields: bool) -> _FromDictConverter:
+        """Returns the converter of a message class, compiling it on first use."""
+        try:
+            return cls._aristaproto.from_dict_converters[ignore_unknown_fields]
+        except KeyError:
+            converter = cls._aristaproto.from_dict_converters[ignore_unknown_fields] = _FromDictConverter(
+                cls, ignore_unknown_fields
+            )
+            return converter
+
+    @staticmethod
+    def _repeated(convert_item: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        return lambda value: [convert_item(item) for item in value]
+
+    @staticmethod
+    def _map(convert_key: Callable[[Any], Any], convert_value: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        def convert(value: Any) -> Any:
+            assert isinstance(value, dict)
+            return {convert_key(k): convert_value(v) for k, v in value.items()}
+
+        return convert
+
+    @staticmethod
+    def _skip_none(convert: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        return lambda value: _SKIP if value is None else convert(value)
+
+    def lookup(self, key: str) -> tuple[str, Callable[[Any], Any]] | None:
+        """
+        Returns the name and the converter of the field matching a key, or ``None`` if the key is unknown and
+        ignored.
+        """
+        try:
+            return self.by_key[key]
+        except KeyError:
+            field_name = safe_snake_case(key)
+            try:
+                found = self.by_key[key] = field_name, self.by_field_name[field_name]
+                return found
+            except KeyError:
+                # According to the protobuf spec (https://protobuf.dev/programming-guides/json/): "The protobuf
+                # JSON parser should reject unknown fields by default but may provide an option to ignore unknown
+                # fields in parsing."
+                if self.ignore_unknown_fields:
+                    return None
+
+                raise KeyError(f"Unknown field '{field_name}' in message {self.cls.__name__}.") from None
+
+    def __call__(self, mapping: Mapping[str, Any] | Any) -> dict[str, Any]:
+        init_kwargs: dict[str, Any] = {}
+        by_key = self.by_key
+        for key, value in mapping.items():
+            try:
+                field_name, convert = by_key[key]
+            except KeyError:
+                found = self.lookup(key)
+                if found is None:
+                    continue
+                field_name, convert = found
+
+            value = convert(value)
+            if value is not _SKIP:
+                init_kwargs[field_name] = value
+        return init_kwargs
+
+
 class Message(ABC):
     """
     The base class for protobuf messages, all generated messages will inherit from
@@ -648,17 +1510,44 @@ class Message(ABC):
 
     _unknown_fields: bytes
     _aristaproto_meta: ClassVar[ProtoClassMetadata]
+    _aristaproto_deprecated: ClassVar[bool] = False
+    _aristaproto_intern_strings: ClassVar[bool] = False
 
     def __post_init__(self) -> None:
         self._unknown_fields = b""
 
+        # Drop the placeholders of the containers that were not given: they are allocated on first access
+        values = self.__dict__
+        for field_name in self._aristaproto.container_field_names:
+            if values[field_name] is _LAZY_CONTAINER:
+                del values[field_name]
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called when the attribute is not found, which is the case of the containers that have not been
+        # allocated yet.
+        if name in self._aristaproto.container_field_names:
+            value = self.__dict__[name] = self._aristaproto.default_gen[name]()
+            return value
+
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
     def __eq__(self, other) -> bool:
         if type(self) is not type(other):
             return NotImplemented
 
+        # The values are read from the instance dicts, to not allocate the containers that were never accessed
+        values, other_values = self.__dict__, other.__dict__
         for field_name in self._aristaproto.meta_by_field_name:
-            self_val = self.__getattribute__(field_name)
-            other_val = other.__getattribute__(field_name)
+            self_val = values.get(field_name, _LAZY_CONTAINER)
+            other_val = other_values.get(field_name, _LAZY_CONTAINER)
+
+            if self_val is _LAZY_CONTAINER or other_val is _LAZY_CONTAINER:
+                # A container that was never allocated is empty
+                if self_val is not _LAZY_CONTAINER and self_val:
+                    return False
+                if other_val is not _LAZY_CONTAINER and other_val:
+                    return False
+                continue
 
             if self_val != other_val:
                 # We consider two nan values to be the same for the
@@ -680,43 +1569,115 @@ class Message(ABC):
         parts = [
             f"{field_name}={value!r}"
             for field_name in self._aristaproto.sorted_field_names
-            for value in (self.__getattribute__(field_name),)
-            if value != self._get_field_default(field_name)
+            if self._is_field_set(field_name)
+            for value in (self.__dict__[field_name],)
         ]
         return f"{self.__class__.__name__}({', '.join(parts)})"
 
     def __bool__(self) -> bool:
         """True if the message has any fields with non-default values."""
-        return any(
-            self.__getattribute__(field_name) != self._get_field_default(field_name)
-            for field_name in self._aristaproto.meta_by_field_name
-        )
+        return any(self._is_field_set(field_name) for field_name in self._aristaproto.meta_by_field_name)
+
+    def _is_field_set(self, field_name: str) -> bool:
+        # Reads the instance dict, to not allocate the containers that were never accessed
+        value = self.__dict__.get(field_name, _LAZY_CONTAINER)
+        if value is _LAZY_CONTAINER:
+            return False
+        if field_name in self._aristaproto.container_field_names:
+            return bool(value)
+        return value != self._get_field_default(field_name)
 
     def __deepcopy__(self: T, _: Any = {}) -> T:
         kwargs = {}
+        values = self.__dict__
         for name in self._aristaproto.sorted_field_names:
-            value = self.__getattribute__(name)
-            kwargs[name] = deepcopy(value)
-        return self.__class__(**kwargs)  # type: ignore
+            # Containers that were never allocated are left unallocated in the copy
+            if name in values:
+                kwargs[name] = _deepcopy_value(values[name], self._aristaproto.meta_by_field_name[name])
+        return self.__class__.construct(**kwargs)
 
     def __copy__(self: T, _: Any = {}) -> T:
         kwargs = {}
+        values = self.__dict__
         for name in self._aristaproto.sorted_field_names:
-            value = self.__getattribute__(name)
-            kwargs[name] = value
-        return self.__class__(**kwargs)  # type: ignore
+            if name in values:
+                kwargs[name] = values[name]
+        return self.__class__.construct(**kwargs)
+
+    @classmethod
+    def construct(cls, **fields: Any) -> Self:
+        """
+        Create a new message instance from trusted field values.
+
+        This is a fast path that bypasses the dataclass initializer: the values are neither validated (even for pydantic
+        dataclasses) nor copied, and `__post_init__` is not called. The fields that are not given are set to their
+        default value. It is used internally when parsing and copying messages.
+
+        Deprecation warnings are only emitted the first time a deprecated message or field is built with this method.
+
+        Parameters
+        -----------
+        fields:
+            The values of the fields, by field name.
+
+        Returns
+        --------
+        :class:`Message`
+            The new message instance.
+        """
+        proto_meta = cls._aristaproto
+
+        msg = cls.__new__(cls)
+        values = msg.__dict__
+        values.update(proto_meta.default_values)
+        values.update(fields)
+        values["_unknown_fields"] = b""
+
+        if proto_meta.warn_deprecated_message or proto_meta.pending_deprecated_fields:
+            msg._warn_deprecated_once()
+
+        return msg
+
+    def _warn_deprecated_once(self) -> None:
+        proto_meta = self._aristaproto
+
+        # The warnings to emit are claimed under the lock, so that each one is emitted by a single thread. The fields
+        # are checked before, since checking them can decode their values.
+        set_field_names = [
+            field_name for field_name in tuple(proto_meta.pending_deprecated_fields) if self.is_set(field_name)
+        ]
+        with _metadata_lock:
+            warn_message = proto_meta.warn_deprecated_message
+            proto_meta.warn_deprecated_message = False
+            field_names = sorted(
+                field_name for field_name in set_field_names if field_name in proto_meta.pending_deprecated_fields
+            )
+            proto_meta.pending_deprecated_fields.difference_update(field_names)
+
+        if warn_message:
+            warnings.warn(f"{type(self).__name__} is deprecated", DeprecationWarning)
+
+        for field_name in field_names:
+            warnings.warn(f"{type(self).__name__}.{field_name} is deprecated", DeprecationWarning)
 
     @classproperty
     def _aristaproto(cls: type[Self]) -> ProtoClassMetadata:  # type: ignore
         """
         Lazy initialize metadata for each protobuf class.
-        It may be initialized multiple times in a multi-threaded environment,
-        but that won't affect the correctness.
+        All the threads get the same metadata, even when several of them use the class for the first time at the same
+        moment. See `warmup` to build it ahead of time.
         """
         try:
             return cls._aristaproto_meta
         except AttributeError:
-            cls._aristaproto_meta = ProtoClassMetadata(cls)
+            pass
+
+        # Built without the lock, since building the metadata can import the modules defining the types of the fields
+        metadata = ProtoClassMetadata(cls)
+        with _metadata_lock:
+            # Another thread may have built the metadata in the meantime, in which case its metadata is kept
+            if "_aristaproto_meta" not in cls.__dict__:
+                cls._aristaproto_meta = metadata
             return cls._aristaproto_meta
 
     def _is_pydantic(self) -> bool:
@@ -735,8 +1696,9 @@ class Message(ABC):
         if not self._is_pydantic():
             raise TypeError("Validation is only available for pydantic dataclasses.")
 
-        dict = self.__dict__.copy()
-        del dict["_unknown_fields"]
+        # Only the fields are validated, not the other attributes such as the unknown fields
+        fields = self._aristaproto.meta_by_field_name
+        dict = {name: value for name, value in self.__dict__.items() if name in fields}
         pydantic_core.SchemaValidator(self.__pydantic_core_schema__).validate_python(dict)  # type: ignore
 
     def dump(self, stream: SupportsWrite[bytes], delimit: bool = False) -> None:
@@ -765,9 +1727,15 @@ class Message(ABC):
         if self._is_pydantic():
             self._validate()
 
+        generated_encode = self._aristaproto.generated_encode
+        if generated_encode is not None:
+            return generated_encode(self)
+
+        values = self.__dict__
         with BytesIO() as stream:
             for field_name, meta in self._aristaproto.meta_by_field_name.items():
-                value = getattr(self, field_name)
+                # Read the instance dictionary directly to avoid allocating the containers that are not set
+                value = values.get(field_name)
 
                 if value is None:
                     # Optional items should be skipped. This is used for the Google
@@ -778,43 +1746,7 @@ class Message(ABC):
                     # Default (zero) values are not serialized.
                     continue
 
-                if meta.repeated:
-                    if meta.proto_type in PACKED_TYPES:
-                        # Packed lists look like a length-delimited field. First,
-                        # preprocess/encode each value into a buffer and then
-                        # treat it like a field of raw bytes.
-                        buf = bytearray()
-                        for item in value:
-                            buf += _preprocess_single(meta.proto_type, None, item)
-                        stream.write(_serialize_single(meta.number, TYPE_BYTES, buf))
-                    else:
-                        for item in value:
-                            stream.write(
-                                _serialize_single(
-                                    meta.number,
-                                    meta.proto_type,
-                                    item,
-                                    unwrap=meta.unwrap,
-                                )
-                                # if it's an empty message it still needs to be
-                                # represented as an item in the repeated list
-                                or b"\n\x00"
-                            )
-
-                elif meta.map_meta:
-                    for k, v in value.items():
-                        sk = _serialize_single(1, meta.map_meta[0].proto_type, k)
-                        sv = _serialize_single(2, meta.map_meta[1].proto_type, v, unwrap=meta.map_meta[1].unwrap)
-                        stream.write(_serialize_single(meta.number, meta.proto_type, sk + sv))
-                else:
-                    stream.write(
-                        _serialize_single(
-                            meta.number,
-                            meta.proto_type,
-                            value,
-                            unwrap=meta.unwrap,
-                        )
-                    )
+                _dump_field(meta, value, self._aristaproto.map_codecs.get(field_name), stream)
 
             stream.write(self._unknown_fields)
             return stream.getvalue()
@@ -845,16 +1777,18 @@ class Message(ABC):
 
     @classmethod
     def _type_hints(cls) -> dict[str, type]:
+        # The generated code lists the types of the fields, which is much faster than resolving the annotations
+        field_types = cls.__dict__.get("_aristaproto_field_types")
+        if field_types is not None:
+            return field_types.__func__()
+
         module = sys.modules[cls.__module__]
         return get_type_hints(cls, module.__dict__, {})
 
     @classmethod
     def _cls_for(cls, field: dataclasses.Field, index: int = 0) -> type:
         """Get the message class for a field from the type hints."""
-        field_cls = cls._type_hint(field.name)
-        if hasattr(field_cls, "__args__") and index >= 0 and field_cls.__args__ is not None:
-            field_cls = field_cls.__args__[index]
-        return field_cls
+        return _cls_from_type_hint(cls._type_hint(field.name), index)
 
     def _get_field_default(self, field_name: str) -> Any:
         with warnings.catch_warnings():
@@ -862,48 +1796,13 @@ class Message(ABC):
             warnings.filterwarnings("ignore", category=DeprecationWarning)
             return self._aristaproto.default_gen[field_name]()
 
-    def _postprocess_single(self, wire_type: int, meta: FieldMetadata, field_name: str, value: Any) -> Any:
+    def _postprocess_single(
+        self, wire_type: int, meta: FieldMetadata, field_name: str, value: Any, zero_copy: bool = False
+    ) -> Any:
         """Adjusts values after parsing."""
-        if wire_type == WIRE_VARINT:
-            if meta.proto_type in (TYPE_INT32, TYPE_INT64, TYPE_ENUM):
-                bits = 32 if meta.proto_type == TYPE_INT32 else 64
-                value = value & ((1 << bits) - 1)
-                signbit = 1 << (bits - 1)
-                value = int((value ^ signbit) - signbit)
-
-                if meta.proto_type == TYPE_ENUM:
-                    # Convert enum ints to python enum instances
-                    value = self._aristaproto.cls_by_field[field_name](value)
-            elif meta.proto_type in (TYPE_UINT32, TYPE_UINT64):
-                bits = 32 if meta.proto_type == TYPE_UINT32 else 64
-                value = value & ((1 << bits) - 1)
-            elif meta.proto_type in (TYPE_SINT32, TYPE_SINT64):
-                bits = 32 if meta.proto_type == TYPE_SINT32 else 64
-                value = value & ((1 << bits) - 1)
-                value = (value >> 1) ^ (-(value & 1))  # Undo zig-zag encoding
-            elif meta.proto_type == TYPE_BOOL:
-                # Booleans use a varint encoding, so convert it to true/false.
-                value = value > 0
-        elif wire_type in (WIRE_FIXED_32, WIRE_FIXED_64):
-            fmt = _pack_fmt(meta.proto_type)
-            value = struct.unpack(fmt, value)[0]
-        elif wire_type == WIRE_LEN_DELIM:
-            if meta.proto_type == TYPE_STRING:
-                value = str(value, "utf-8")
-            elif meta.proto_type == TYPE_MESSAGE:
-                if meta.unwrap:
-                    msg_cls = meta.unwrap()
-                else:
-                    msg_cls = self._aristaproto.cls_by_field[field_name]
-
-                value = msg_cls.parse(value)
-
-                if meta.unwrap:
-                    value = value.to_wrapped()
-            elif meta.proto_type == TYPE_MAP:
-                value = self._aristaproto.cls_by_field[field_name].parse(value)
-
-        return value
+        return _decode_single(
+            wire_type, meta.proto_type, value, self._aristaproto.cls_by_field[field_name], meta.unwrap, zero_copy
+        )
 
     def load(
         self: T,
@@ -932,10 +1831,17 @@ class Message(ABC):
         if size == SIZE_DELIMITED:
             size, _ = load_varint(stream)
 
+        return self._load_fields(load_fields(stream), size)
+
+    def _load_fields(self: T, fields: Iterable[ParsedField], size: int | None = None, zero_copy: bool = False) -> T:
+        """
+        Load the parsed fields into this message instance, stopping after ``size`` bytes if it is given.
+        """
         # Got some data over the wire
         proto_meta = self._aristaproto
+        intern_strings = self._aristaproto_intern_strings
         read = 0
-        for parsed in load_fields(stream):
+        for parsed in fields:
             field_name = proto_meta.field_name_by_number.get(parsed.number)
             if not field_name:
                 self._unknown_fields += parsed.raw
@@ -946,30 +1852,21 @@ class Message(ABC):
             is_packed_repeated = parsed.wire_type == WIRE_LEN_DELIM and meta.proto_type in PACKED_TYPES
 
             value: Any
-            if is_packed_repeated:
-                # This is a packed repeated field.
-                pos = 0
-                value = []
-                while pos < len(parsed.value):
-                    if meta.proto_type in (TYPE_FLOAT, TYPE_FIXED32, TYPE_SFIXED32):
-                        decoded, pos = parsed.value[pos : pos + 4], pos + 4
-                        wire_type = WIRE_FIXED_32
-                    elif meta.proto_type in (TYPE_DOUBLE, TYPE_FIXED64, TYPE_SFIXED64):
-                        decoded, pos = parsed.value[pos : pos + 8], pos + 8
-                        wire_type = WIRE_FIXED_64
-                    else:
-                        decoded, pos = decode_varint(parsed.value, pos)
-                        wire_type = WIRE_VARINT
-                    decoded = self._postprocess_single(wire_type, meta, field_name, decoded)
-                    value.append(decoded)
+            if meta.proto_type == TYPE_MAP:
+                value = proto_meta.map_codecs[field_name].decode(parsed.value, intern_strings or meta.intern, zero_copy)
+            elif is_packed_repeated:
+                value = _decode_packed(parsed.value, meta.proto_type, proto_meta.cls_by_field[field_name])
             else:
-                value = self._postprocess_single(parsed.wire_type, meta, field_name, parsed.value)
+                value = self._postprocess_single(parsed.wire_type, meta, field_name, parsed.value, zero_copy)
+                if meta.proto_type == TYPE_STRING and (intern_strings or meta.intern):
+                    value = default_intern_table(value)
 
             current = getattr(self, field_name)
 
             if meta.proto_type == TYPE_MAP:
                 # Value represents a single key/value pair entry in the map.
-                current[value.key] = value.value
+                key, item = value
+                current[key] = item
             elif meta.repeated:
                 if is_packed_repeated:
                     current.extend(value)
@@ -998,13 +1895,16 @@ class Message(ABC):
                 " or the expected size may have been incorrect."
             )
 
+        if proto_meta.pending_deprecated_fields:
+            self._warn_deprecated_once()
+
         if self._is_pydantic():
             self._validate()
 
         return self
 
     @classmethod
-    def parse(cls, data: bytes) -> Self:
+    def parse(cls, data: bytes, *, zero_copy: bool = False) -> Self:
         """
         Parse the binary encoded Protobuf into this message instance. This
         returns the instance itself and is therefore assignable and chainable.
@@ -1013,14 +1913,38 @@ class Message(ABC):
         -----------
         data: :class:`bytes`
             The data to parse the message from.
+        zero_copy: :class:`bool`
+            If ``True``, the ``bytes`` fields, including those of the nested messages, are read-only
+            :class:`memoryview` slices of ``data`` instead of copies. The slices keep ``data`` alive,
+            and a mutable ``data`` (e.g. a :class:`bytearray`) must not be modified while they are in use.
+            Not supported by the pydantic dataclasses, which only accept :class:`bytes` values.
 
         Returns
         --------
         :class:`Message`
             The initialized message.
         """
+        proto_meta = cls._aristaproto
+        if proto_meta.generated_decode is not None and not zero_copy:
+            msg = proto_meta.generated_decode(data if type(data) is bytes else bytes(data))
+            if proto_meta.pending_deprecated_fields:
+                msg._warn_deprecated_once()
+            return msg
+
+        if zero_copy:
+            msg = cls.construct()
+            if msg._is_pydantic():
+                raise TypeError("Zero-copy parsing is not available for pydantic dataclasses.")
+
+            view = memoryview(data)
+            if not view.readonly:
+                view = view.toreadonly()
+            if view.format != "B":
+                view = view.cast("B")
+            return msg._load_fields(parse_fields(view), zero_copy=True)
+
         with BytesIO(data) as stream:
-            return cls().load(stream)
+            return cls.construct().load(stream)
 
     # For compatibility with other libraries.
     @classmethod
@@ -1074,109 +1998,11 @@ class Message(ABC):
         if self._is_pydantic():
             self._validate()
 
-        kwargs = {  # For recursive calls
-            "output_format": output_format,
-            "casing": casing,
-            "include_default_values": include_default_values,
-        }
-
-        output: dict[str, Any] = {}
-        field_types = self._type_hints()
-
-        for field_name, meta in self._aristaproto.meta_by_field_name.items():
-            value = getattr(self, field_name)
-            cased_name = casing(field_name).rstrip("_")  # type: ignore
-
-            if meta.repeated or meta.optional:
-                field_type = field_types[field_name].__args__[0]
-            else:
-                field_type = field_types[field_name]
-
-            if meta.repeated:
-                output_value = [_value_to_dict(v, meta.proto_type, field_type, meta.unwrap, **kwargs)[0] for v in value]
-                if output_value or include_default_values:
-                    output[cased_name] = output_value
-
-            elif meta.proto_type == TYPE_MAP:
-                assert meta.map_meta is not None
-                field_type_k = field_types[field_name].__args__[0]
-                field_type_v = field_types[field_name].__args__[1]
-                output_map = {
-                    _value_to_dict(k, meta.map_meta[0].proto_type, field_type_k, None, **kwargs)[0]: _value_to_dict(
-                        v, meta.map_meta[1].proto_type, field_type_v, meta.map_meta[1].unwrap, **kwargs
-                    )[0]
-                    for k, v in value.items()
-                }
-
-                if output_map or include_default_values:
-                    output[cased_name] = output_map
-
-            else:
-                if value is None:
-                    output_value, is_default = None, True
-                else:
-                    output_value, is_default = _value_to_dict(value, meta.proto_type, field_type, meta.unwrap, **kwargs)
-                    if meta.optional:
-                        is_default = False
-
-                if include_default_values or not is_default:
-                    output[cased_name] = output_value
-
-        return output
+        return _ToDictConverter.of(type(self), output_format, casing, include_default_values)(self)
 
     @classmethod
     def _from_dict_init(cls, mapping: Mapping[str, Any] | Any, *, ignore_unknown_fields: bool) -> Mapping[str, Any]:
-        init_kwargs: dict[str, Any] = {}
-        for key, value in mapping.items():
-            field_name = safe_snake_case(key)
-
-            try:
-                field_cls = cls._aristaproto.cls_by_field[field_name]
-                meta = cls._aristaproto.meta_by_field_name[field_name]
-            except KeyError:
-                # According to the protobuf spec (https://protobuf.dev/programming-guides/json/): "The protobuf JSON
-                # parser should reject unknown fields by default but may provide an option to ignore unknown fields in
-                # parsing."
-                if ignore_unknown_fields:
-                    continue
-
-                raise KeyError(f"Unknown field '{field_name}' in message {cls.__name__}.") from None
-
-            if value is None:
-                name, module = field_cls.__name__, field_cls.__module__
-
-                # Edge case: None shouldn't be ignored for google.protobuf.Value
-                # See https://protobuf.dev/programming-guides/json/
-                if not (module.endswith("google.protobuf") and name == "Value"):
-                    continue
-
-            if meta.proto_type == TYPE_MESSAGE:
-                if meta.repeated:
-                    value = [_value_from_dict(item, meta, field_cls, ignore_unknown_fields) for item in value]
-                else:
-                    value = _value_from_dict(value, meta, field_cls, ignore_unknown_fields)
-
-            elif meta.proto_type == TYPE_MAP:
-                assert meta.map_meta
-                assert isinstance(value, dict)
-
-                value_cls = cls._aristaproto.cls_by_field[f"{field_name}.value"]
-
-                value = {
-                    _value_from_dict(k, meta.map_meta[0], type(None), ignore_unknown_fields): _value_from_dict(
-                        v, meta.map_meta[1], value_cls, ignore_unknown_fields
-                    )
-                    for k, v in value.items()
-                }
-
-            elif meta.repeated:
-                value = [_value_from_dict(item, meta, field_cls, ignore_unknown_fields) for item in value]
-
-            else:
-                value = _value_from_dict(value, meta, field_cls, ignore_unknown_fields)
-
-            init_kwargs[field_name] = value
-        return init_kwargs
+        return _FromDictConverter.of(cls, ignore_unknown_fields)(mapping)
 
     @classmethod
     def from_dict(cls: type[Self], value: Mapping[str, Any] | Any, *, ignore_unknown_fields: bool = False) -> Self:
@@ -1196,13 +2022,21 @@ class Message(ABC):
         if not isinstance(value, Mapping) and hasattr(cls, "from_wrapped"):  # type: ignore
             return cls.from_wrapped(value)  # type: ignore
 
-        return cls(**cls._from_dict_init(value, ignore_unknown_fields=ignore_unknown_fields))  # type: ignore
+        init_kwargs = cls._from_dict_init(value, ignore_unknown_fields=ignore_unknown_fields)
+
+        if pydantic is not None and pydantic.dataclasses.is_pydantic_dataclass(cls):
+            # The pydantic initializer validates and coerces the values
+            return cls(**init_kwargs)
+
+        return cls.construct(**init_kwargs)
 
     def to_json(
         self,
         indent: None | int | str = None,
         include_default_values: bool = False,
         casing: Casing = Casing.CAMEL,
+        *,
+        json_backend: JsonBackend | None = None,
     ) -> str:
         """A helper function to parse the message instance into its JSON
         representation.
@@ -1225,18 +2059,174 @@ class Message(ABC):
             The casing to use for key values. Default is :attr:`Casing.CAMEL` for
             compatibility purposes.
 
+        json_backend: Optional[:class:`JsonBackend`]
+            The JSON backend used to encode the message. Default is the backend set with
+            :func:`set_json_backend`, or the :mod:`json` module.
+
         Returns
         --------
         :class:`str`
             The JSON representation of the message.
         """
-        return json.dumps(
+        return (json_backend or get_json_backend()).encode(
             self.to_dict(include_default_values=include_default_values, casing=casing),
             indent=indent,
         )
 
+    def iter_json(self, *, include_default_values: bool = False, casing: Casing = Casing.CAMEL) -> Iterator[str]:
+        """
+        Encode the message instance to JSON, chunk by chunk.
+
+        The chunks are encoded directly from the message, without building the intermediate dict of
+        :meth:`to_dict`. Joining them gives the same output as :meth:`to_json` without ``indent``.
+
+        Parameters
+        -----------
+        include_default_values: :class:`bool`
+            If ``True`` will include the default values of fields. Default is ``False``.
+            E.g. an ``int32`` field will be included with a value of ``0`` if this is
+            set to ``True``, otherwise this would be ignored.
+
+        casing: :class:`Casing`
+            The casing to use for key values. Default is :attr:`Casing.CAMEL` for
+            compatibility purposes.
+
+        Returns
+        --------
+        Iterator[:class:`str`]
+            The chunks of the JSON representation of the message.
+        """
+        if self._is_pydantic():
+            self._validate()
+
+        kwargs = {  # For recursive calls
+            "casing": casing,
+            "include_default_values": include_default_values,
+        }
+
+        # The chunks of the scalar values are gathered, and only yielded when a nested message is encoded
+        chunks = ["{"]
+        separator = ""
+        field_types = self._aristaproto.type_hints
+        values = self.__dict__
+
+        for field_name, meta in self._aristaproto.meta_by_field_name.items():
+            value = values.get(field_name)
+
+            if meta.repeated or meta.optional:
+                field_type = field_types[field_name].__args__[0]
+            else:
+                field_type = field_types[field_name]
+
+            if meta.repeated:
+                if not value and not include_default_values:
+                    continue
+                items: Iterable[tuple[str | None, Any]] = ((None, v) for v in value or ())
+                value_meta = meta
+                opening, closing = "[", "]"
+
+            elif meta.proto_type == TYPE_MAP:
+                if not value and not include_default_values:
+                    continue
+                assert meta.map_meta is not None
+                field_type_k = field_types[field_name].__args__[0]
+                field_type = field_types[field_name].__args__[1]
+                items = (
+                    (
+                        _encode_json_key(
+                            _value_to_dict(
+                                k, meta.map_meta[0].proto_type, field_type_k, None, OutputFormat.PROTO_JSON, **kwargs
+                            )[0]
+                        ),
+                        v,
+                    )
+                    for k, v in (value or {}).items()
+                )
+                value_meta = meta.map_meta[1]
+                opening, closing = "{", "}"
+
+            else:
+                if value is None:
+                    if not include_default_values:
+                        continue
+                    output_value = "null"
+                elif meta.proto_type == TYPE_MESSAGE:
+                    output_value = None
+                else:
+                    dict_value, is_default = _value_to_dict(
+                        value, meta.proto_type, field_type, meta.unwrap, OutputFormat.PROTO_JSON, **kwargs
+                    )
+                    if is_default and not meta.optional and not include_default_values:
+                        continue
+                    output_value = _encode_json(dict_value)
+
+                chunks.append(separator)
+                separator = ", "
+                chunks.append(encode_basestring_ascii(casing(field_name).rstrip("_")))
+                chunks.append(": ")
+                if output_value is not None:
+                    chunks.append(output_value)
+                else:
+                    yield "".join(chunks)
+                    chunks.clear()
+                    yield from _iter_value_json(value, meta.proto_type, field_type, meta.unwrap, **kwargs)
+                continue
+
+            chunks.append(separator)
+            separator = ", "
+            chunks.append(encode_basestring_ascii(casing(field_name).rstrip("_")))
+            chunks.append(": ")
+            chunks.append(opening)
+            for i, (key, item) in enumerate(items):
+                if i:
+                    chunks.append(", ")
+                if key is not None:
+                    chunks.append(key)
+                    chunks.append(": ")
+                if value_meta.proto_type == TYPE_MESSAGE:
+                    # The nested messages are streamed, like the singular ones
+                    yield "".join(chunks)
+                    chunks.clear()
+                    yield from _iter_value_json(item, value_meta.proto_type, field_type, value_meta.unwrap, **kwargs)
+                else:
+                    chunks.extend(
+                        _iter_value_json(item, value_meta.proto_type, field_type, value_meta.unwrap, **kwargs)
+                    )
+            chunks.append(closing)
+
+        chunks.append("}")
+        yield "".join(chunks)
+
+    def write_json(
+        self, fp: SupportsWrite[str], *, include_default_values: bool = False, casing: Casing = Casing.CAMEL
+    ) -> None:
+        """
+        Write the JSON representation of the message instance to a text stream.
+
+        The message is encoded with :meth:`iter_json` as it is written, without building the whole
+        representation in memory.
+
+        Parameters
+        -----------
+        fp: :class:`SupportsWrite[str]`
+            The text stream to write the message to.
+
+        include_default_values: :class:`bool`
+            If ``True`` will include the default values of fields. Default is ``False``.
+            E.g. an ``int32`` field will be included with a value of ``0`` if this is
+            set to ``True``, otherwise this would be ignored.
+
+        casing: :class:`Casing`
+            The casing to use for key values. Default is :attr:`Casing.CAMEL` for
+            compatibility purposes.
+        """
+        for chunk in self.iter_json(include_default_values=include_default_values, casing=casing):
+            fp.write(chunk)
+
     @classmethod
-    def from_json(cls, value: str | bytes, *, ignore_unknown_fields: bool = False) -> Self:
+    def from_json(
+        cls, value: str | bytes, *, ignore_unknown_fields: bool = False, json_backend: JsonBackend | None = None
+    ) -> Self:
         """A helper function to return the message instance from its JSON
         representation. This returns the instance itself and is therefore assignable
         and chainable.
@@ -1250,12 +2240,18 @@ class Message(ABC):
         value: Union[:class:`str`, :class:`bytes`]
             The value to pass to :func:`json.loads`.
 
+        json_backend: Optional[:class:`JsonBackend`]
+            The JSON backend used to decode the value. Default is the backend set with
+            :func:`set_json_backend`, or the :mod:`json` module.
+
         Returns
         --------
         :class:`Message`
             The initialized message.
         """
-        return cls.from_dict(json.loads(value), ignore_unknown_fields=ignore_unknown_fields)
+        return cls.from_dict(
+            (json_backend or get_json_backend()).loads(value), ignore_unknown_fields=ignore_unknown_fields
+        )
 
     def is_set(self, name: str) -> bool:
         """
@@ -1271,7 +2267,9 @@ class Message(ABC):
         :class:`bool`
             `True` if field has been set, otherwise `False`.
         """
-        return self.__getattribute__(name) != self._get_field_default(name)
+        if name not in self._aristaproto.meta_by_field_name:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        return self._is_field_set(name)
 
     @classmethod
     def _validate_field_groups(cls, values):
@@ -1320,3 +2318,83 @@ def which_one_of(message: Message, group_name: str) -> tuple[str, Any | None]:
             field_name, value = field.name, v
 
     return field_name, value
+
+
+def set_string_interning(enabled: bool, message_type: type[Message] | None = None) -> None:
+    """
+    Enable or disable the interning of the strings decoded when parsing messages.
+
+    The interned strings are shared through a bounded table, which reduces the memory used by large amounts of parsed
+    messages repeating the same strings. Interning can also be enabled for specific messages and fields when compiling
+    with the ``intern_strings`` option.
+
+    Parameters
+    -----------
+    enabled: :class:`bool`
+        Whether the strings are interned.
+    message_type: :class:`Optional[Type[Message]]`
+        The message class to configure. All the messages are configured if ``None`` is given, unless they are configured
+        individually.
+    """
+    (message_type or Message)._aristaproto_intern_strings = enabled
+
+
+def warmup(target: MessagePool | ModuleType | str, *, freeze: bool = False) -> list[type[Message]]:
+    """
+    Prepare message classes ahead of their first use.
+
+    The metadata of a message class, and the converters used by `Message.to_dict` and `Message.from_dict` with their
+    default options, are otherwise built the first time the class is used. Warming up the classes at startup removes
+    the latency this adds to the first messages handled by a process.
+
+    In a server forking its workers, call this function in the parent process before forking so that all the workers
+    share the prepared classes. With ``freeze``, the objects that exist at that point are also moved out of the reach of
+    the garbage collector (see :func:`gc.freeze`), which keeps their memory pages shared with the workers instead of
+    being copied on write when the garbage collector visits them.
+
+    Parameters
+    -----------
+    target: Union[:class:`MessagePool`, :class:`types.ModuleType`, :class:`str`]
+        The classes to prepare. For a message pool, these are its registered messages, after importing the modules it
+        has indexed. For a module or a module name, these are the messages defined in the module, and in all its
+        submodules if it is a package.
+    freeze: :class:`bool`
+        Whether to call :func:`gc.freeze` once the classes are prepared.
+
+    Returns
+    --------
+    List[Type[:class:`Message`]]
+        The message classes that were prepared.
+    """
+    if isinstance(target, MessagePool):
+        target.import_modules()
+        classes = list(target.type_to_url)
+    else:
+        module = importlib.import_module(target) if isinstance(target, str) else target
+        modules = [module]
+        if hasattr(module, "__path__"):
+            modules.extend(
+                importlib.import_module(info.name)
+                for info in pkgutil.walk_packages(module.__path__, prefix=f"{module.__name__}.")
+            )
+
+        classes = [
+            value
+            for module in modules
+            for value in vars(module).values()
+            if isinstance(value, type)
+            and issubclass(value, Message)
+            and value.__module__ == module.__name__
+            and dataclasses.is_dataclass(value)
+        ]
+
+    for cls in classes:
+        cls._aristaproto
+        _ToDictConverter.of(cls, OutputFormat.PROTO_JSON, Casing.CAMEL, False)
+        _FromDictConverter.of(cls, False)
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
+
+    return classes
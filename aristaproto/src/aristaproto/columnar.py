@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from operator import attrgetter
+from typing import Any
+
+import numpy as np
+
+from aristaproto import (
+    PACKED_TYPES,
+    TYPE_BOOL,
+    TYPE_BYTES,
+    TYPE_DOUBLE,
+    TYPE_ENUM,
+    TYPE_FIXED32,
+    TYPE_FIXED64,
+    TYPE_FLOAT,
+    TYPE_INT32,
+    TYPE_INT64,
+    TYPE_SFIXED32,
+    TYPE_SFIXED64,
+    TYPE_SINT32,
+    TYPE_SINT64,
+    TYPE_STRING,
+    TYPE_UINT32,
+    TYPE_UINT64,
+    WIRE_LEN_DELIM,
+    FieldMetadata,
+    Message,
+    _decode_single,
+    parse_fields,
+)
+
+# The dtypes of the columns, by protobuf type
+_DTYPES: dict[str, np.dtype] = {
+    TYPE_BOOL: np.dtype(np.bool_),
+    TYPE_ENUM: np.dtype(np.int32),
+    TYPE_INT32: np.dtype(np.int32),
+    TYPE_SINT32: np.dtype(np.int32),
+    TYPE_SFIXED32: np.dtype(np.int32),
+    TYPE_UINT32: np.dtype(np.uint32),
+    TYPE_FIXED32: np.dtype(np.uint32),
+    TYPE_INT64: np.dtype(np.int64),
+    TYPE_SINT64: np.dtype(np.int64),
+    TYPE_SFIXED64: np.dtype(np.int64),
+    TYPE_UINT64: np.dtype(np.uint64),
+    TYPE_FIXED64: np.dtype(np.uint64),
+    TYPE_FLOAT: np.dtype(np.float32),
+    TYPE_DOUBLE: np.dtype(np.float64),
+    TYPE_STRING: np.dtype(object),
+    TYPE_BYTES: np.dtype(object),
+}
+
+# The fixed size values are little-endian on the wire
+_WIRE_DTYPES: dict[str, np.dtype] = {
+    TYPE_SFIXED32: np.dtype("<i4"),
+    TYPE_FIXED32: np.dtype("<u4"),
+    TYPE_SFIXED64: np.dtype("<i8"),
+    TYPE_FIXED64: np.dtype("<u8"),
+    TYPE_FLOAT: np.dtype("<f4"),
+    TYPE_DOUBLE: np.dtype("<f8"),
+}
+
+
+def _field_meta(message_type: type[Message], field_name: str) -> FieldMetadata:
+    try:
+        return message_type._aristaproto.meta_by_field_name[field_name]
+    except KeyError:
+        raise KeyError(f"Unknown field '{field_name}' in message {message_type.__name__}.") from None
+
+
+def _column_dtype(message_type: type[Message], field_name: str) -> np.dtype:
+    """Returns the dtype of the column of a field, which must be a singular scalar field."""
+    meta = _field_meta(message_type, field_name)
+    if meta.repeated or meta.proto_type not in _DTYPES:
+        raise ValueError(f"Field '{field_name}' of message {message_type.__name__} is not a singular scalar field.")
+
+    # The unset optional values are kept as None
+    return np.dtype(object) if meta.optional else _DTYPES[meta.proto_type]
+
+
+def _is_column(meta: FieldMetadata) -> bool:
+    return not meta.repeated and meta.proto_type in _DTYPES
+
+
+def to_columns(
+    messages: Sequence[Message], fields: Iterable[str] | None = None, *, message_type: type[Message] | None = None
+) -> dict[str, np.ndarray]:
+    """
+    Convert a sequence of messages to a NumPy array per field.
+
+    The numeric fields give arrays of the matching dtype (``int32``, ``uint64``, ``float32``, ...) and the enums give
+    arrays of their integer values. The strings, the bytes and the optional fields give object arrays, with ``None``
+    for the unset optional values.
+
+    Parameters
+    -----------
+    messages: Sequence[:class:`Message`]
+        The messages to convert, all of the same class.
+    fields: Optional[Iterable[:class:`str`]]
+        The names of the fields to convert, which must be singular scalar fields. All the singular scalar fields are
+        converted if ``None`` is given.
+    message_type: Optional[Type[:class:`Message`]]
+        The class of the messages. It is only required when the sequence of messages is empty.
+
+    Returns
+    --------
+    Dict[:class:`str`, :class:`numpy.ndarray`]
+        The arrays of the values of each field, by field name.
+    """
+    if message_type is None:
+        if not messages:
+            raise ValueError("The message type must be given to convert an empty sequence of messages.")
+        message_type = type(messages[0])
+
+    if fields is None:
+        fields = [
+            field_name for field_name, meta in message_type._aristaproto.meta_by_field_name.items() if _is_column(meta)
+        ]
+
+    columns = {}
+    for field_name in fields:
+        dtype = _column_dtype(message_type, field_name)
+        values = map(attrgetter(field_name), messages)
+        if dtype.hasobject:
+            column = np.empty(len(messages), dtype)
+            column[:] = list(values)
+        else:
+            column = np.fromiter(values, dtype, count=len(messages))
+        columns[field_name] = column
+
+    return columns
+
+
+def from_columns(message_type: type[Message], columns: Mapping[str, Any]) -> list[Message]:
+    """
+    Build messages from a NumPy array per field, the reverse of :func:`to_columns`.
+
+    The values are converted to the Python types of the fields. The messages are built with :meth:`Message.construct`,
+    so the fields that are not given are set to their default value.
+
+    Parameters
+    -----------
+    message_type: Type[:class:`Message`]
+        The class of the messages.
+    columns: Mapping[:class:`str`, :class:`numpy.ndarray`]
+        The arrays of the values of each field, by field name. They must all have the same length.
+
+    Returns
+    --------
+    List[:class:`Message`]
+        The messages, one per row of the columns.
+    """
+    field_names = list(columns)
+    rows = []
+    for field_name in field_names:
+        _column_dtype(message_type, field_name)
+        values = np.asarray(columns[field_name]).tolist()
+
+        if _field_meta(message_type, field_name).proto_type == TYPE_ENUM:
+            enum_cls = message_type._aristaproto.cls_by_field[field_name]
+            values = [None if value is None else enum_cls(value) for value in values]
+
+        rows.append(values)
+
+    if len({len(values) for values in rows}) > 1:
+        raise ValueError("The columns must all have the same length.")
+
+    return [message_type.construct(**dict(zip(field_names, row))) for row in zip(*rows)]
+
+
+def _decode_packed_array(data: bytes | memoryview, proto_type: str) -> np.ndarray:
+    """Decodes the items of a packed repeated field as an array."""
+    if proto_type in _WIRE_DTYPES:
+        # Fixed size values are read directly from the buffer
+        return np.frombuffer(data, _WIRE_DTYPES[proto_type]).astype(_DTYPES[proto_type], copy=False)
+
+    # Varints are decoded all at once: each one ends with the first byte which does not have its high bit set
+    raw = np.frombuffer(data, np.uint8)
+    ends = np.flatnonzero(raw < 0x80)
+    if not len(raw):
+        values = np.zeros(0, np.uint64)
+    elif not len(ends) or ends[-1] != len(raw) - 1:
+        raise ValueError("Truncated varint in packed field.")
+    else:
+        starts = np.zeros_like(ends)
+        starts[1:] = ends[:-1] + 1
+        shifts = (np.arange(len(raw)) - np.repeat(starts, ends - starts + 1)).astype(np.uint64) * np.uint64(7)
+        values = np.bitwise_or.reduceat((raw & 0x7F).astype(np.uint64) << shifts, starts)
+
+    if proto_type == TYPE_BOOL:
+        return values != 0
+    if proto_type in (TYPE_INT32, TYPE_ENUM):
+        return values.astype(np.uint32).view(np.int32)
+    if proto_type == TYPE_INT64:
+        return values.view(np.int64)
+    if proto_type == TYPE_UINT32:
+        return values.astype(np.uint32)
+    if proto_type == TYPE_SINT32:
+        values = values.astype(np.uint32)
+        return (values >> 1).astype(np.int32) ^ -(values & 1).astype(np.int32)  # Undo zig-zag encoding
+    if proto_type == TYPE_SINT64:
+        return (values >> np.uint64(1)).astype(np.int64) ^ -(values & np.uint64(1)).astype(np.int64)
+    return values
+
+
+def array_from_packed(message_type: type[Message], data: bytes, field_name: str) -> np.ndarray:
+    """
+    Read the values of a repeated numeric field from a binary encoded message, as a NumPy array.
+
+    The values are decoded straight from the wire, without parsing the message: the packed fixed size values are read
+    with :func:`numpy.frombuffer`, and the packed varints are decoded with vectorized operations. The dtypes are the
+    ones of :func:`to_columns`.
+
+    Parameters
+    -----------
+    message_type: Type[:class:`Message`]
+        The class of the encoded message.
+    data: :class:`bytes`
+        The binary encoded message.
+    field_name: :class:`str`
+        The name of the repeated numeric field.
+
+    Returns
+    --------
+    :class:`numpy.ndarray`
+        The values of the field.
+    """
+    meta = _field_meta(message_type, field_name)
+    if not meta.repeated or meta.proto_type not in PACKED_TYPES:
+        raise ValueError(f"Field '{field_name}' of message {message_type.__name__} is not a repeated numeric field.")
+
+    dtype = _DTYPES[meta.proto_type]
+    field_cls = message_type._aristaproto.cls_by_field[field_name]
+    parts = []
+    for parsed in parse_fields(memoryview(data)):
+        if parsed.number != meta.number:
+            continue
+
+        if parsed.wire_type == WIRE_LEN_DELIM:
+            parts.append(_decode_packed_array(parsed.value, meta.proto_type))
+        else:
+            # The values may also be written one by one
+            value = _decode_single(parsed.wire_type, meta.proto_type, parsed.value, field_cls, None)
+            parts.append(np.array([value], dtype))
+
+    if not parts:
+        return np.zeros(0, dtype)
+    if len(parts) == 1:
+        return parts[0]
+    return np.concatenate(parts)
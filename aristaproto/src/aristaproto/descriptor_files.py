@@ -0,0 +1,116 @@
+import importlib
+import threading
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from google.protobuf.descriptor import FileDescriptor
+    from google.protobuf.descriptor_pool import DescriptorPool
+
+
+class DescriptorFiles:
+    """
+    The serialized descriptors of the files generated with the `google_protobuf_descriptors` option.
+
+    The generated modules only record the serialized descriptors of their files when they are imported. Each file is
+    added to the descriptor pool of the protobuf library the first time its descriptor is requested, after the files
+    it depends on.
+
+    Parameters
+    -----------
+    pool: :class:`google.protobuf.descriptor_pool.DescriptorPool`
+        The pool to which the files are added.
+    """
+
+    def __init__(self, pool: "DescriptorPool") -> None:
+        self.pool = pool
+        self._serialized: dict[str, tuple[bytes, tuple[str, ...]]] = {}
+        self._modules: dict[str, str] = {}
+        self._descriptors: dict[str, FileDescriptor] = {}
+        self._lock = threading.Lock()
+
+    def index_modules(self, root_package: str, file_names: Mapping[str, Iterable[str]]) -> None:
+        """
+        Index the modules recording the serialized descriptors of the files, to import them when the files are
+        needed before the modules are imported.
+
+        Parameters
+        -----------
+        root_package: :class:`str`
+            The Python package containing the generated code, or an empty string if it is at the top level.
+        file_names: Mapping[:class:`str`, Iterable[:class:`str`]]
+            The names of the files, by protobuf package. The files of a protobuf package are recorded by the module of
+            the same name under the root package.
+        """
+        for package_name, names in file_names.items():
+            module = ".".join(part for part in (root_package, package_name) if part)
+            for name in names:
+                self._modules[name] = module
+
+    def add_serialized_file(self, name: str, serialized: bytes, dependencies: Iterable[str] = ()) -> None:
+        """
+        Record the serialized descriptor of a file, which is added to the pool on first use.
+
+        Parameters
+        -----------
+        name: :class:`str`
+            The name of the file.
+        serialized: :class:`bytes`
+            The serialized `FileDescriptorProto` of the file.
+        dependencies: Iterable[:class:`str`]
+            The names of the files imported by the file.
+        """
+        self._serialized.setdefault(name, (serialized, tuple(dependencies)))
+
+    def get(self, name: str) -> "FileDescriptor":
+        """
+        Return the descriptor of a file, after adding the file and its dependencies to the pool if they are not added
+        yet.
+
+        Parameters
+        -----------
+        name: :class:`str`
+            The name of the file.
+
+        Returns
+        --------
+        :class:`google.protobuf.descriptor.FileDescriptor`
+            The descriptor of the file.
+
+        Raises
+        -------
+        :class:`KeyError`
+            The file is neither recorded nor already in the pool.
+        """
+        try:
+            return self._descriptors[name]
+        except KeyError:
+            pass
+
+        # The module recording the file is imported outside of the lock, since the import system already serializes
+        # the imports and the module can add other files
+        if name not in self._serialized and name in self._modules:
+            importlib.import_module(self._modules[name])
+
+        serialized_file = self._serialized.get(name)
+        if serialized_file is None:
+            # A file that was not generated, such as one of the files shipped with the protobuf library
+            return self.pool.FindFileByName(name)
+
+        serialized, dependencies = serialized_file
+        for dependency in dependencies:
+            self.get(dependency)
+
+        with self._lock:
+            # The file may have been added by another thread in the meantime
+            if name not in self._descriptors:
+                self._descriptors[name] = self.pool.AddSerializedFile(serialized)
+            return self._descriptors[name]
+
+    def add_all(self) -> None:
+        """
+        Add all the recorded and indexed files to the pool, for the users of the pool that look up descriptors by
+        symbol, such as the reflection services.
+        """
+        for name in [*self._modules, *self._serialized]:
+            self.get(name)
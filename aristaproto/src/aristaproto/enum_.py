@@ -1,21 +1,163 @@
+import sys
+import threading
 from enum import EnumMeta, IntEnum
+from typing import Any
 
 from typing_extensions import Self
 
+# Maximum number of members created for the unknown values of each enum
+_MAX_UNKNOWN_MEMBERS = 256
+
+# Lock taken to create the members of the lazy enums
+_members_lock = threading.Lock()
+
+# The lazy members are created like the standard enum creation does, which depends on the enum internals of the
+# Python version. The members of the enums are created eagerly on the versions whose internals were not checked.
+_LAZY_MEMBERS_SUPPORTED = sys.version_info < (3, 15)
+
 
 class _EnumMeta(EnumMeta):
     def __new__(metacls, cls, bases, classdict):
+        # The members of the enums generated with the `lazy_enums` option are returned by a method, and only created
+        # when the enum is first used
+        members_method = classdict.get("_aristaproto_members")
+        members = members_method.__func__() if members_method is not None else None
+
+        if members is not None and not (_LAZY_MEMBERS_SUPPORTED and _can_create_lazily(members, bases, classdict)):
+            # These members have the name of another attribute of the enum, or the enum internals are unknown, which
+            # the standard enum creation handles
+            for name, value in members.items():
+                classdict[name] = value
+            members = None
+
         enum_class = super().__new__(metacls, cls, bases, classdict)
-        proto_names = enum_class.aristaproto_value_to_renamed_proto_names()  # type: ignore[reportAttributeAccessIssue]
+        enum_class._aristaproto_unknown_members = {}  # type: ignore[reportAttributeAccessIssue]
+        enum_class._aristaproto_pending_members = members  # type: ignore[reportAttributeAccessIssue]
 
-        # Attach extra info to each enum member
-        for member in enum_class:
-            value = member.value  # type: ignore[reportAttributeAccessIssue]
-            extra = proto_names.get(value)
-            member._proto_name = extra  # type: ignore[reportAttributeAccessIssue]
+        # The root class has no tables, which would otherwise hide the missing tables of the lazy enums
+        if members is None and any(isinstance(base, _EnumMeta) for base in bases):
+            _prepare_members(enum_class)
 
         return enum_class
 
+    def _aristaproto_create_members(cls) -> bool:
+        """
+        Create the members of a lazy enum, if they are not created yet.
+
+        Returns whether the members were created by this call.
+        """
+        if cls.__dict__.get("_aristaproto_pending_members") is None:
+            return False
+
+        with _members_lock:
+            members = cls.__dict__.get("_aristaproto_pending_members")
+            if members is None:
+                return False
+
+            # Same members as the ones created by the standard enum creation, without its per-member overhead
+            value_map, member_names = cls._value2member_map_, cls._member_names_
+            for name, value in members.items():
+                member = value_map.get(value)
+                if member is None:
+                    member = int.__new__(cls, value)
+                    member._name_ = name
+                    member._value_ = value
+                    member.__objclass__ = cls
+                    if sys.version_info >= (3, 11):
+                        member._sort_order_ = len(member_names)
+                    member_names.append(name)
+                    value_map[value] = member
+                # Names with an already used value are aliases of the first member with this value
+                _add_member(cls, name, member)
+
+            _prepare_members(cls)
+            type.__setattr__(cls, "_aristaproto_pending_members", None)
+            return True
+
+    # The entry points of the enums create the pending members first
+
+    def __getattr__(cls, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        if cls._aristaproto_create_members():
+            return getattr(cls, name)
+        try:
+            # Like the standard enums, for the members whose name is also the name of a descriptor
+            return cls._member_map_[name]
+        except KeyError:
+            raise AttributeError(f"type object {cls.__name__!r} has no attribute {name!r}") from None
+
+    def __call__(cls, *args, **kwargs):
+        cls._aristaproto_create_members()
+        return super().__call__(*args, **kwargs)
+
+    def __contains__(cls, value) -> bool:
+        cls._aristaproto_create_members()
+        return super().__contains__(value)
+
+    def __dir__(cls):
+        cls._aristaproto_create_members()
+        return super().__dir__()
+
+    def __getitem__(cls, name):
+        cls._aristaproto_create_members()
+        return super().__getitem__(name)
+
+    def __iter__(cls):
+        cls._aristaproto_create_members()
+        return super().__iter__()
+
+    def __len__(cls) -> int:
+        cls._aristaproto_create_members()
+        return super().__len__()
+
+    def __reversed__(cls):
+        cls._aristaproto_create_members()
+        return super().__reversed__()
+
+    @property
+    def __members__(cls):
+        cls._aristaproto_create_members()
+        return super().__members__
+
+
+if sys.version_info >= (3, 13):
+
+    def _add_member(enum_class, name: str, member) -> None:
+        enum_class._add_member_(name, member)
+
+else:
+
+    def _add_member(enum_class, name: str, member) -> None:
+        enum_class._member_map_[name] = member
+        type.__setattr__(enum_class, name, member)
+
+
+def _can_create_lazily(members: dict[str, int], bases: tuple[type, ...], classdict: dict[str, Any]) -> bool:
+    attributes = set(classdict).union(*(vars(base) for bases_class in bases for base in bases_class.__mro__))
+    return attributes.isdisjoint(members)
+
+
+def _prepare_members(enum_class) -> None:
+    # The member tables are used directly, since the entry points of a lazy enum wait for its members to be prepared
+    member_map = enum_class._member_map_
+    proto_names = enum_class.aristaproto_value_to_renamed_proto_names()
+
+    # Attach extra info to each enum member
+    for member in member_map.values():
+        value = member.value
+        extra = proto_names.get(value)
+        member._proto_name = extra
+
+    # Conversion tables of the JSON representation, built once since the generated methods return new dicts
+    enum_class._aristaproto_json_names = {
+        member.value: member.proto_name or member.name for member in member_map.values()
+    }
+    members_by_json_name = dict(member_map)
+    for proto_name, value in enum_class.aristaproto_renamed_proto_names_to_value().items():
+        members_by_json_name[proto_name] = enum_class._value2member_map_[value]
+    enum_class._aristaproto_members_by_json_name = members_by_json_name
+
 
 class Enum(IntEnum, metaclass=_EnumMeta):
     @property
@@ -30,16 +172,42 @@ class Enum(IntEnum, metaclass=_EnumMeta):
     def aristaproto_renamed_proto_names_to_value(cls) -> dict[str, int]:
         return {}
 
+    @classmethod
+    def _from_value(cls, value: int) -> Self:
+        """
+        Return the member for an integer value, without going through the enum constructor when the member is known
+        or cached.
+        """
+        try:
+            return cls._value2member_map_[value]  # type: ignore[reportReturnType]
+        except KeyError:
+            pass
+        if cls._aristaproto_create_members():  # type: ignore[reportAttributeAccessIssue]
+            return cls._from_value(value)
+        try:
+            return cls._aristaproto_unknown_members[value]  # type: ignore[reportAttributeAccessIssue]
+        except KeyError:
+            return cls(value)
+
     @classmethod
     def _missing_(cls, value):
         # If the given value is not an integer, let the standard enum implementation raise an error
         if not isinstance(value, int):
             return
 
-        # Create a new "unknown" instance with the given value.
+        try:
+            return cls._aristaproto_unknown_members[value]  # type: ignore[reportAttributeAccessIssue]
+        except KeyError:
+            pass
+
+        # Create a new "unknown" instance with the given value, which is reused for the next conversions as long as
+        # there is room in the cache.
         obj = int.__new__(cls, value)
         obj._value_ = value
         obj._name_ = ""
+        obj._proto_name = None
+        if len(cls._aristaproto_unknown_members) < _MAX_UNKNOWN_MEMBERS:  # type: ignore[reportAttributeAccessIssue]
+            cls._aristaproto_unknown_members[value] = obj  # type: ignore[reportAttributeAccessIssue]
         return obj
 
     def __str__(self):
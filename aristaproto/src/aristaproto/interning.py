@@ -0,0 +1,45 @@
+class InternTable:
+    """
+    Bounded table of the strings interned when parsing messages.
+
+    Parsed messages often repeat the same small set of strings (names, map keys, ...). When interning is enabled, equal
+    strings decoded from the wire share a single instance from this table instead of allocating a new one each time.
+
+    Once the table is full, the new strings are not interned anymore while the strings already in the table keep being
+    shared. Long strings are never interned since they are unlikely to be repeated.
+
+    Parameters
+    -----------
+    max_size: :class:`int`
+        The maximum number of strings kept in the table.
+    max_length: :class:`int`
+        The maximum length of the interned strings.
+    """
+
+    def __init__(self, max_size: int = 1 << 16, max_length: int = 128):
+        self.max_size = max_size
+        self.max_length = max_length
+        self._strings: dict[str, str] = {}
+
+    def __call__(self, value: str) -> str:
+        """
+        Returns the interned instance of a string, adding it to the table if there is still room.
+        """
+        try:
+            return self._strings[value]
+        except KeyError:
+            if len(self._strings) < self.max_size and len(value) <= self.max_length:
+                self._strings[value] = value
+            return value
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def clear(self) -> None:
+        """
+        Removes all the strings from the table.
+        """
+        self._strings.clear()
+
+
+default_intern_table = InternTable()
@@ -0,0 +1,71 @@
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class JsonBackend:
+    """
+    The functions used by `Message.to_json` and `Message.from_json` to encode and decode JSON.
+
+    Any `dumps`/`loads` pair can be used, such as the ones of `orjson` or `msgspec.json`, with a `dumps_indent` for
+    the libraries whose `dumps` doesn't take the `indent` argument of the `json` module. The encoded JSON can be
+    returned either as `str` or as UTF-8 `bytes`.
+
+    Parameters
+    -----------
+    dumps: Callable[[Any], Union[:class:`str`, :class:`bytes`]]
+        Encodes a value returned by `Message.to_dict` as JSON. When an indent is requested and `dumps_indent` is not
+        given, it is passed as the `indent` keyword argument, like with the `json` module.
+    loads: Callable[[Union[:class:`str`, :class:`bytes`]], Any]
+        Decodes JSON to the value passed to `Message.from_dict`.
+    dumps_indent: Optional[Callable[[Any, Union[:class:`int`, :class:`str`]], Union[:class:`str`, :class:`bytes`]]]
+        Encodes a value as indented JSON, for the libraries whose `dumps` has no `indent` argument. For instance,
+        ``lambda value, indent: orjson.dumps(value, option=orjson.OPT_INDENT_2)`` with `orjson`, which only supports
+        indenting with two spaces.
+    """
+
+    dumps: Callable[..., str | bytes]
+    loads: Callable[[str | bytes], Any]
+    dumps_indent: Callable[[Any, int | str], str | bytes] | None = None
+
+    def encode(self, value: Any, indent: None | int | str = None) -> str:
+        """
+        Encode a value as a JSON string.
+        """
+        if indent is None:
+            encoded = self.dumps(value)
+        elif self.dumps_indent is not None:
+            encoded = self.dumps_indent(value, indent)
+        else:
+            encoded = self.dumps(value, indent=indent)
+
+        if isinstance(encoded, bytes):
+            return encoded.decode("utf-8")
+        return encoded
+
+
+STDLIB_JSON_BACKEND = JsonBackend(dumps=json.dumps, loads=json.loads)
+
+_default_json_backend = STDLIB_JSON_BACKEND
+
+
+def get_json_backend() -> JsonBackend:
+    """
+    Returns the JSON backend used when none is given to `Message.to_json` and `Message.from_json`.
+    """
+    return _default_json_backend
+
+
+def set_json_backend(backend: JsonBackend | None) -> None:
+    """
+    Sets the JSON backend used when none is given to `Message.to_json` and `Message.from_json`.
+
+    Parameters
+    -----------
+    backend: Optional[:class:`JsonBackend`]
+        The new default backend. The `json` module of the standard library is used if ``None`` is given.
+    """
+    global _default_json_backend
+    _default_json_backend = backend or STDLIB_JSON_BACKEND
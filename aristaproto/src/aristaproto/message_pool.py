@@ -1,4 +1,8 @@
-from typing import TYPE_CHECKING
+import importlib
+import threading
+from collections.abc import Iterable, Mapping
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from aristaproto import Message
@@ -11,22 +15,105 @@ def get_type_url(package_name: str, message_name: str) -> str:
     return f"type.googleapis.com/{package_name}.{message_name}"
 
 
+class _TypesByUrl(dict):
+    """
+    The message types by type URL of a pool. The types that are not registered yet but whose module is known are
+    imported on first lookup, which registers them.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.modules: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def __missing__(self, url: str) -> "type[Message]":
+        module = self.modules.get(url)
+        if module is None:
+            raise KeyError(url)
+
+        # The import is done without the lock, since the import system already waits for the modules initialized by
+        # other threads, and the module may look up other types while it is initialized
+        importlib.import_module(module)
+
+        with self._lock:
+            # The module is only forgotten once it registered the type, so that a failed import is retried
+            message_type = dict.__getitem__(self, url)
+            self.modules.pop(url, None)
+            return message_type
+
+    def get(self, url: str, default: Any = None) -> Any:
+        try:
+            return self[url]
+        except KeyError:
+            return default
+
+    def __contains__(self, url: object) -> bool:
+        return dict.__contains__(self, url) or (url in self.modules and self.get(url) is not None)
+
+
 class MessagePool:
     """
     Keep track of all the messages that are registered in the application.
 
     This structure is needed for the `google.protobuf.Any` type to work.
+
+    The messages are registered when the module defining them is imported. The generated code also indexes the module
+    of each message, see `index_modules`, so that the modules that are not imported yet are imported when one of their
+    type URLs is looked up in `url_to_type`.
     """
 
     def __init__(self):
-        self.url_to_type: dict[str, type[Message]] = {}
+        self.url_to_type: dict[str, type[Message]] = _TypesByUrl()
         self.type_to_url: dict[type[Message], str] = {}
 
     def register_message(self, package_name: str, message_name: str, message_type: "type[Message]") -> None:
         url = get_type_url(package_name, message_name)
 
-        if url in self.url_to_type or message_type in self.type_to_url:
+        if dict.__contains__(self.url_to_type, url) or message_type in self.type_to_url:
             raise RuntimeError(f"the message {package_name}.{message_name} is already registered in the message pool")
 
         self.url_to_type[url] = message_type
         self.type_to_url[message_type] = url
+
+    def index_modules(
+        self,
+        root_package: str,
+        message_names: Mapping[str, Iterable[str]],
+        submodules: Mapping[str, Mapping[str, str]] | None = None,
+    ) -> None:
+        """
+        Index the modules defining the messages, to import them on demand.
+
+        Parameters
+        -----------
+        root_package: :class:`str`
+            The Python package containing the generated code, or an empty string if it is at the top level.
+        message_names: Mapping[:class:`str`, Iterable[:class:`str`]]
+            The names of the messages, by protobuf package. The messages of a protobuf package are defined in the
+            module of the same name under the root package.
+        submodules: Optional[Mapping[:class:`str`, Mapping[:class:`str`, :class:`str`]]]
+            The submodule of the package module defining each message, by protobuf package and message name, when
+            the code is generated with the `lazy_submodules` option.
+        """
+        modules = self.url_to_type.modules  # type: ignore[attr-defined]
+        for package_name, names in message_names.items():
+            module = ".".join(part for part in (root_package, package_name) if part)
+            package_submodules = submodules.get(package_name, {}) if submodules else {}
+            for message_name in names:
+                url = get_type_url(package_name, message_name)
+                if not dict.__contains__(self.url_to_type, url):
+                    submodule = package_submodules.get(message_name)
+                    modules[url] = ".".join(part for part in (module, submodule) if part)
+
+    def import_modules(self) -> None:
+        """
+        Import all the indexed modules whose messages are not registered yet, which registers their messages.
+        """
+        types_by_url = self.url_to_type
+        for url in list(types_by_url.modules):  # type: ignore[attr-defined]
+            types_by_url.get(url)
+
+
+# The pool given to the JSON conversion of a `google.protobuf.Any` message, which is also used by the `Any` messages
+# nested in its value.
+current_message_pool: ContextVar[MessagePool | None] = ContextVar("current_message_pool", default=None)
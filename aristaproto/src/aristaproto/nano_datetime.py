@@ -9,8 +9,19 @@ from typing_extensions import Self
 
 _UTC = datetime.timezone.utc
 _TIMESTAMP_ZERO = datetime.datetime(1970, 1, 1, tzinfo=_UTC)
+_EPOCH_ORDINAL = _TIMESTAMP_ZERO.toordinal()
 _NANOS_PER_MICROSECOND = 1000
 _MICROS_PER_SECOND = 10**6
+_NANOS_PER_SECOND = 10**9
+_SECONDS_PER_DAY = 24 * 60 * 60
+
+# Conversions between the dates and the number of days since the epoch. Timestamps are usually close to each other, so
+# the few dates in use are cached.
+_MAX_CACHED_DATES = 1024
+_date_prefix_by_day: dict[int, str] = {}
+_date_by_day: dict[int, tuple[int, int, int]] = {}
+_day_by_date: dict[str, int] = {}
+
 _TIMESTAMP_RE = re.compile(
     r"^"
     r"(?P<date>\d{4}-\d{2}-\d{2})"
@@ -85,51 +96,135 @@ class NanoDatetime(datetime.datetime):
             raise ValueError("datetime must be timezone aware")
 
         nanos = _datetime_total_nanoseconds(dt)
-        dt = dt.astimezone(_UTC)
+        offset = dt.utcoffset()
+        if offset is None or offset.microseconds:
+            dt = dt.astimezone(_UTC)
+            offset = datetime.timedelta(0)
 
-        offset = dt - _TIMESTAMP_ZERO
-        offset_us = (offset.days * 24 * 60 * 60 + offset.seconds) * _MICROS_PER_SECOND + offset.microseconds
-        seconds, _ = divmod(offset_us, _MICROS_PER_SECOND)
-        return seconds, nanos
+        day = dt.toordinal() - _EPOCH_ORDINAL
+        seconds = day * _SECONDS_PER_DAY + dt.hour * 3600 + dt.minute * 60 + dt.second
+        return seconds - offset.days * _SECONDS_PER_DAY - offset.seconds, nanos
 
     @staticmethod
     def from_timestamp(seconds: int, nanos: int) -> NanoDatetime:
+        extra_seconds, nanos = divmod(nanos, _NANOS_PER_SECOND)
+        day, second_of_day = divmod(seconds + extra_seconds, _SECONDS_PER_DAY)
+
+        try:
+            year, month, date_day = _date_by_day[day]
+        except KeyError:
+            try:
+                date = datetime.date.fromordinal(day + _EPOCH_ORDINAL)
+            except ValueError:
+                raise OverflowError("date value out of range") from None
+            if len(_date_by_day) >= _MAX_CACHED_DATES:
+                _date_by_day.clear()
+            year, month, date_day = _date_by_day[day] = (date.year, date.month, date.day)
+
+        hour, second_of_hour = divmod(second_of_day, 3600)
+        minute, second = divmod(second_of_hour, 60)
         micros, nanosecond_remainder = divmod(nanos, _NANOS_PER_MICROSECOND)
-        offset = datetime.timedelta(seconds=seconds, microseconds=micros)
-        dt = _TIMESTAMP_ZERO + offset
-        return _datetime_to_nano_datetime(dt, nanosecond_remainder)
+        return NanoDatetime(
+            year,
+            month,
+            date_day,
+            hour,
+            minute,
+            second,
+            micros,
+            tzinfo=_UTC,
+            nanosecond_remainder=nanosecond_remainder,
+        )
 
     @staticmethod
     def to_json(dt: datetime.datetime) -> str:
-        seconds, nanos = NanoDatetime.to_timestamp(dt)
-        dt = NanoDatetime.from_timestamp(seconds, nanos)
-        result = dt.replace(microsecond=0, nanosecond_remainder=0, tzinfo=None).isoformat()
+        return NanoDatetime.timestamp_to_rfc3339(*NanoDatetime.to_timestamp(dt))
 
-        if nanos == 0:
-            return f"{result}Z"
-        if nanos % 1_000_000 == 0:
-            return f"{result}.{nanos // 1_000_000:03d}Z"
-        if nanos % 1_000 == 0:
-            return f"{result}.{nanos // 1_000:06d}Z"
+    @staticmethod
+    def from_rfc3339(value: str) -> datetime.datetime:
+        timestamp = _parse_rfc3339(value)
+        if timestamp is not None:
+            return NanoDatetime.from_timestamp(*timestamp)
 
-        return f"{result}.{nanos:09d}Z"
+        dt = dateutil.parser.isoparse(value)
+        return dt.astimezone(_UTC)
 
     @staticmethod
-    def from_rfc3339(value: str) -> datetime.datetime:
-        match = _TIMESTAMP_RE.match(value)
-        if match:
-            tz = "+00:00" if match.group("tz") == "Z" else match.group("tz")
-            dt = datetime.datetime.fromisoformat(f"{match.group('date')}T{match.group('time')}{tz}")
+    def timestamp_to_rfc3339(seconds: int, nanos: int) -> str:
+        """
+        Format a timestamp, given as seconds and nanoseconds since the epoch, as RFC 3339 text in UTC.
+
+        The fraction of second uses 0, 3, 6 or 9 digits, as required by the JSON representation of
+        ``google.protobuf.Timestamp``.
+        """
+        extra_seconds, nanos = divmod(nanos, _NANOS_PER_SECOND)
+        day, second_of_day = divmod(seconds + extra_seconds, _SECONDS_PER_DAY)
+
+        try:
+            prefix = _date_prefix_by_day[day]
+        except KeyError:
+            if len(_date_prefix_by_day) >= _MAX_CACHED_DATES:
+                _date_prefix_by_day.clear()
+            prefix = _date_prefix_by_day[day] = f"{datetime.date.fromordinal(day + _EPOCH_ORDINAL).isoformat()}T"
+
+        hour, second_of_hour = divmod(second_of_day, 3600)
+        minute, second = divmod(second_of_hour, 60)
 
-            fraction = (match.group("fraction") or "").ljust(9, "0")
-            total_nanos = int(fraction) if fraction else 0
-            micros, nanosecond_remainder = divmod(total_nanos, _NANOS_PER_MICROSECOND)
+        if nanos == 0:
+            return f"{prefix}{hour:02d}:{minute:02d}:{second:02d}Z"
+        if nanos % 1_000_000 == 0:
+            return f"{prefix}{hour:02d}:{minute:02d}:{second:02d}.{nanos // 1_000_000:03d}Z"
+        if nanos % 1_000 == 0:
+            return f"{prefix}{hour:02d}:{minute:02d}:{second:02d}.{nanos // 1_000:06d}Z"
 
-            dt = dt.replace(microsecond=micros).astimezone(_UTC)
-            return _datetime_to_nano_datetime(dt, nanosecond_remainder)
+        return f"{prefix}{hour:02d}:{minute:02d}:{second:02d}.{nanos:09d}Z"
 
-        dt = dateutil.parser.isoparse(value)
-        return dt.astimezone(_UTC)
+    @staticmethod
+    def rfc3339_to_timestamp(value: str) -> tuple[int, int]:
+        """
+        Parse RFC 3339 text to a timestamp, as seconds and nanoseconds since the epoch.
+        """
+        timestamp = _parse_rfc3339(value)
+        if timestamp is not None:
+            return timestamp
+
+        return NanoDatetime.to_timestamp(dateutil.parser.isoparse(value).astimezone(_UTC))
+
+
+def _parse_rfc3339(value: str) -> tuple[int, int] | None:
+    """
+    Parse the usual form of RFC 3339 text to seconds and nanoseconds since the epoch, or returns ``None`` if the text
+    has another form.
+    """
+    match = _TIMESTAMP_RE.match(value)
+    if match is None:
+        return None
+
+    date, time, fraction, tz = match.groups()
+
+    try:
+        day = _day_by_date[date]
+    except KeyError:
+        if len(_day_by_date) >= _MAX_CACHED_DATES:
+            _day_by_date.clear()
+        day = _day_by_date[date] = datetime.date.fromisoformat(date).toordinal() - _EPOCH_ORDINAL
+
+    hour, minute, second = int(time[0:2]), int(time[3:5]), int(time[6:8])
+    if second == 60 and minute == 59:
+        # A leap second, which the timestamps of protobuf can't represent, is clamped to the previous second
+        second = 59
+    if hour > 23 or minute > 59 or second > 59:
+        raise ValueError(f"Invalid time in timestamp: {value}")
+
+    seconds = day * _SECONDS_PER_DAY + hour * 3600 + minute * 60 + second
+    if tz != "Z":
+        offset_hour, offset_minute = int(tz[1:3]), int(tz[4:6])
+        if offset_hour > 23 or offset_minute > 59:
+            raise ValueError(f"Invalid time zone offset in timestamp: {value}")
+        offset = offset_hour * 3600 + offset_minute * 60
+        seconds = seconds - offset if tz[0] == "+" else seconds + offset
+
+    return seconds, int(fraction.ljust(9, "0")) if fraction else 0
 
 
 def _datetime_nanosecond_remainder(dt: datetime.datetime) -> int:
@@ -0,0 +1,376 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from io import BytesIO
+from json.encoder import encode_basestring_ascii
+from typing import Any
+
+from aristaproto import (
+    _SKIP,
+    PACKED_TYPES,
+    TYPE_MAP,
+    TYPE_MESSAGE,
+    WIRE_FIXED_32,
+    WIRE_FIXED_64,
+    WIRE_LEN_DELIM,
+    WIRE_VARINT,
+    Casing,
+    FieldMetadata,
+    Message,
+    OutputFormat,
+    _compile_value_from_dict,
+    _compile_value_to_dict,
+    _decode_packed,
+    _decode_single,
+    _dump_field,
+    _encode_json,
+    _encode_json_key,
+    _FromDictConverter,
+    _MapEntryCodec,
+    _ToDictConverter,
+    decode_varint,
+)
+from aristaproto.json_backend import JsonBackend, get_json_backend
+
+
+def _value_cls(cls: type[Message], field_name: str, meta: FieldMetadata) -> tuple[type, bool]:
+    """
+    Returns the class of the values of a field, and whether they are messages transcoded field by field. The known
+    types and the wrapped values have their own JSON representation, so they go through their message class instead.
+    """
+    if meta.proto_type == TYPE_MAP:
+        assert meta.map_meta is not None
+        meta = meta.map_meta[1]
+        value_cls = cls._aristaproto.cls_by_field[f"{field_name}.value"]
+    else:
+        value_cls = cls._aristaproto.cls_by_field[field_name]
+
+    transcoded = (
+        meta.proto_type == TYPE_MESSAGE
+        and meta.unwrap is None
+        and value_cls.to_dict is Message.to_dict
+        and value_cls.from_dict.__func__ is Message.from_dict.__func__  # type: ignore
+    )
+    return value_cls, transcoded
+
+
+class _JsonWriter:
+    """
+    Writes the JSON representation of the binary encoded messages of a class, see `binary_to_json`.
+
+    The decoding and the conversion of each field are chosen once per class and per set of options.
+    """
+
+    __slots__ = ("options", "default_values", "decoders", "fields")
+
+    decoders: dict[int, tuple[str, FieldMetadata, type, bool, _MapEntryCodec | None]]
+    fields: list[tuple[str, str, Callable[[Any], Any], bool, type | None, Callable[[Any], Any] | None]]
+
+    def __init__(self, cls: type[Message], casing: Casing, include_default_values: bool):
+        self.options = (casing, include_default_values)
+        proto_meta = cls._aristaproto
+        self.default_values = proto_meta.default_values
+
+        self.decoders = {}
+        self.fields = []
+        converter = _ToDictConverter.of(cls, OutputFormat.PROTO_JSON, casing, include_default_values)
+        for (field_name, cased_name, convert), meta in zip(converter.fields, proto_meta.meta_by_field_name.values()):
+            value_cls, transcoded = _value_cls(cls, field_name, meta)
+            self.decoders[meta.number] = (
+                field_name,
+                meta,
+                proto_meta.cls_by_field[field_name],
+                transcoded,
+                proto_meta.map_codecs.get(field_name),
+            )
+
+            convert_key = None
+            if transcoded and meta.map_meta:
+                convert_key = _compile_value_to_dict(
+                    meta.map_meta[0].proto_type,
+                    proto_meta.type_hints[field_name].__args__[0],
+                    None,
+                    OutputFormat.PROTO_JSON,
+                    casing,
+                    include_default_values,
+                )
+
+            self.fields.append(
+                (
+                    field_name,
+                    f"{encode_basestring_ascii(cased_name)}: ",
+                    convert,
+                    meta.repeated,
+                    value_cls if transcoded else None,
+                    convert_key,
+                )
+            )
+
+    @classmethod
+    def of(cls, message_cls: type[Message], casing: Casing, include_default_values: bool) -> _JsonWriter:
+        """Returns the writer of a message class for the given options, compiling it on first use."""
+        options = (casing, include_default_values)
+        try:
+            return message_cls._aristaproto.json_writers[options]
+        except KeyError:
+            writer = message_cls._aristaproto.json_writers[options] = cls(message_cls, *options)
+            return writer
+
+    def _decode(self, data: bytes) -> dict[str, Any]:
+        """
+        Decodes the fields the same way `Message.load` does, except that the transcoded messages are kept as raw bytes.
+        """
+        values: dict[str, Any] = {}
+        decoders = self.decoders
+        pos = 0
+        end = len(data)
+        while pos < end:
+            num_wire, pos = decode_varint(data, pos)
+            wire_type = num_wire & 0x7
+
+            value: Any = None
+            if wire_type == WIRE_VARINT:
+                value, pos = decode_varint(data, pos)
+            elif wire_type == WIRE_LEN_DELIM:
+                length, pos = decode_varint(data, pos)
+                value, pos = data[pos : pos + length], pos + length
+            elif wire_type == WIRE_FIXED_64:
+                value, pos = data[pos : pos + 8], pos + 8
+            elif wire_type == WIRE_FIXED_32:
+                value, pos = data[pos : pos + 4], pos + 4
+
+            try:
+                field_name, meta, field_cls, transcoded, map_codec = decoders[num_wire >> 3]
+            except KeyError:
+                # Unknown fields are left out of the JSON representation
+                continue
+
+            if map_codec is not None:
+                key, item = map_codec.decode(value, raw_value=transcoded)
+                values.setdefault(field_name, {})[key] = item
+            elif wire_type == WIRE_LEN_DELIM and meta.proto_type in PACKED_TYPES:
+                values.setdefault(field_name, []).extend(_decode_packed(value, meta.proto_type, field_cls))
+            else:
+                if not transcoded:
+                    value = _decode_single(wire_type, meta.proto_type, value, field_cls, meta.unwrap)
+
+                if meta.repeated:
+                    values.setdefault(field_name, []).append(value)
+                else:
+                    values[field_name] = value
+
+        return values
+
+    def write(self, data: bytes, chunks: list[str]) -> None:
+        values = self._decode(data)
+        default_values = self.default_values
+
+        chunks.append("{")
+        separator = ""
+        for field_name, key, convert, repeated, value_cls, convert_key in self.fields:
+            if value_cls is None:
+                output_value = convert(values[field_name] if field_name in values else default_values.get(field_name))
+                if output_value is _SKIP:
+                    continue
+                chunks.append(separator)
+                separator = ", "
+                chunks.append(key)
+                chunks.append(_encode_json(output_value))
+                continue
+
+            # The containers of messages are only decoded when they have items
+            value = values.get(field_name)
+            if value is None and not self.options[1]:
+                continue
+
+            chunks.append(separator)
+            separator = ", "
+            chunks.append(key)
+            writer = _JsonWriter.of(value_cls, *self.options)
+            if repeated:
+                chunks.append("[")
+                for i, item in enumerate(value or ()):
+                    if i:
+                        chunks.append(", ")
+                    writer.write(item, chunks)
+                chunks.append("]")
+            elif convert_key is not None:
+                chunks.append("{")
+                for i, (map_key, item) in enumerate((value or {}).items()):
+                    if i:
+                        chunks.append(", ")
+                    chunks.append(_encode_json_key(convert_key(map_key)))
+                    chunks.append(": ")
+                    writer.write(item, chunks)
+                chunks.append("}")
+            elif value is None:
+                chunks.append("null")
+            else:
+                writer.write(value, chunks)
+
+        chunks.append("}")
+
+
+class _BinaryWriter:
+    """
+    Writes the binary encoded Protobuf representation of the decoded JSON of a class, see `json_to_binary`.
+
+    The conversion of each field is chosen once per class and per set of options.
+    """
+
+    __slots__ = ("ignore_unknown_fields", "converter", "nested", "fields")
+
+    nested: dict[str, tuple[type, bool, Callable[[Any], Any] | None]]
+    fields: list[tuple[str, FieldMetadata, bool, Any, _MapEntryCodec | None]]
+
+    def __init__(self, cls: type[Message], ignore_unknown_fields: bool):
+        self.ignore_unknown_fields = ignore_unknown_fields
+        self.converter = _FromDictConverter.of(cls, ignore_unknown_fields)
+        proto_meta = cls._aristaproto
+
+        self.nested = {}
+        self.fields = []
+        for field_name, meta in proto_meta.meta_by_field_name.items():
+            value_cls, transcoded = _value_cls(cls, field_name, meta)
+            if transcoded:
+                convert_key = None
+                if meta.map_meta:
+                    convert_key = _compile_value_from_dict(meta.map_meta[0], type(None), ignore_unknown_fields)
+                self.nested[field_name] = (value_cls, meta.repeated, convert_key)
+
+            self.fields.append(
+                (
+                    field_name,
+                    meta,
+                    meta.repeated or meta.proto_type == TYPE_MAP,
+                    proto_meta.default_values.get(field_name),
+                    proto_meta.map_codecs.get(field_name),
+                )
+            )
+
+    @classmethod
+    def of(cls, message_cls: type[Message], ignore_unknown_fields: bool) -> _BinaryWriter:
+        """Returns the writer of a message class, compiling it on first use."""
+        try:
+            return message_cls._aristaproto.binary_writers[ignore_unknown_fields]
+        except KeyError:
+            writer = message_cls._aristaproto.binary_writers[ignore_unknown_fields] = cls(
+                message_cls, ignore_unknown_fields
+            )
+            return writer
+
+    def write(self, mapping: dict[str, Any]) -> bytes:
+        values: dict[str, Any] = {}
+        converter = self.converter
+        for key, value in mapping.items():
+            try:
+                field_name, convert = converter.by_key[key]
+            except KeyError:
+                found = converter.lookup(key)
+                if found is None:
+                    continue
+                field_name, convert = found
+
+            try:
+                value_cls, repeated, convert_key = self.nested[field_name]
+            except KeyError:
+                value = convert(value)
+                if value is not _SKIP:
+                    values[field_name] = value
+                continue
+
+            if value is None:
+                continue
+
+            # The nested messages are encoded first, their bytes are then written as they are
+            writer = _BinaryWriter.of(value_cls, self.ignore_unknown_fields)
+            if repeated:
+                values[field_name] = [writer.write(item) for item in value]
+            elif convert_key is not None:
+                values[field_name] = {convert_key(k): writer.write(v) for k, v in value.items()}
+            else:
+                values[field_name] = writer.write(value)
+
+        with BytesIO() as stream:
+            for field_name, meta, is_container, default, map_codec in self.fields:
+                value = values.get(field_name)
+                if value is None:
+                    continue
+
+                # Default (zero) values and empty containers are not serialized
+                if is_container:
+                    if not value:
+                        continue
+                elif value == default:
+                    continue
+
+                _dump_field(meta, value, map_codec, stream)
+
+            return stream.getvalue()
+
+
+def binary_to_json(
+    cls: type[Message], data: bytes, *, include_default_values: bool = False, casing: Casing = Casing.CAMEL
+) -> str:
+    """
+    Convert the binary encoded Protobuf representation of a message to JSON.
+
+    The wire format is read using the field metadata of the message class, and the JSON is written directly from the
+    decoded values: neither the message instances nor the intermediate dicts of :meth:`Message.to_dict` are built.
+    The output is the same as ``cls.parse(data).to_json()``, except that pydantic messages are not validated.
+
+    Parameters
+    -----------
+    cls: Type[:class:`Message`]
+        The class of the encoded message.
+    data: :class:`bytes`
+        The binary encoded message.
+    include_default_values: :class:`bool`
+        If ``True`` will include the default values of fields. Default is ``False``.
+    casing: :class:`Casing`
+        The casing to use for key values. Default is :attr:`Casing.CAMEL` for
+        compatibility purposes.
+
+    Returns
+    --------
+    :class:`str`
+        The JSON representation of the message.
+    """
+    chunks: list[str] = []
+    _JsonWriter.of(cls, casing, include_default_values).write(data, chunks)
+    return "".join(chunks)
+
+
+def json_to_binary(
+    cls: type[Message],
+    data: str | bytes,
+    *,
+    ignore_unknown_fields: bool = False,
+    json_backend: JsonBackend | None = None,
+) -> bytes:
+    """
+    Convert the JSON representation of a message to its binary encoded Protobuf representation.
+
+    The decoded JSON is encoded field by field using the field metadata of the message class, without building the
+    message instances. The output is the same as ``bytes(cls.from_json(data))``, except that pydantic messages are not
+    validated.
+
+    Parameters
+    -----------
+    cls: Type[:class:`Message`]
+        The class of the encoded message.
+    data: Union[:class:`str`, :class:`bytes`]
+        The JSON representation of the message.
+    ignore_unknown_fields: :class:`bool`
+        If ``True``, the unknown keys are ignored instead of raising a :class:`KeyError`.
+    json_backend: Optional[:class:`JsonBackend`]
+        The backend used to decode the JSON. The default backend is used if ``None`` is given,
+        see :func:`set_json_backend`.
+
+    Returns
+    --------
+    :class:`bytes`
+        The binary encoded message.
+    """
+    mapping = (json_backend or get_json_backend()).loads(data)
+    return _BinaryWriter.of(cls, ignore_unknown_fields).write(mapping)
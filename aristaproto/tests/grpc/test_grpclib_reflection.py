@@ -23,6 +23,7 @@ async def test_grpclib_reflection(requires_grpclib, requires_protobuf):
         ServiceResponse,
     )
     from tests.outputs.grpclib_reflection_descriptors.google_proto_descriptor_pool import (
+        default_google_proto_descriptor_files,
         default_google_proto_descriptor_pool,
     )
 
@@ -79,9 +80,16 @@ async def test_grpclib_reflection(requires_grpclib, requires_protobuf):
         assert response.error_response == ErrorResponse(error_code=5, error_message="not found")
         assert response.file_descriptor_response is None
 
-        # now it should work
+        # importing the module only records its descriptors, which are added to the pool on first use
         import tests.outputs.grpclib_reflection_descriptors.example_service as example_service_with_desc
 
+        requests.put(ServerReflectionRequest(file_containing_symbol="example_service.Test"))
+        response = await anext(responses)
+        assert response.error_response == ErrorResponse(error_code=5, error_message="not found")
+
+        # now it should work
+        default_google_proto_descriptor_files.add_all()
+
         requests.put(ServerReflectionRequest(file_containing_symbol="example_service.Test"))
         response = await anext(responses)
         expected = descriptor_pb2.FileDescriptorProto.FromString(
@@ -23,3 +23,63 @@ def test_message_enum_descriptors(requires_protobuf):
     # will add them in as long as protobuf is depended on.
     assert TestWithDesc.DESCRIPTOR.full_name == "import_cousin_package_same_name.test.subpackage.Test"
     assert CousinMessage.DESCRIPTOR.full_name == "import_cousin_package_same_name.cousin.subpackage.CousinMessage"
+
+
+def test_descriptor_files_added_on_first_use(requires_protobuf):
+    from google.protobuf import descriptor_pb2, descriptor_pool
+
+    import aristaproto
+
+    interface = descriptor_pb2.FileDescriptorProto(name="interface.proto", package="example")
+    interface.message_type.add(name="Interface")
+    device = descriptor_pb2.FileDescriptorProto(name="device.proto", package="example", dependency=["interface.proto"])
+    device.message_type.add(name="Device")
+
+    pool = descriptor_pool.DescriptorPool()
+    files = aristaproto.DescriptorFiles(pool)
+    files.add_serialized_file("device.proto", device.SerializeToString(), device.dependency)
+    files.add_serialized_file("interface.proto", interface.SerializeToString())
+
+    with pytest.raises(KeyError):
+        pool.FindFileByName("device.proto")
+
+    # The dependencies are added first, and each file is added once
+    descriptor = files.get("device.proto")
+    assert descriptor.message_types_by_name["Device"].full_name == "example.Device"
+    assert pool.FindFileByName("interface.proto") is files.get("interface.proto")
+    assert files.get("device.proto") is descriptor
+
+    with pytest.raises(KeyError):
+        files.get("missing.proto")
+
+
+def test_generated_descriptors_added_on_first_use(requires_protobuf):
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    package = "tests.outputs.import_cousin_package_same_name_descriptors"
+    code = f"""
+from {package}.google_proto_descriptor_pool import default_google_proto_descriptor_pool as pool
+from {package}.import_cousin_package_same_name.test import subpackage
+
+def added(name):
+    try:
+        pool.FindFileByName(name)
+        return True
+    except KeyError:
+        return False
+
+print(added("test.proto"), added("cousin.proto"))
+print(subpackage.Test.DESCRIPTOR.full_name)
+print(added("test.proto"), added("cousin.proto"))
+print(subpackage.TEST_PROTO_DESCRIPTOR is subpackage.Test.DESCRIPTOR.file)
+"""
+    output = subprocess.check_output([sys.executable, "-c", code], cwd=Path(__file__).parents[2], text=True)
+
+    assert output.splitlines() == [
+        "False False",
+        "import_cousin_package_same_name.test.subpackage.Test",
+        "True True",
+        "True",
+    ]
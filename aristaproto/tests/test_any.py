@@ -1,3 +1,6 @@
+import pytest
+
+
 def test_any() -> None:
     from tests.outputs.any.any import Person
     from tests.outputs.any.google.protobuf import Any
@@ -42,3 +45,103 @@ def test_any_to_dict() -> None:
 
     assert Any.from_dict(any2.to_dict()) == any2
     assert Any.parse(bytes(any2)) == any2
+
+
+def test_any_unpack_is_cached() -> None:
+    from tests.outputs.any.any import Person
+    from tests.outputs.any.google.protobuf import Any
+
+    any = Any.parse(bytes(Any.pack(Person(first_name="John"))))
+
+    assert any.unpack() is any.unpack()
+    assert any.to_dict() == {"@type": "type.googleapis.com/any.Person", "firstName": "John"}
+
+    # The cache is invalidated when the value changes
+    unpacked = any.unpack()
+    any.value = bytes(Person(first_name="Jane"))
+    assert any.unpack() is not unpacked
+    assert any.unpack() == Person(first_name="Jane")
+
+
+def test_any_lazy_pack() -> None:
+    import copy
+
+    from tests.outputs.any.any import Person
+    from tests.outputs.any.google.protobuf import Any
+
+    person = Person(first_name="John")
+    any = Any.pack(person, lazy=True)
+
+    assert any.unpack() is person
+    assert any.to_dict() == {"@type": "type.googleapis.com/any.Person", "firstName": "John"}
+
+    # The message is encoded when the Any is serialized, including the changes made until then
+    person.last_name = "Smith"
+    assert Any.parse(bytes(any)) == Any.pack(Person(first_name="John", last_name="Smith"))
+    assert any.value == bytes(Person(first_name="John", last_name="Smith"))
+
+    # The message is encoded when the value is read, comparisons and copies
+    assert Any.pack(person, lazy=True).value == bytes(person)
+    assert Any.pack(person, lazy=True) == Any.pack(person)
+    assert copy.copy(Any.pack(person, lazy=True)).value == bytes(person)
+    assert copy.deepcopy(Any.pack(person, lazy=True)).value == bytes(person)
+
+    # Nested in another Any
+    assert Any.pack(Any.pack(person, lazy=True)).unpack() == Any.pack(person)
+
+    # The message is dropped when the value is set
+    any = Any.pack(person, lazy=True)
+    any.value = bytes(Person(first_name="Jane"))
+    assert any.unpack() == Person(first_name="Jane")
+    assert bytes(any) == bytes(Any.pack(Person(first_name="Jane")))
+
+
+def test_any_from_dict_is_encoded_lazily() -> None:
+    from tests.outputs.any.any import Person
+    from tests.outputs.any.google.protobuf import Any
+
+    any = Any.from_dict({"@type": "type.googleapis.com/any.Person", "firstName": "John"})
+
+    assert any.unpack() == Person(first_name="John")
+    assert any == Any.pack(Person(first_name="John"))
+    assert any.value == bytes(Person(first_name="John"))
+
+
+def test_any_message_pool() -> None:
+    import aristaproto
+    from tests.outputs.any.any import Person
+    from tests.outputs.any.google.protobuf import Any
+
+    pool = aristaproto.MessagePool()
+    pool.register_message("other", "Person", Person)
+
+    any = Any.from_dict({"@type": "type.googleapis.com/other.Person", "firstName": "John"}, message_pool=pool)
+
+    assert any.unpack() == Person(first_name="John")
+    assert Any.parse(bytes(any)).to_dict(message_pool=pool) == {
+        "@type": "type.googleapis.com/other.Person",
+        "firstName": "John",
+    }
+    with pytest.raises(TypeError):
+        Any.parse(bytes(any)).to_dict()
+
+
+def test_any_message_pool_nested() -> None:
+    import aristaproto
+    from tests.outputs.any.any import Person
+    from tests.outputs.any.google.protobuf import Any
+
+    pool = aristaproto.MessagePool()
+    pool.register_message("other", "Person", Person)
+    pool.register_message("google.protobuf", "Any", Any)
+
+    data = {
+        "@type": "type.googleapis.com/google.protobuf.Any",
+        "value": {"@type": "type.googleapis.com/other.Person", "firstName": "John"},
+    }
+
+    # The pool is used by the Any nested in the value
+    any = Any.from_dict(data, message_pool=pool)
+    assert Any.parse(bytes(any)).to_dict(message_pool=pool) == data
+    with pytest.raises(TypeError):
+        Any.parse(bytes(any)).to_dict()
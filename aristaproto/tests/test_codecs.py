@@ -0,0 +1,143 @@
+import pytest
+
+import aristaproto
+
+DOCUMENT = {
+    "optionalInt32": -5,
+    "optionalInt64": "-1234567890123",
+    "optionalUint32": 4000000000,
+    "optionalUint64": "18446744073709551615",
+    "optionalSint32": -17,
+    "optionalSint64": "-9223372036854775808",
+    "optionalFixed32": 7,
+    "optionalFixed64": "8",
+    "optionalSfixed32": -9,
+    "optionalSfixed64": "-10",
+    "optionalFloat": 1.5,
+    "optionalDouble": -2.25,
+    "optionalBool": True,
+    "optionalString": "tést",
+    "optionalBytes": "AAEC",
+    "optionalNestedMessage": {"a": 3, "corecursive": {"optionalInt32": 4}},
+    "optionalForeignMessage": {"c": 5},
+    "optionalNestedEnum": "BAR",
+    "recursiveMessage": {"optionalString": "nested", "repeatedInt32": [1, 2]},
+    "repeatedInt32": [1, -1, 0],
+    "repeatedSint64": ["-3", "3"],
+    "repeatedFixed32": [1, 2],
+    "repeatedDouble": [0.5, -0.5],
+    "repeatedBool": [True, False],
+    "repeatedString": ["a", "", "b"],
+    "repeatedBytes": ["", "AA=="],
+    "repeatedNestedMessage": [{"a": 1}, {}],
+    "repeatedNestedEnum": ["FOO", "NEG"],
+    "packedSfixed64": ["-1", "2"],
+    "unpackedInt64": ["5", "-6"],
+    "unpackedFloat": [2.5],
+    "mapInt32Int32": {"1": 2, "-3": 0},
+    "mapStringString": {"key": "value", "": ""},
+    "mapStringNestedMessage": {"x": {"a": 7}},
+    "mapStringForeignEnum": {"y": "FOREIGN_BAZ"},
+    "oneofString": "choice",
+    "optionalInt32Wrapper": 0,
+    "optionalStringWrapper": "wrapped",
+    "repeatedDoubleWrapper": [1.0, 0.0],
+    "optionalDuration": "-1.500s",
+    "optionalTimestamp": "2024-02-29T12:34:56.123456789Z",
+    "repeatedTimestamp": ["1970-01-01T00:00:00Z"],
+    "optionalStruct": {"a": [1, None, "b"]},
+    "optionalValue": {"x": True},
+    "optionalNullValue": "NULL_VALUE",
+}
+
+
+def test_generated_codecs():
+    from tests.outputs.conformance.protobuf_test_messages.proto3 import TestAllTypesProto3 as Generic
+    from tests.outputs.conformance_codecs.protobuf_test_messages.proto3 import TestAllTypesProto3 as Codecs
+
+    assert "_aristaproto_encode" not in vars(Generic)
+    assert Codecs._aristaproto.generated_encode is not None
+    assert Codecs._aristaproto.generated_decode is not None
+
+    generic = Generic.from_dict(DOCUMENT)
+    message = Codecs.from_dict(DOCUMENT)
+
+    # The name of this field is mangled
+    generic.__dict__["_TestAllTypesProto3__field_name13"] = message.__dict__["_TestAllTypesProto3__field_name13"] = 13
+
+    data = bytes(generic)
+    assert bytes(message) == data
+
+    parsed = Codecs.parse(data)
+    assert parsed == message
+    assert parsed.to_dict() == generic.to_dict()
+    assert bytes(parsed) == data
+
+
+def test_generated_codecs_packed_and_unknown_fields():
+    from tests.outputs.conformance.protobuf_test_messages.proto3 import TestAllTypesProto3 as Generic
+    from tests.outputs.conformance_codecs.protobuf_test_messages.proto3 import (
+        ForeignMessage,
+        TestAllTypesProto3 as Codecs,
+    )
+
+    # The repeated scalars are accepted in both the packed and the unpacked encodings
+    data = bytes(Generic(packed_int32=[1, -2, 3], unpacked_int32=[4, 5], packed_double=[0.5]))
+    assert Codecs.parse(data).to_dict() == Generic.parse(data).to_dict()
+
+    # The unknown fields are kept, whatever their wire type
+    unknown = bytes(Generic(optional_int64=1, optional_string="a", optional_fixed32=2, optional_double=3.0))
+    foreign = ForeignMessage.parse(unknown + b"\x08\x02")
+    assert foreign.c == 2
+    assert bytes(foreign) == b"\x08\x02" + unknown
+
+    # Bytearrays and memoryviews are parsed too
+    assert Codecs.parse(bytearray(data)) == Codecs.parse(memoryview(data)) == Codecs.parse(data)
+
+
+def test_generated_codecs_skipped():
+    from tests.outputs.conformance_codecs.protobuf_test_messages.proto3 import TestAllTypesProto3 as Codecs
+
+    data = bytes(Codecs(optional_bytes=b"chunk"))
+
+    # The zero-copy parsing uses the generic parser
+    assert isinstance(Codecs.parse(data, zero_copy=True).optional_bytes, memoryview)
+
+
+def test_generated_codecs_intern_strings(monkeypatch):
+    from tests.outputs.conformance_codecs.protobuf_test_messages.proto3 import TestAllTypesProto3 as Codecs
+
+    # The generic parser is not used for the messages whose strings are interned
+    monkeypatch.setattr(Codecs, "_load_fields", None)
+
+    data = bytes(Codecs(optional_string="eth1", repeated_string=["eth1"], map_string_string={"eth1": "eth1"}))
+    assert Codecs.parse(data).optional_string is not Codecs.parse(data).optional_string
+
+    aristaproto.set_string_interning(True, Codecs)
+    try:
+        first, second = Codecs.parse(data), Codecs.parse(data)
+        assert first.optional_string is second.optional_string
+        assert first.repeated_string[0] is first.optional_string
+        ((key, value),) = first.map_string_string.items()
+        assert key is value is first.optional_string
+    finally:
+        aristaproto.set_string_interning(False, Codecs)
+
+
+@pytest.mark.parametrize("package", ["googletypes", "map", "oneof", "repeatedpacked", "enum"])
+def test_generated_codecs_round_trip(package):
+    import importlib
+    import json
+    from pathlib import Path
+
+    generic_module = importlib.import_module(f"tests.outputs.{package}.{package}")
+    codecs_module = importlib.import_module(f"tests.outputs.{package}_codecs.{package}")
+
+    for path in sorted(Path(__file__).parent.joinpath("inputs", package).glob("*.json")):
+        document = json.loads(path.read_text())
+        generic = generic_module.Test.from_dict(document)
+        message = codecs_module.Test.from_dict(document)
+
+        data = bytes(generic)
+        assert bytes(message) == data
+        assert codecs_module.Test.parse(data).to_dict() == generic.to_dict()
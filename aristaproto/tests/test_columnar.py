@@ -0,0 +1,103 @@
+import pytest
+
+from tests.outputs.columnar.columnar import Kind, Sample, Series
+from tests.util import requires_numpy  # noqa: F401
+
+
+def test_to_columns(requires_numpy):
+    import numpy as np
+
+    from aristaproto.columnar import from_columns, to_columns
+
+    samples = [
+        Sample(name="a", value=1.5, ratio=0.5, timestamp=-(2**40), count=3, delta=-4, id=2**64 - 1, valid=True),
+        Sample(name="b", kind=Kind.COUNTER, payload=b"\x00\x01", limit=0, tags=["x"]),
+    ]
+
+    columns = to_columns(samples)
+    assert list(columns) == [
+        "name",
+        "value",
+        "ratio",
+        "timestamp",
+        "count",
+        "delta",
+        "id",
+        "valid",
+        "kind",
+        "payload",
+        "limit",
+    ]
+    assert columns["name"].dtype == object and columns["name"].tolist() == ["a", "b"]
+    assert columns["value"].dtype == np.float64 and columns["value"].tolist() == [1.5, 0.0]
+    assert columns["ratio"].dtype == np.float32
+    assert columns["timestamp"].dtype == np.int64 and columns["timestamp"].tolist() == [-(2**40), 0]
+    assert columns["count"].dtype == np.uint32
+    assert columns["delta"].dtype == np.int32 and columns["delta"].tolist() == [-4, 0]
+    assert columns["id"].dtype == np.uint64 and columns["id"].tolist() == [2**64 - 1, 0]
+    assert columns["valid"].dtype == np.bool_
+    assert columns["kind"].dtype == np.int32 and columns["kind"].tolist() == [0, 2]
+    assert columns["payload"].tolist() == [b"", b"\x00\x01"]
+    assert columns["limit"].dtype == object and columns["limit"].tolist() == [None, 0]
+
+    messages = from_columns(Sample, columns)
+    assert messages == [
+        Sample(name="a", value=1.5, ratio=0.5, timestamp=-(2**40), count=3, delta=-4, id=2**64 - 1, valid=True),
+        Sample(name="b", kind=Kind.COUNTER, payload=b"\x00\x01", limit=0),
+    ]
+    assert messages[1].kind is Kind.COUNTER
+
+    assert to_columns(samples, ["value"]).keys() == {"value"}
+    assert to_columns([], ["count"], message_type=Sample)["count"].dtype == np.uint32
+    with pytest.raises(ValueError):
+        to_columns(samples, ["tags"])
+    with pytest.raises(KeyError):
+        to_columns(samples, ["unknown"])
+    with pytest.raises(ValueError):
+        from_columns(Sample, {"value": np.zeros(2), "count": np.zeros(3, np.uint32)})
+
+
+def test_array_from_packed(requires_numpy):
+    import numpy as np
+
+    from aristaproto.columnar import array_from_packed
+
+    series = Series(
+        values=[1.5, -2.0],
+        ratios=[0.25],
+        counts=[1, -1, 300, -(2**31)],
+        deltas=[-1, 2**62, -(2**63)],
+        ids=[0, 2**64 - 1],
+        flags=[True, False, True],
+        kinds=[Kind.GAUGE, Kind.COUNTER],
+        codes=[2**32 - 1],
+        offsets=[-5],
+        small_deltas=[-(2**31), 2**31 - 1, 0],
+        big=[-1, 2**63 - 1],
+    )
+    data = bytes(series)
+
+    for field_name, dtype in [
+        ("values", np.float64),
+        ("ratios", np.float32),
+        ("counts", np.int32),
+        ("deltas", np.int64),
+        ("ids", np.uint64),
+        ("flags", np.bool_),
+        ("kinds", np.int32),
+        ("codes", np.uint32),
+        ("offsets", np.int64),
+        ("small_deltas", np.int32),
+        ("big", np.int64),
+    ]:
+        array = array_from_packed(Series, data, field_name)
+        assert array.dtype == dtype
+        assert array.tolist() == list(getattr(series, field_name))
+
+    # Fields split over several records, packed or not
+    data = bytes(Series(counts=[1, 2])) + b"\x20\x03" + bytes(Series(counts=[4]))
+    assert array_from_packed(Series, data, "counts").tolist() == [1, 2, 3, 4]
+
+    assert array_from_packed(Series, b"", "values").tolist() == []
+    with pytest.raises(ValueError):
+        array_from_packed(Series, data, "samples")
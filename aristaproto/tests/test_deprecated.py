@@ -5,6 +5,16 @@ import pytest
 from tests.util import requires_grpclib  # noqa: F401
 
 
+@pytest.fixture
+def reset_metadata():
+    from aristaproto import ProtoClassMetadata
+    from tests.outputs.deprecated.deprecated import Message, Test
+
+    # The decode path only warns once per class, make sure the warnings were not already emitted by another test
+    for cls in (Message, Test):
+        cls._aristaproto_meta = ProtoClassMetadata(cls)
+
+
 @pytest.fixture
 def message():
     from tests.outputs.deprecated.deprecated import Message
@@ -60,6 +70,25 @@ def test_message_with_deprecated_field_not_set_default(requires_grpclib, message
         _ = Test(value=10).message
 
 
+def test_decoded_messages_warn_once_per_class(requires_grpclib, message, reset_metadata):
+    from tests.outputs.deprecated.deprecated import Test
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=DeprecationWarning)
+        data = bytes(Test(message=message, value=10))
+
+    with warnings.catch_warnings(record=True) as record:
+        warnings.simplefilter("always")
+        Test.parse(data)
+        Test.parse(data)
+        Test.from_dict({"message": {"value": "hello"}})
+
+    assert sorted(str(warning.message) for warning in record) == [
+        "Message is deprecated",
+        "Test.message is deprecated",
+    ]
+
+
 @pytest.mark.asyncio
 async def test_service_with_deprecated_method(requires_grpclib):
     from tests.mocks import MockChannel
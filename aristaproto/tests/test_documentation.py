@@ -1,6 +1,7 @@
 import ast
 import inspect
 import sys
+from pathlib import Path
 
 from tests.util import requires_grpclib  # noqa: F401
 
@@ -41,6 +42,30 @@ def test_documentation(requires_grpclib) -> None:
     check(ServiceStub.get.__doc__, "method")
 
 
+def test_documented_stubs(requires_grpclib) -> None:
+    from .outputs.documentation_stubs import documentation
+    from .outputs.documentation_stubs.documentation import (
+        Enum,
+        ServiceBase,
+        Test,
+    )
+
+    # The comments are only kept in the stub
+    assert "Documentation of" not in (Test.__doc__ or "")
+    assert "Documentation of" not in inspect.getsource(documentation)
+    assert Enum.__doc__ is None
+    assert ServiceBase.get.__doc__ is None
+
+    tree = ast.parse(Path(documentation.__file__).with_suffix(".pyi").read_text())
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+
+    check(ast.get_docstring(classes["Test"]), "message")
+    check(classes["Test"].body[2].value.value, "field")
+    check(ast.get_docstring(classes["Enum"]), "enum")
+    check(ast.get_docstring(classes["ServiceBase"].body[1]), "method")
+    check(ast.get_docstring(classes["ServiceStub"].body[1]), "method")
+
+
 def test_escaping(requires_grpclib) -> None:
     from .outputs.documentation.documentation import ComplexDocumentation
 
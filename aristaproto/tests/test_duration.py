@@ -0,0 +1,59 @@
+from datetime import timedelta
+
+import pytest
+
+from tests.outputs.google.google.protobuf import Duration
+
+
+@pytest.mark.parametrize(
+    ("value", "duration"),
+    [
+        ("0s", Duration(0, 0)),
+        ("1s", Duration(1, 0)),
+        ("1.500s", Duration(1, 500_000_000)),
+        ("1.000001s", Duration(1, 1_000)),
+        ("1.000000001s", Duration(1, 1)),
+        ("-1.500s", Duration(-1, -500_000_000)),
+        ("-0.000000001s", Duration(0, -1)),
+        # Large values do not lose the precision of the nanoseconds
+        ("315576000000.999999999s", Duration(315_576_000_000, 999_999_999)),
+        ("-315576000000.999999999s", Duration(-315_576_000_000, -999_999_999)),
+    ],
+)
+def test_duration_json_round_trip(value: str, duration: Duration):
+    assert Duration.from_dict(value) == duration
+    assert duration.to_dict() == value
+
+
+@pytest.mark.parametrize(
+    ("value", "duration"),
+    [
+        ("1.5s", Duration(1, 500_000_000)),
+        ("1.1234s", Duration(1, 123_400_000)),
+        ("1.1234567891s", Duration(1, 123_456_789)),
+        ("-0.5s", Duration(0, -500_000_000)),
+    ],
+)
+def test_duration_from_dict_accepts_any_fraction_width(value: str, duration: Duration):
+    assert Duration.from_dict(value) == duration
+
+
+@pytest.mark.parametrize("value", ["", "s", "1", "-s", "1.s", ".5s", "+1s", "1.5", "1,5s", "１s", "1e3s", "--1s"])
+def test_duration_from_dict_rejects_invalid_values(value: str):
+    with pytest.raises(ValueError):
+        Duration.from_dict(value)
+
+
+@pytest.mark.parametrize(
+    ("delta", "value"),
+    [
+        (timedelta(0), "0s"),
+        (timedelta(seconds=1), "1s"),
+        (timedelta(days=1, microseconds=5), "86400.000005s"),
+        (timedelta(milliseconds=-1500), "-1.500s"),
+        (timedelta(microseconds=-1), "-0.000001s"),
+    ],
+)
+def test_duration_timedelta_to_json(delta: timedelta, value: str):
+    assert Duration.delta_to_json(delta) == value
+    assert Duration.from_dict(value).to_timedelta() == delta
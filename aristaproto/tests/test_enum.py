@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 import aristaproto
@@ -12,6 +14,19 @@ class Colour(aristaproto.Enum):
 PURPLE = Colour(4)
 
 
+class EagerStatus(aristaproto.Enum):
+    UNSPECIFIED = 0
+    UP = 1
+    DOWN = 2
+    OFFLINE = 2
+
+
+class LazyStatus(aristaproto.Enum):
+    @staticmethod
+    def _aristaproto_members() -> dict[str, int]:
+        return {"UNSPECIFIED": 0, "UP": 1, "DOWN": 2, "OFFLINE": 2}
+
+
 @pytest.mark.parametrize(
     "member, str_value",
     [
@@ -108,3 +123,119 @@ def test_unknown_variant_to_dict() -> None:
     deserialized = OldVersionMessage.parse(serialized)
 
     assert deserialized.to_dict() == {"oldVersion": 3}
+
+
+def test_enum_from_dict_names() -> None:
+    from tests.outputs.enum.enum import ArithmeticOperator, EnumMessage
+
+    # Both the original proto names and the Python names are accepted
+    for name in ("ARITHMETIC_OPERATOR_MINUS", "MINUS"):
+        assert EnumMessage.from_dict({"arithmeticOperator": name}).arithmetic_operator is ArithmeticOperator.MINUS
+    assert EnumMessage.from_dict({"arithmeticOperator": 2}).arithmetic_operator is ArithmeticOperator.MINUS
+
+    with pytest.raises(ValueError):
+        EnumMessage.from_dict({"arithmeticOperator": "ARITHMETIC_OPERATOR_TIMES"})
+
+
+def test_unknown_members_are_cached(monkeypatch) -> None:
+    class Shape(aristaproto.Enum):
+        CIRCLE = 1
+
+    assert Shape(7) is Shape(7)
+    assert Shape(7).proto_name is None
+
+    monkeypatch.setattr("aristaproto.enum_._MAX_UNKNOWN_MEMBERS", 1)
+    assert Shape(8) == Shape(8)
+    assert Shape(8) is not Shape(8)
+
+
+def test_lazy_enum_members() -> None:
+    class Status(aristaproto.Enum):
+        @staticmethod
+        def _aristaproto_members() -> dict[str, int]:
+            return {"UNSPECIFIED": 0, "UP": 1, "DOWN": 2, "OFFLINE": 2}
+
+    # The members are only created on first use
+    assert "UP" not in vars(Status)
+    assert Status.UP == 1
+    assert "UP" in vars(Status)
+
+    assert list(Status) == [Status.UNSPECIFIED, Status.UP, Status.DOWN]
+    assert Status.OFFLINE is Status.DOWN
+    assert set(Status.__members__) == {"UNSPECIFIED", "UP", "DOWN", "OFFLINE"}
+    assert Status.from_string("DOWN") is Status(2) is Status._from_value(2)
+    assert repr(Status.UP) == "<Status.UP: 1>"
+    assert str(Status(9)) == "UNKNOWN(9)"
+
+    with pytest.raises(ValueError):
+        Status.from_string("BROKEN")
+
+
+def test_lazy_enum_same_as_eager() -> None:
+    # The lazy members are created from the enum internals, which must match the standard enum creation on each version
+    assert list(LazyStatus) == list(EagerStatus)
+    assert [member.name for member in LazyStatus] == [member.name for member in EagerStatus]
+    assert list(reversed(LazyStatus)) == list(reversed(EagerStatus))
+    assert list(LazyStatus.__members__.items()) == [
+        (name, LazyStatus(member.value)) for name, member in EagerStatus.__members__.items()
+    ]
+    assert LazyStatus._member_names_ == EagerStatus._member_names_
+    assert LazyStatus._value2member_map_ == EagerStatus._value2member_map_
+    assert LazyStatus.OFFLINE is LazyStatus.DOWN
+
+    for lazy, eager in zip(LazyStatus, EagerStatus):
+        assert vars(lazy).keys() == vars(eager).keys()
+        assert repr(lazy) == repr(eager).replace("Eager", "Lazy")
+        assert str(lazy) == str(eager)
+        assert hash(lazy) == hash(eager)
+        assert lazy in LazyStatus
+        assert pickle.loads(pickle.dumps(lazy)) is lazy
+        assert pickle.loads(pickle.dumps(eager)) is eager
+
+
+@pytest.mark.parametrize(
+    "entry_point",
+    [
+        lambda cls: cls(1),
+        lambda cls: cls["UP"],
+        lambda cls: cls._from_value(1),
+        lambda cls: len(cls),
+        lambda cls: list(reversed(cls)),
+        lambda cls: dir(cls),
+        lambda cls: cls._aristaproto_json_names,
+    ],
+)
+def test_lazy_enum_entry_points(entry_point) -> None:
+    class Status(aristaproto.Enum):
+        @staticmethod
+        def _aristaproto_members() -> dict[str, int]:
+            return {"UNSPECIFIED": 0, "UP": 1}
+
+    entry_point(Status)
+    assert Status._member_names_ == ["UNSPECIFIED", "UP"]
+    assert Status.UP.proto_name is None
+
+
+def test_lazy_enum_member_named_like_attribute() -> None:
+    class Number(aristaproto.Enum):
+        @staticmethod
+        def _aristaproto_members() -> dict[str, int]:
+            return {"ZERO": 0, "real": 1}
+
+    # These members are created with the enum, like the ones of the standard enums
+    assert "ZERO" in Number._member_map_
+    assert Number.real.value == 1
+
+
+def test_lazy_enums_option() -> None:
+    from tests.outputs.enum import enum as standard
+    from tests.outputs.enum_lazy_enums import enum as lazy
+
+    assert lazy.ArithmeticOperator._aristaproto_pending_members is not None
+    assert list(lazy.ArithmeticOperator.__members__) == list(standard.ArithmeticOperator.__members__)
+    assert lazy.ArithmeticOperator.PLUS.proto_name == "ARITHMETIC_OPERATOR_PLUS"
+
+    message = lazy.EnumMessage(arithmetic_operator=lazy.ArithmeticOperator.PLUS, no_striping=lazy.NoStriping.B)
+    assert message.to_dict() == {"arithmeticOperator": "ARITHMETIC_OPERATOR_PLUS", "noStriping": "B"}
+    assert lazy.EnumMessage.from_dict(message.to_dict()) == message
+    assert bytes(message) == bytes(standard.EnumMessage.from_dict(message.to_dict()))
@@ -7,7 +7,7 @@ import pytest
 
 import aristaproto
 from aristaproto import OutputFormat
-from tests.util import requires_grpcio, requires_grpclib  # noqa: F401
+from tests.util import requires_grpcio, requires_grpclib, requires_pydantic  # noqa: F401
 
 
 def test_class_init():
@@ -440,3 +440,299 @@ def test_equality_comparison():
     assert msg == TestMessage(value=True)
     assert msg != 1
     assert msg != TestMessage(value=False)
+
+
+def test_containers_are_allocated_lazily():
+    from tests.outputs.features.features import MsgE
+
+    msg = MsgE(bool_field=True)
+    assert "str_field" not in msg.__dict__
+
+    # Serializing or exporting the message doesn't allocate the container
+    parsed = MsgE.parse(bytes(msg))
+    assert msg.to_dict() == {"boolField": True}
+    assert "str_field" not in msg.__dict__
+    assert "str_field" not in parsed.__dict__
+    assert parsed == msg
+
+    # The container is created on first access
+    msg.str_field.append("a")
+    assert msg.str_field == ["a"]
+    assert MsgE.parse(bytes(msg)).str_field == ["a"]
+
+
+def test_comparing_messages_does_not_allocate_containers():
+    from tests.outputs.features.features import MsgE
+
+    msg = MsgE.parse(bytes(MsgE(bool_field=True)))
+    other = MsgE(bool_field=True)
+
+    assert msg == other
+    assert msg != MsgE(bool_field=True, str_field=["a"])
+    assert MsgE(bool_field=True, str_field=["a"]) != msg
+    assert repr(msg) == "MsgE(bool_field=True)"
+    assert msg
+    assert not MsgE()
+    assert not msg.is_set("str_field")
+    assert "str_field" not in msg.__dict__
+    assert "str_field" not in other.__dict__
+
+    # An allocated empty container equals a container that was never allocated
+    assert MsgE(bool_field=True, str_field=[]) == msg
+
+
+def test_lazy_container_placeholders_of_base_messages():
+    from dataclasses import dataclass
+
+    import aristaproto
+
+    @dataclass(eq=False, repr=False)
+    class Base(aristaproto.Message):
+        values: list[int] = aristaproto.field(1, aristaproto.TYPE_INT32, repeated=True)
+
+    @dataclass(eq=False, repr=False)
+    class Derived(Base):
+        items: list[int] = aristaproto.field(2, aristaproto.TYPE_INT32, repeated=True)
+
+    derived = Derived()
+    assert derived.values == []
+    assert derived.items == []
+
+    # The placeholders of the base message are removed when the metadata of the base is built
+    assert "values" not in vars(Base)
+    assert "_aristaproto_meta" in vars(Base)
+    assert Base().values == []
+
+
+def test_lazy_map_container():
+    from tests.outputs.map.map import Test
+
+    msg = Test()
+    assert "counts" not in msg.__dict__
+    assert msg == Test(counts={})
+
+    msg.counts["a"] = 1
+    assert Test.parse(bytes(msg)).counts == {"a": 1}
+
+
+def test_map_entries():
+    from tests.outputs.map.map import Test
+    from tests.outputs.mapmessage.mapmessage import Nested, Test as MapMessageTest
+
+    msg = MapMessageTest(items={"a": Nested(count=1), "": Nested()})
+    assert bytes(msg) == b"\n\x07\n\x01a\x12\x02\x08\x01" + b"\n\x04\n\x00\x12\x00"
+    assert MapMessageTest.parse(bytes(msg)) == msg
+
+    # Missing keys and values take their default value, unknown entry fields are skipped
+    assert Test.parse(b"\n\x02\x10\x05" + b"\n\x03\n\x01b" + b"\n\x05\x18\x01\x10\x07").counts == {
+        "": 7,
+        "b": 0,
+    }
+    assert MapMessageTest.parse(b"\n\x03\n\x01a").items == {"a": Nested()}
+
+
+def test_string_interning():
+    import aristaproto
+    from tests.outputs.features.features import MsgE
+    from tests.outputs.map.map import Test
+
+    data = bytes(MsgE(str_field=["eth1", "eth1"]))
+    assert MsgE.parse(data).str_field[0] is not MsgE.parse(data).str_field[1]
+
+    aristaproto.set_string_interning(True)
+    try:
+        first, second = MsgE.parse(data).str_field
+        assert first is second
+
+        (key,) = Test.parse(bytes(Test(counts={"eth1": 1}))).counts
+        assert key is first
+    finally:
+        aristaproto.set_string_interning(False)
+
+    aristaproto.set_string_interning(True, Test)
+    try:
+        assert Test._aristaproto_intern_strings
+        assert not MsgE._aristaproto_intern_strings
+    finally:
+        del Test._aristaproto_intern_strings
+
+
+def test_intern_table_is_bounded():
+    from aristaproto import InternTable
+
+    table = InternTable(max_size=2, max_length=4)
+    assert table("a" * 5) not in table._strings
+    a, b, c = (str(i) for i in range(10, 13))
+    assert table(a) is a and table(b) is b and table(c) is c
+    assert len(table) == 2
+    assert table(str(10)) is a
+    assert table(str(12)) is not c
+
+
+def test_parse_zero_copy():
+    from copy import deepcopy
+
+    from tests.outputs.conformance.protobuf_test_messages.proto3 import TestAllTypesProto3 as Message
+
+    msg = Message(
+        optional_string="name",
+        optional_bytes=b"chunk",
+        repeated_bytes=[b"a", b"b"],
+        map_string_bytes={"key": b"value"},
+        recursive_message=Message(optional_bytes=b"nested"),
+    )
+    data = bytearray(bytes(msg))
+
+    parsed = Message.parse(data, zero_copy=True)
+    assert parsed == msg
+    for value in (
+        parsed.optional_bytes,
+        *parsed.repeated_bytes,
+        parsed.map_string_bytes["key"],
+        parsed.recursive_message.optional_bytes,
+    ):
+        assert isinstance(value, memoryview)
+        assert value.readonly
+        assert value.obj is data
+
+    assert bytes(parsed) == bytes(msg)
+    assert parsed.to_dict() == msg.to_dict()
+
+    copied = deepcopy(parsed)
+    assert copied == msg
+    assert type(copied.optional_bytes) is bytes
+
+    assert type(Message.parse(data).optional_bytes) is bytes
+
+
+def test_construct():
+    from tests.outputs.features.features import Enum, EnumMsg, MsgE
+
+    msg = MsgE.construct(bool_field=True)
+    assert msg == MsgE(bool_field=True)
+    assert msg.int_field is None
+    assert msg.str_field == []
+    assert EnumMsg.construct().enum == Enum.ZERO
+
+    # The values are trusted and not copied
+    names = ["a"]
+    assert MsgE.construct(str_field=names).str_field is names
+
+
+def test_construct_skips_pydantic_validation(requires_pydantic):
+    import pydantic
+
+    from tests.outputs.validation_pydantic.validation import Message
+
+    with pytest.raises(pydantic.ValidationError):
+        Message(int32_value=2**31)
+
+    assert Message.construct(int32_value=2**31).int32_value == 2**31
+
+
+def test_from_dict_keeps_pydantic_coercion(requires_pydantic):
+    import typing
+
+    import pydantic
+    from pydantic.dataclasses import dataclass
+
+    @dataclass(eq=False, repr=False)
+    class Interface(aristaproto.Message):
+        name: typing.Annotated[str, pydantic.AfterValidator(str.upper)] = aristaproto.field(1, aristaproto.TYPE_STRING)
+
+    assert Interface.from_dict({"name": "eth1"}).name == "ETH1"
+
+
+def test_parse_zero_copy_rejects_pydantic(requires_pydantic):
+    from tests.outputs.validation_pydantic.validation import Message
+
+    with pytest.raises(TypeError):
+        Message.parse(b"", zero_copy=True)
+
+
+def test_iter_json_streams_repeated_and_map_messages():
+    from dataclasses import dataclass
+
+    @dataclass(eq=False, repr=False)
+    class Leaf(aristaproto.Message):
+        name: str = aristaproto.field(1, aristaproto.TYPE_STRING)
+
+    @dataclass(eq=False, repr=False)
+    class Branch(aristaproto.Message):
+        leaves: list[Leaf] = aristaproto.field(1, aristaproto.TYPE_MESSAGE, repeated=True)
+
+    @dataclass(eq=False, repr=False)
+    class Tree(aristaproto.Message):
+        branches: list[Branch] = aristaproto.field(1, aristaproto.TYPE_MESSAGE, repeated=True)
+        branches_by_name: dict[str, Branch] = aristaproto.field(
+            2, aristaproto.TYPE_MAP, map_meta=aristaproto.map_meta(aristaproto.TYPE_STRING, aristaproto.TYPE_MESSAGE)
+        )
+
+    # A single large element is yielded in several chunks, instead of being gathered in memory
+    branch = Branch(leaves=[Leaf(name="a" * 1000) for _ in range(5)])
+    for tree in (Tree(branches=[branch]), Tree(branches_by_name={"branch": branch})):
+        chunks = list(tree.iter_json())
+        assert max(map(len, chunks)) < 2000
+        assert "".join(chunks) == tree.to_json()
+
+
+def test_json_backend():
+    orjson = pytest.importorskip("orjson")
+
+    from tests.outputs.conformance.protobuf_test_messages.proto3 import TestAllTypesProto3 as Message
+
+    msg = Message(optional_int64=-5, optional_bytes=b"\x00", optional_bytes_wrapper=b"\x01", repeated_string=["a"])
+    backend = aristaproto.JsonBackend(dumps=orjson.dumps, loads=orjson.loads)
+
+    assert msg.to_json(json_backend=backend) == orjson.dumps(msg.to_dict()).decode()
+    assert Message.from_json(msg.to_json(json_backend=backend), json_backend=backend) == msg
+
+    aristaproto.set_json_backend(backend)
+    try:
+        assert msg.to_json() == orjson.dumps(msg.to_dict()).decode()
+    finally:
+        aristaproto.set_json_backend(None)
+
+    assert msg.to_json() == json.dumps(msg.to_dict())
+    assert Message.from_json(msg.to_json()) == msg
+
+
+def test_json_backend_indent():
+    orjson = pytest.importorskip("orjson")
+
+    from tests.outputs.conformance.protobuf_test_messages.proto3 import TestAllTypesProto3 as Message
+
+    msg = Message(optional_int32=1, repeated_string=["a"])
+
+    # orjson has no `indent` argument
+    backend = aristaproto.JsonBackend(dumps=orjson.dumps, loads=orjson.loads)
+    with pytest.raises(TypeError):
+        msg.to_json(indent=2, json_backend=backend)
+
+    backend = aristaproto.JsonBackend(
+        dumps=orjson.dumps,
+        loads=orjson.loads,
+        dumps_indent=lambda value, indent: orjson.dumps(value, option=orjson.OPT_INDENT_2),
+    )
+    assert msg.to_json(indent=2, json_backend=backend) == json.dumps(msg.to_dict(), indent=2)
+    assert msg.to_json(json_backend=backend) == orjson.dumps(msg.to_dict()).decode()
+
+
+def test_dict_converters_are_compiled_once():
+    from tests.outputs.features.features import MsgE
+
+    msg = MsgE(bool_field=True, str_field=["a"])
+    assert msg.to_dict() == {"boolField": True, "strField": ["a"]}
+    assert msg.to_dict(casing=aristaproto.Casing.SNAKE) == {"bool_field": True, "str_field": ["a"]}
+    assert {
+        (aristaproto.OutputFormat.PROTO_JSON, aristaproto.Casing.CAMEL, False),
+        (aristaproto.OutputFormat.PROTO_JSON, aristaproto.Casing.SNAKE, False),
+    } <= MsgE._aristaproto.to_dict_converters.keys()
+
+    assert MsgE.from_dict({"boolField": True, "str_field": ["a"]}) == msg
+    assert MsgE.from_dict({"bool_field": True, "strField": ["a"]}) == msg
+    assert False in MsgE._aristaproto.from_dict_converters
+
+    with pytest.raises(KeyError, match="Unknown field 'unknown_field' in message MsgE."):
+        MsgE.from_dict({"unknownField": 1})
+    assert MsgE.from_dict({"unknownField": 1}, ignore_unknown_fields=True) == MsgE()
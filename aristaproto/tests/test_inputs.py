@@ -206,6 +206,10 @@ def test_message_json(test_case: TestCase, requires_pydantic, requires_grpcio, r
 
         assert dict_replace_nans(json.loads(message_json)) == dict_replace_nans(json.loads(json_data))
 
+        # The streaming encoder gives the same output
+        assert "".join(message.iter_json()) == message.to_json()
+        assert "".join(message.iter_json(include_default_values=True)) == message.to_json(include_default_values=True)
+
 
 @pytest.mark.parametrize("test_case", TEST_CASES, ids=lambda x: x.plugin_package)
 def test_binary_compatibility(
@@ -249,3 +253,31 @@ def test_binary_compatibility(
         assert dict_replace_nans(plugin_instance_from_json.to_dict()) == dict_replace_nans(
             plugin_instance_from_binary.to_dict()
         )
+
+
+@pytest.mark.parametrize("test_case", TEST_CASES, ids=lambda x: x.plugin_package)
+def test_transcode(test_case: TestCase, requires_pydantic, requires_grpcio, requires_grpclib) -> None:
+    from aristaproto.transcode import binary_to_json, json_to_binary
+
+    if test_case.xfail:
+        pytest.xfail(f"Test case {test_case.plugin_package} is expected to fail.")
+
+    plugin_module = importlib.import_module(f"tests.outputs.{test_case.plugin_package}")
+
+    current_dir = Path(os.path.dirname(os.path.abspath(__file__)))
+
+    for json_path in test_case.jsons:
+        with open(current_dir / "inputs" / json_path) as f:
+            json_data = f.read()
+
+        binary = bytes(plugin_module.Test.from_json(json_data))
+        assert json_to_binary(plugin_module.Test, json_data) == binary
+
+        message: aristaproto.Message = plugin_module.Test.parse(binary)
+        assert binary_to_json(plugin_module.Test, binary) == message.to_json()
+        assert binary_to_json(plugin_module.Test, binary, include_default_values=True) == message.to_json(
+            include_default_values=True
+        )
+        assert binary_to_json(plugin_module.Test, binary, casing=aristaproto.Casing.SNAKE) == message.to_json(
+            casing=aristaproto.Casing.SNAKE
+        )
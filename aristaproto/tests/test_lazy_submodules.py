@@ -0,0 +1,80 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from tests.util import assert_field_types_match_annotations, requires_grpclib  # noqa: F401
+
+PACKAGE = "tests.outputs.import_service_input_message_lazy.import_service_input_message"
+
+
+def run(code: str) -> list[str]:
+    """Runs code in a new interpreter, and returns the lines it prints."""
+    output = subprocess.check_output([sys.executable, "-c", code], cwd=Path(__file__).parent.parent, text=True)
+    return output.splitlines()
+
+
+def test_submodules_imported_on_first_access(requires_grpclib):
+    code = f"""
+import sys
+import {PACKAGE} as package
+
+print(sorted(name.rsplit(".", 1)[1] for name in sys.modules if name.startswith("{PACKAGE}.")))
+package.RequestResponse
+print(sorted(name.rsplit(".", 1)[1] for name in sys.modules if name.startswith("{PACKAGE}.")))
+"""
+    before, after = run(code)
+
+    assert before == "[]"
+    # The submodule of `RequestMessage` is imported too, since the service references it
+    assert after == "['_import_service_input_message', '_request_message', 'child']"
+
+
+def test_message_pool_imports_submodule():
+    code = """
+import sys
+from tests.outputs.import_service_input_message_lazy.message_pool import default_message_pool
+
+message_type = default_message_pool.url_to_type["type.googleapis.com/import_service_input_message.RequestMessage"]
+print(message_type.__module__)
+print(sorted(name.rsplit(".", 1)[1] for name in sys.modules if "_import_service_input_message" in name))
+"""
+    module, imported = run(code)
+
+    assert module == f"{PACKAGE}._request_message"
+    assert imported == "[]"
+
+
+def test_package_attributes():
+    import importlib
+
+    package = importlib.import_module(PACKAGE)
+    from tests.outputs.import_service_input_message_lazy.import_service_input_message._request_message import (
+        RequestMessage,
+    )
+
+    assert package.RequestMessage is RequestMessage
+    assert {"RequestMessage", "RequestResponse", "TestStub"} <= set(dir(package))
+    assert set(package.__all__) <= set(dir(package))
+
+    with pytest.raises(AttributeError, match="has no attribute 'Missing'"):
+        package.Missing
+
+
+def test_field_types_across_submodules(requires_grpclib):
+    assert_field_types_match_annotations("tests.outputs.import_service_input_message_lazy")
+    assert_field_types_match_annotations("tests.outputs.googletypes_lazy")
+
+
+def test_same_encoding_as_package_module():
+    from tests.outputs.googletypes.googletypes import Test
+    from tests.outputs.googletypes_lazy.googletypes import Test as LazyTest
+
+    for path in sorted(Path(__file__).parent.joinpath("inputs", "googletypes").glob("*.json")):
+        document = json.loads(path.read_text())
+        message = LazyTest.from_dict(document)
+
+        assert bytes(message) == bytes(Test.from_dict(document))
+        assert LazyTest.parse(bytes(message)) == message
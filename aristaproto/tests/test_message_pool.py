@@ -0,0 +1,104 @@
+import subprocess
+import sys
+
+import pytest
+
+import aristaproto
+
+
+def test_message_pool_imports_modules_on_lookup():
+    # Run in a new interpreter, where the generated modules are not imported yet
+    code = """
+import sys
+
+from tests.outputs.any.message_pool import default_message_pool
+
+assert "tests.outputs.any.any" not in sys.modules
+
+url = "type.googleapis.com/any.Person"
+assert url in default_message_pool.url_to_type
+assert "tests.outputs.any.any" in sys.modules
+
+from tests.outputs.any.any import Person
+
+assert default_message_pool.url_to_type[url] is Person
+assert default_message_pool.url_to_type.get("type.googleapis.com/any.Unknown") is None
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_message_pool_unknown_module():
+    pool = aristaproto.MessagePool()
+    pool.index_modules("tests.outputs", {"missing_package": ("Message",)})
+
+    with pytest.raises(ModuleNotFoundError):
+        pool.url_to_type["type.googleapis.com/missing_package.Message"]
+
+    # The module is still indexed, and imported again on the next lookup
+    with pytest.raises(ModuleNotFoundError):
+        pool.url_to_type["type.googleapis.com/missing_package.Message"]
+
+
+def test_message_pool_concurrent_lookups():
+    # Run in a new interpreter, where the generated modules are not imported yet
+    code = """
+import threading
+
+from tests.outputs.any.message_pool import default_message_pool
+
+url = "type.googleapis.com/any.Person"
+barrier = threading.Barrier(8)
+results = []
+
+def lookup():
+    barrier.wait()
+    results.append(default_message_pool.url_to_type[url])
+
+threads = [threading.Thread(target=lookup) for _ in range(8)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+
+from tests.outputs.any.any import Person
+
+assert results == [Person] * 8
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_message_pool_lookup_while_importing(tmp_path, monkeypatch):
+    # A module looking up another type from a new thread while it is imported must not wait for its own import
+    (tmp_path / "lookup_pool.py").write_text("import aristaproto\n\npool = aristaproto.MessagePool()\n")
+    (tmp_path / "lookup_first.py").write_text(
+        "import threading\n"
+        "from lookup_pool import pool\n"
+        "found = []\n"
+        "thread = threading.Thread(target=lambda: found.append(pool.url_to_type['second']), daemon=True)\n"
+        "thread.start()\n"
+        "thread.join(timeout=5)\n"
+        "pool.url_to_type['first'] = found\n"
+    )
+    (tmp_path / "lookup_second.py").write_text("from lookup_pool import pool\n\npool.url_to_type['second'] = 2\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for name in ("lookup_pool", "lookup_first", "lookup_second"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    from lookup_pool import pool
+
+    pool.url_to_type.modules.update({"first": "lookup_first", "second": "lookup_second"})
+    assert pool.url_to_type["first"] == [2]
+
+
+def test_message_pool_registration():
+    from tests.outputs.any.any import Person
+
+    pool = aristaproto.MessagePool()
+    pool.index_modules("tests.outputs.any", {"any": ("Person",)})
+    pool.register_message("any", "Person", Person)
+
+    assert pool.url_to_type["type.googleapis.com/any.Person"] is Person
+    assert pool.type_to_url[Person] == "type.googleapis.com/any.Person"
+
+    with pytest.raises(RuntimeError):
+        pool.register_message("any", "Person", Person)
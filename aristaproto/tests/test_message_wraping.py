@@ -1,5 +1,9 @@
 import datetime
 
+import pytest
+
+from aristaproto.nano_datetime import NanoDatetime
+
 
 def test_message_wrapping_map():
     from tests.outputs.message_wrapping.message_wrapping import MapMessage
@@ -9,3 +13,93 @@ def test_message_wrapping_map():
     bytes(msg)
 
     assert msg.to_dict() == {"map1": {"key": 12.0}, "map2": {"key": "1s"}}
+
+
+@pytest.mark.parametrize(
+    ("type_name", "value"),
+    [
+        ("BoolValue", True),
+        ("Int32Value", -5),
+        ("Int64Value", 2**40),
+        ("UInt32Value", 2**32 - 1),
+        ("UInt64Value", 2**64 - 1),
+        ("FloatValue", 1.5),
+        ("DoubleValue", -0.25),
+        ("StringValue", "héllo"),
+        ("BytesValue", b"\x00\xff"),
+        ("Int32Value", 0),
+        ("StringValue", ""),
+        (
+            "Timestamp",
+            NanoDatetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=datetime.timezone.utc, nanosecond_remainder=789),
+        ),
+        ("Timestamp", datetime.datetime(1969, 12, 31, 23, 0, 0, 1, tzinfo=datetime.timezone.utc)),
+        ("Timestamp", datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)),
+        ("Duration", datetime.timedelta(days=3, microseconds=5)),
+        ("Duration", datetime.timedelta(seconds=-1, microseconds=-500000)),
+        ("Duration", datetime.timedelta(0)),
+    ],
+)
+def test_wrapped_codecs_match_the_messages(type_name: str, value):
+    import tests.outputs.google.google.protobuf as google_protobuf
+
+    wrapper_cls = getattr(google_protobuf, type_name)
+    data = bytes(wrapper_cls.from_wrapped(value))
+
+    assert wrapper_cls.encode_wrapped(value) == data
+    assert wrapper_cls.decode_wrapped(data) == wrapper_cls.parse(data).to_wrapped() == value
+
+
+def test_wrapped_codecs_skip_unknown_fields():
+    from tests.outputs.google.google.protobuf import Int32Value, Timestamp
+
+    # Field 3 is unknown and the last occurrence of a field wins
+    assert Timestamp.decode_wrapped(b"\x08\x01\x18\x07\x08\x02") == NanoDatetime.from_timestamp(2, 0)
+    assert Int32Value.decode_wrapped(b"\x12\x01a\x08\x05") == 5
+
+
+@pytest.mark.parametrize("package", ["googletypes", "googletypes_codecs"])
+def test_wrapped_fields_decoded_directly_with_string_interning(package, monkeypatch):
+    import importlib
+
+    import aristaproto
+
+    google_protobuf = importlib.import_module(f"tests.outputs.{package}.google.protobuf")
+    Test = importlib.import_module(f"tests.outputs.{package}.googletypes").Test
+
+    calls = []
+    decode_wrapped = google_protobuf.Timestamp.decode_wrapped
+    monkeypatch.setattr(
+        google_protobuf.Timestamp,
+        "decode_wrapped",
+        staticmethod(lambda data: calls.append(data) or decode_wrapped(data)),
+    )
+
+    data = bytes(Test(ts=NanoDatetime.from_timestamp(1, 0)))
+    wrapped_string = bytes(google_protobuf.StringValue(value="eth1"))
+
+    aristaproto.set_string_interning(True)
+    try:
+        # Interning the strings doesn't disable the direct decoding of the wrappers without strings
+        assert Test.parse(data).ts == NanoDatetime.from_timestamp(1, 0)
+        assert calls
+
+        decode_string = google_protobuf.StringValue.decode_wrapped
+        assert decode_string(wrapped_string) is decode_string(wrapped_string)
+    finally:
+        aristaproto.set_string_interning(False)
+
+    assert decode_string(wrapped_string) is not decode_string(wrapped_string)
+
+
+def test_wrapped_fields_round_trip():
+    from tests.outputs.googletypes.googletypes import Test
+
+    msg = Test(
+        maybe=True,
+        ts=NanoDatetime.from_timestamp(1_700_000_000, 123_456_789),
+        duration=datetime.timedelta(seconds=-3, microseconds=250),
+        important=0,
+    )
+
+    assert Test.parse(bytes(msg)) == msg
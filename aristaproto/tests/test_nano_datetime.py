@@ -81,3 +81,59 @@ def test_from_rfc3339_accepts_subsecond_fraction_widths(value: str, total_nanose
 
     assert isinstance(dt, NanoDatetime)
     assert dt.total_nanoseconds == total_nanoseconds
+
+
+@pytest.mark.parametrize(
+    ("seconds", "nanos", "expected"),
+    [
+        (0, 0, "1970-01-01T00:00:00Z"),
+        (1_700_000_000, 500_000_000, "2023-11-14T22:13:20.500Z"),
+        (-1, 999_999_999, "1969-12-31T23:59:59.999999999Z"),
+        (-62135596800, 0, "0001-01-01T00:00:00Z"),
+        (253402300799, 999_999_999, "9999-12-31T23:59:59.999999999Z"),
+        # The nanos out of range are carried to the seconds
+        (0, -1, "1969-12-31T23:59:59.999999999Z"),
+        (0, 1_000_000_001, "1970-01-01T00:00:01.000000001Z"),
+    ],
+)
+def test_timestamp_to_rfc3339(seconds: int, nanos: int, expected: str) -> None:
+    assert NanoDatetime.timestamp_to_rfc3339(seconds, nanos) == expected
+    assert NanoDatetime.timestamp_to_rfc3339(seconds, nanos) == NanoDatetime.to_json(
+        NanoDatetime.from_timestamp(seconds, nanos)
+    )
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("1970-01-01T00:00:00Z", (0, 0)),
+        ("2023-11-14T22:13:20.5Z", (1_700_000_000, 500_000_000)),
+        ("1969-12-31T23:59:59.999999999Z", (-1, 999_999_999)),
+        ("1970-01-01T02:00:00+02:00", (0, 0)),
+        ("1969-12-31T19:30:00.25-04:30", (0, 250_000_000)),
+        ("1970-01-01t00:00:00z", (0, 0)),
+        # Leap seconds are clamped to the previous second
+        ("2016-12-31T23:59:60Z", (1_483_228_799, 0)),
+        ("2016-12-31T23:59:60.5Z", (1_483_228_799, 500_000_000)),
+        ("2017-01-01T00:59:60+01:00", (1_483_228_799, 0)),
+    ],
+)
+def test_rfc3339_to_timestamp(value: str, expected: tuple[int, int]) -> None:
+    assert NanoDatetime.rfc3339_to_timestamp(value) == expected
+    assert NanoDatetime.to_timestamp(NanoDatetime.from_rfc3339(value)) == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "1970-01-01T24:00:00Z",
+        "1970-01-01T00:60:00Z",
+        "1970-01-01T00:00:60Z",
+        "1970-13-01T00:00:00Z",
+        "1970-01-01T00:00:00+24:00",
+        "not a date",
+    ],
+)
+def test_rfc3339_to_timestamp_rejects_invalid_values(value: str) -> None:
+    with pytest.raises(ValueError):
+        NanoDatetime.rfc3339_to_timestamp(value)
@@ -1,3 +1,6 @@
+import pytest
+
+
 def test_struct_to_dict():
     from tests.outputs.google.google.protobuf import Struct
 
@@ -48,3 +51,80 @@ def test_value_to_dict():
 
     assert value.to_dict() == [1, 2, False]
     assert Value.from_dict(value.to_dict()) == value
+
+
+def test_struct_python_codec():
+    from tests.outputs.google.google.protobuf import Struct
+
+    document = {
+        "null_field": None,
+        "number_field": 12.5,
+        "string_field": "tést",
+        "bool_field": False,
+        "struct_field": {"x": "abc", "empty": {}},
+        "list_field": [42.0, True, None, [], ""],
+    }
+
+    data = Struct.python_to_bytes(document)
+
+    assert data == bytes(Struct.from_dict(document))
+    assert Struct.bytes_to_python(data) == document
+    assert Struct.bytes_to_python(memoryview(data)) == document
+
+
+def test_listvalue_python_codec():
+    from tests.outputs.google.google.protobuf import ListValue
+
+    data = ListValue.python_to_bytes([1, "a", {"b": None}])
+
+    assert data == bytes(ListValue.from_dict([1, "a", {"b": None}]))
+    assert ListValue.bytes_to_python(data) == [1.0, "a", {"b": None}]
+
+
+def test_value_python_codec():
+    from tests.outputs.google.google.protobuf import Value
+
+    for value in (None, True, 0, -1.5, "", "x", [], {}):
+        data = Value.python_to_bytes(value)
+        assert data == bytes(Value.from_dict(value))
+        assert Value.bytes_to_python(data) == value
+
+    # The unknown fields are skipped, and the last kind of value wins
+    assert Value.bytes_to_python(b"\x38\x01\x1a\x01a\x20\x01") is True
+
+    with pytest.raises(ValueError):
+        Value.bytes_to_python(b"")
+    with pytest.raises(ValueError):
+        Value.python_to_bytes(object())
+
+
+def test_struct_decoded_on_first_access():
+    from tests.outputs.googletypes_struct.google.protobuf import Struct, Value
+    from tests.outputs.googletypes_struct.googletypes_struct import Test
+
+    document = {"name": "a", "values": [1.5, {"x": None}], "enabled": True}
+
+    # The Struct of a parsed message is converted from the binary data directly
+    message = Test.parse(bytes(Test(struct=Struct.from_dict(document))))
+    assert message.to_dict() == {"struct": document}
+    assert message.to_json() == '{"struct": {"name": "a", "values": [1.5, {"x": null}], "enabled": true}}'
+    assert "fields" not in message.struct.__dict__
+
+    # As is the Struct built from a dict, which keeps the plain Python values
+    struct = Struct.from_dict(document)
+    assert bytes(struct) == Struct.python_to_bytes(document)
+    assert "fields" not in struct.__dict__
+    document["name"] = "b"
+    assert struct.to_dict()["name"] == "a"
+
+    # The fields are decoded when they are accessed
+    assert message.struct.fields["name"] == Value(string_value="a")
+    assert message.struct == Struct.from_dict({"name": "a", "values": [1.5, {"x": None}], "enabled": True})
+    assert message.struct
+    assert not Struct.parse(b"")
+
+    # The fields can be set before they are decoded
+    struct = Struct.parse(bytes(struct))
+    struct.fields = {"other": Value(bool_value=False)}
+    assert struct.to_dict() == {"other": False}
+    assert Struct.parse(bytes(struct)).to_dict() == {"other": False}
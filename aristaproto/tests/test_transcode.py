@@ -0,0 +1,57 @@
+import gc
+import weakref
+from dataclasses import dataclass
+
+import pytest
+
+import aristaproto
+from aristaproto.transcode import binary_to_json, json_to_binary
+from tests.outputs.mapmessage.mapmessage import Nested, Test as MapMessage
+from tests.outputs.oneof.oneof import MixedDrink, Test as Oneof
+
+
+def test_binary_to_json_last_value_wins():
+    data = bytes(Oneof(just_a_regular_field=1, mixed_drink=MixedDrink(shots=2)))
+    data += bytes(Oneof(just_a_regular_field=3, mixed_drink=MixedDrink()))
+
+    assert binary_to_json(Oneof, data) == Oneof.parse(data).to_json() == '{"justARegularField": 3, "mixedDrink": {}}'
+
+
+def test_binary_to_json_skips_unknown_fields():
+    data = bytes(Oneof(just_a_regular_field=3)) + b"\xf8\x06\x01"  # Field 111 = 1
+
+    assert binary_to_json(Oneof, data) == '{"justARegularField": 3}'
+
+
+def test_binary_to_json_map_of_messages():
+    # The value of the second entry is missing and the third entry replaces the first one
+    data = bytes(MapMessage(items={"a": Nested(count=1)})) + b"\n\x03\n\x01b" + bytes(MapMessage(items={"a": Nested()}))
+
+    assert binary_to_json(MapMessage, data) == MapMessage.parse(data).to_json() == '{"items": {"a": {}, "b": {}}}'
+    assert binary_to_json(MapMessage, data, include_default_values=True) == (
+        '{"items": {"a": {"count": 0}, "b": {"count": 0}}}'
+    )
+
+
+def test_json_to_binary_unknown_fields():
+    with pytest.raises(KeyError):
+        json_to_binary(MapMessage, '{"items": {"a": {"count": 1, "other": 2}}}')
+
+    assert json_to_binary(MapMessage, '{"items": {"a": {"count": 1, "other": 2}}}', ignore_unknown_fields=True) == (
+        bytes(MapMessage(items={"a": Nested(count=1)}))
+    )
+
+
+def test_transcode_writers_do_not_keep_classes_alive():
+    @dataclass(eq=False, repr=False)
+    class Local(aristaproto.Message):
+        value: int = aristaproto.field(1, aristaproto.TYPE_INT32)
+
+    data = json_to_binary(Local, b'{"value": 1}')
+    assert binary_to_json(Local, data) == '{"value": 1}'
+
+    # The writers are stored with the metadata of the class, and collected with it
+    ref = weakref.ref(Local)
+    del Local
+    gc.collect()
+    assert ref() is None
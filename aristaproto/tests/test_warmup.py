@@ -0,0 +1,94 @@
+import gc
+import threading
+
+import pytest
+
+import aristaproto
+from tests.util import assert_field_types_match_annotations, requires_pydantic  # noqa: F401
+
+
+def test_warmup_module():
+    from tests.outputs.googletypes import googletypes
+
+    classes = aristaproto.warmup("tests.outputs.googletypes")
+
+    assert googletypes.Test in classes
+    for cls in classes:
+        assert "_aristaproto_meta" in cls.__dict__
+
+
+def test_warmup_message_pool():
+    from tests.outputs.any.message_pool import default_message_pool
+
+    classes = aristaproto.warmup(default_message_pool)
+
+    assert set(classes) == set(default_message_pool.type_to_url)
+    for cls in classes:
+        assert "_aristaproto_meta" in cls.__dict__
+
+
+def test_warmup_freeze():
+    try:
+        aristaproto.warmup("tests.outputs.bool", freeze=True)
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+
+def test_metadata_initialized_once():
+    from dataclasses import dataclass
+
+    @dataclass(eq=False, repr=False)
+    class Local(aristaproto.Message):
+        value: int = aristaproto.field(1, aristaproto.TYPE_INT32)
+
+    barrier = threading.Barrier(8)
+    metadata = []
+
+    def get_metadata():
+        barrier.wait()
+        metadata.append(Local._aristaproto)
+
+    threads = [threading.Thread(target=get_metadata) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(metadata) == 8
+    assert all(meta is metadata[0] for meta in metadata)
+
+
+def test_metadata_built_from_another_thread_while_building():
+    from dataclasses import dataclass
+
+    @dataclass(eq=False, repr=False)
+    class Other(aristaproto.Message):
+        value: int = aristaproto.field(1, aristaproto.TYPE_INT32)
+
+    @dataclass(eq=False, repr=False)
+    class Local(aristaproto.Message):
+        value: int = aristaproto.field(1, aristaproto.TYPE_INT32)
+
+        @staticmethod
+        def _aristaproto_field_types() -> dict[str, type]:
+            # Like a module imported while resolving the field types, which uses other classes from a new thread
+            thread = threading.Thread(target=lambda: Other._aristaproto, daemon=True)
+            thread.start()
+            thread.join(timeout=5)
+            assert not thread.is_alive()
+            return {"value": int}
+
+    assert Local._aristaproto.type_hints == {"value": int}
+    assert "_aristaproto_meta" in Other.__dict__
+
+
+@pytest.mark.parametrize(
+    "package", ["tests.outputs.conformance", "tests.outputs.googletypes", "tests.outputs.map", "tests.outputs.features"]
+)
+def test_field_types_match_annotations(package):
+    assert_field_types_match_annotations(package)
+
+
+def test_field_types_match_pydantic_annotations(requires_pydantic):
+    assert_field_types_match_annotations("tests.outputs.validation_pydantic")
@@ -1,12 +1,16 @@
 import importlib
 import os
+import sys
 from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 from types import ModuleType
+from typing import get_type_hints
 
 import pytest
 
+import aristaproto
+
 os.environ["PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION"] = "python"
 
 root_path = Path(__file__).resolve().parent
@@ -103,9 +107,25 @@ def requires_grpcio():
         pytest.skip("grpcio is not installed")
 
 
+@pytest.fixture
+def requires_numpy():
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        pytest.skip("numpy is not installed")
+
+
 @pytest.fixture
 def requires_protobuf():
     try:
         import google.protobuf  # noqa: F401
     except ImportError:
         pytest.skip("protobuf is not installed")
+
+
+def assert_field_types_match_annotations(package: str) -> None:
+    """Checks that the field types listed by the generated messages of a package match their annotations."""
+    for cls in aristaproto.warmup(package):
+        if "_aristaproto_field_types" in cls.__dict__:
+            module = sys.modules[cls.__module__]
+            assert cls._aristaproto_field_types() == get_type_hints(cls, module.__dict__, {})
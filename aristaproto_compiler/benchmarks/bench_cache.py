@@ -0,0 +1,76 @@
+"""
+Measures the time taken to generate a schema of many packages without the ``cache_dir`` option, with an empty cache,
+with a complete cache, and after changing one of the proto files.
+
+Run from the ``aristaproto_compiler`` directory with ``python -m benchmarks.bench_cache``.
+"""
+
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from tests.util import protoc
+
+PACKAGES = 100
+MESSAGES_PER_PACKAGE = 10
+
+
+def write_package(directory: Path, package_index: int, extra_field: bool = False) -> None:
+    lines = ['syntax = "proto3";', "", f"package package{package_index};", ""]
+    if package_index:
+        lines += [f'import "package{package_index - 1}.proto";', ""]
+
+    for index in range(MESSAGES_PER_PACKAGE):
+        lines += [
+            f"message Message{index} {{",
+            "  string name = 1;",
+            "  int64 value = 2;",
+            "  map<string, string> labels = 3;",
+        ]
+        if package_index:
+            # Each package references the previous one
+            lines.append(f"  package{package_index - 1}.Message{index} previous = 4;")
+        if extra_field:
+            lines.append("  bool extra = 5;")
+        lines += ["}", ""]
+
+    directory.joinpath(f"package{package_index}.proto").write_text("\n".join(lines))
+
+
+async def generation_time(input_dir: Path, output_dir: Path, cache_dir: Path | None) -> float:
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    start = time.perf_counter()
+    _, stderr, returncode = await protoc(input_dir, output_dir, cache_dir=cache_dir)
+    if returncode:
+        raise RuntimeError(stderr.decode())
+    return time.perf_counter() - start
+
+
+async def main_async() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        input_dir = Path(directory, "inputs")
+        input_dir.mkdir()
+        for package_index in range(PACKAGES):
+            write_package(input_dir, package_index)
+
+        output_dir = Path(directory, "outputs")
+        cache_dir = Path(directory, "cache")
+
+        print(f"{PACKAGES} packages of {MESSAGES_PER_PACKAGE} messages:")
+        print(f"  {'no cache':<12} {await generation_time(input_dir, output_dir, None):>8.2f} s")
+        print(f"  {'empty cache':<12} {await generation_time(input_dir, output_dir, cache_dir):>8.2f} s")
+        print(f"  {'full cache':<12} {await generation_time(input_dir, output_dir, cache_dir):>8.2f} s")
+
+        # The last package changes, which is not imported by the other ones
+        write_package(input_dir, PACKAGES - 1, extra_field=True)
+        print(f"  {'one change':<12} {await generation_time(input_dir, output_dir, cache_dir):>8.2f} s")
+
+
+def main() -> None:
+    asyncio.run(main_async())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Measures the time taken to import a generated package and use one of its messages, with the package generated in a
+single module and with the ``lazy_submodules`` option.
+
+The package is generated from a synthetic schema of many proto files. Run from the ``aristaproto_compiler`` directory
+with ``python -m benchmarks.bench_lazy_submodules``.
+"""
+
+import asyncio
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from tests.util import protoc
+
+FILES = 100
+MESSAGES_PER_FILE = 20
+RUNS = 5
+
+# Imports the package and encodes a message of the first file, in a new interpreter
+IMPORT_CODE = """
+import time
+
+start = time.perf_counter()
+from synthetic import synthetic
+
+bytes(synthetic.File0Message0(name="name", value=1))
+print(time.perf_counter() - start)
+"""
+
+
+def write_schema(directory: Path) -> None:
+    for file_index in range(FILES):
+        lines = ['syntax = "proto3";', "", "package synthetic;", ""]
+        if file_index:
+            lines += [f'import "file{file_index - 1}.proto";', ""]
+
+        for index in range(MESSAGES_PER_FILE):
+            lines += [
+                f"message File{file_index}Message{index} {{",
+                "  string name = 1;",
+                "  int64 value = 2;",
+                "  repeated double samples = 3;",
+                "  map<string, string> labels = 4;",
+            ]
+            if file_index:
+                # Each file references the previous one
+                lines.append(f"  File{file_index - 1}Message{index} previous = 5;")
+            lines += ["}", ""]
+
+        directory.joinpath(f"file{file_index}.proto").write_text("\n".join(lines))
+
+
+def import_time(output_dir: Path) -> float:
+    return min(
+        float(subprocess.check_output([sys.executable, "-c", IMPORT_CODE], cwd=output_dir, text=True))
+        for _ in range(RUNS)
+    )
+
+
+async def main_async() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        input_dir = Path(directory, "inputs")
+        input_dir.mkdir()
+        write_schema(input_dir)
+
+        print(f"{FILES} files of {MESSAGES_PER_FILE} messages:")
+        for label, lazy_submodules in (("module", False), ("lazy", True)):
+            output_dir = Path(directory, label, "synthetic")
+            output_dir.mkdir(parents=True)
+
+            _, stderr, returncode = await protoc(input_dir, output_dir, lazy_submodules=lazy_submodules)
+            if returncode:
+                raise RuntimeError(stderr.decode())
+
+            print(f"  {label:<8} import {import_time(output_dir.parent) * 1000:>8.1f} ms")
+
+
+def main() -> None:
+    asyncio.run(main_async())
+
+
+if __name__ == "__main__":
+    main()
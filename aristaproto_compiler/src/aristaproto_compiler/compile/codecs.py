@@ -0,0 +1,284 @@
+"""
+Generation of the encoding and decoding methods of the messages, for the `codegen_codecs` option.
+
+The generated methods do the same work as `Message.__bytes__` and `Message.parse`, with the field numbers, keys and
+types of the message written as constants instead of being looked up in the field metadata.
+"""
+
+from typing import TYPE_CHECKING
+
+import aristaproto
+from aristaproto import (
+    WIRE_FIXED_32,
+    WIRE_FIXED_64,
+    WIRE_LEN_DELIM,
+    WIRE_VARINT,
+    encode_varint,
+)
+
+if TYPE_CHECKING:
+    from aristaproto_compiler.plugin.models import FieldCompiler, MessageCompiler
+
+_INT_TYPES = (aristaproto.TYPE_INT32, aristaproto.TYPE_INT64, aristaproto.TYPE_UINT32, aristaproto.TYPE_UINT64)
+_VARINT_TYPES = (*_INT_TYPES, aristaproto.TYPE_SINT32, aristaproto.TYPE_SINT64, aristaproto.TYPE_BOOL)
+_PACK_FORMATS = {
+    aristaproto.TYPE_FLOAT: "f",
+    aristaproto.TYPE_FIXED32: "I",
+    aristaproto.TYPE_SFIXED32: "i",
+    aristaproto.TYPE_DOUBLE: "d",
+    aristaproto.TYPE_FIXED64: "Q",
+    aristaproto.TYPE_SFIXED64: "q",
+}
+_FIXED_SIZES = {"f": 4, "I": 4, "i": 4, "d": 8, "Q": 8, "q": 8}
+
+# Conversion of the integer read from a varint, named `value`, to the value of each type
+_VARINT_DECODERS = {
+    aristaproto.TYPE_INT32: "((value & 0xFFFFFFFF) ^ 0x80000000) - 0x80000000",
+    aristaproto.TYPE_INT64: "((value & 0xFFFFFFFFFFFFFFFF) ^ 0x8000000000000000) - 0x8000000000000000",
+    aristaproto.TYPE_UINT32: "value & 0xFFFFFFFF",
+    aristaproto.TYPE_UINT64: "value & 0xFFFFFFFFFFFFFFFF",
+    aristaproto.TYPE_SINT32: "((value & 0xFFFFFFFF) >> 1) ^ -(value & 1)",
+    aristaproto.TYPE_SINT64: "((value & 0xFFFFFFFFFFFFFFFF) >> 1) ^ -(value & 1)",
+    aristaproto.TYPE_BOOL: "value > 0",
+}
+
+
+def _proto_type(field: "FieldCompiler") -> str | None:
+    """The type of the field, as used by the runtime, or `None` if the methods can't handle it."""
+    from aristaproto_compiler.plugin.models import MapEntryCompiler
+
+    if isinstance(field, MapEntryCompiler):
+        return aristaproto.TYPE_MAP
+    return getattr(aristaproto, f"TYPE_{field.field_type.name}", None)
+
+
+def _wire_type(proto_type: str) -> int:
+    if proto_type in _VARINT_TYPES or proto_type == aristaproto.TYPE_ENUM:
+        return WIRE_VARINT
+    if proto_type in _PACK_FORMATS:
+        return WIRE_FIXED_32 if _FIXED_SIZES[_PACK_FORMATS[proto_type]] == 4 else WIRE_FIXED_64
+    return WIRE_LEN_DELIM
+
+
+def _key(number: int, wire_type: int) -> bytes:
+    return encode_varint((number << 3) | wire_type)
+
+
+def _type_reference(field: "FieldCompiler", proto_type: str) -> str:
+    """The class of an enum or message field, or the wrapper class of a wrapped field."""
+    if proto_type == aristaproto.TYPE_MESSAGE and field.is_wrapped:
+        return field.unwrapped_py_type
+    return field.py_type
+
+
+def supports_codecs(message: "MessageCompiler") -> bool:
+    """Whether the encoding and decoding methods are generated for the message."""
+    settings = message.output_file.settings
+    return (
+        settings.codegen_codecs
+        and not settings.pydantic_dataclasses
+        and all(_proto_type(field) is not None for field in message.fields)
+    )
+
+
+def encode_method_source(message: "MessageCompiler") -> str:
+    """Returns the source of the `_aristaproto_encode` method of the message."""
+    lines = [
+        "def _aristaproto_encode(self) -> bytes:",
+        "    values = self.__dict__",
+        "    encode_varint = aristaproto.encode_varint",
+        "    output = bytearray()",
+    ]
+
+    for field in message.fields:
+        proto_type = _proto_type(field)
+        assert proto_type is not None
+
+        lines.append(f'    value = values.get("{field.attribute_name}")')
+        # Like in `Message.__bytes__`, only the default values of the fields without presence are skipped
+        has_presence = field.optional and proto_type != aristaproto.TYPE_MAP
+        lines.append("    if value is not None:" if has_presence else "    if value:")
+        lines.extend(f"        {line}" for line in _encode_lines(field, proto_type))
+
+    lines.append("    output += self._unknown_fields")
+    lines.append("    return bytes(output)")
+    return "\n    ".join(lines)
+
+
+def _encode_lines(field: "FieldCompiler", proto_type: str) -> list[str]:
+    number = field.proto_obj.number
+
+    if proto_type == aristaproto.TYPE_MAP:
+        return [
+            f'codec = self._aristaproto.map_codecs["{field.attribute_name}"]',
+            "for key, item in value.items():",
+            "    output += codec.encode(key, item)",
+        ]
+
+    if field.repeated and proto_type in aristaproto.PACKED_TYPES:
+        if proto_type in _PACK_FORMATS:
+            data = f'struct.pack(f"<{{len(value)}}{_PACK_FORMATS[proto_type]}", *value)'
+        else:
+            data = f'b"".join([{_encode_varint_expression(proto_type, "item")} for item in value])'
+        return [
+            f"data = {data}",
+            f"output += {_key(number, WIRE_LEN_DELIM)!r}",
+            "output += encode_varint(len(data))",
+            "output += data",
+        ]
+
+    if field.repeated:
+        return [
+            "for item in value:",
+            *(f"    {line}" for line in _encode_single_lines(field, proto_type, "item")),
+        ]
+
+    return _encode_single_lines(field, proto_type, "value")
+
+
+def _encode_varint_expression(proto_type: str, name: str) -> str:
+    if proto_type in (aristaproto.TYPE_SINT32, aristaproto.TYPE_SINT64):
+        # Zig-zag encoding
+        return f"encode_varint({name} << 1 if {name} >= 0 else ({name} << 1) ^ -1)"
+    return f"encode_varint({name})"
+
+
+def _encode_single_lines(field: "FieldCompiler", proto_type: str, name: str) -> list[str]:
+    key = _key(field.proto_obj.number, _wire_type(proto_type))
+
+    if proto_type in _PACK_FORMATS:
+        return [f"output += {key!r}", f'output += struct.pack("<{_PACK_FORMATS[proto_type]}", {name})']
+    if _wire_type(proto_type) == WIRE_VARINT:
+        return [f"output += {key!r}", f"output += {_encode_varint_expression(proto_type, name)}"]
+
+    if proto_type == aristaproto.TYPE_STRING:
+        data = f"{name}.encode()"
+    elif proto_type == aristaproto.TYPE_BYTES:
+        data = name
+    elif field.is_wrapped:
+        data = f"{_type_reference(field, proto_type)}.encode_wrapped({name})"
+    else:
+        data = f"bytes({name})"
+
+    return [f"data = {data}", f"output += {key!r}", "output += encode_varint(len(data))", "output += data"]
+
+
+def decode_method_source(message: "MessageCompiler") -> str:
+    """Returns the source of the `_aristaproto_decode` method of the message."""
+    lines = [
+        "@classmethod",
+        "def _aristaproto_decode(cls, data: bytes) -> Self:",
+        "    msg = cls.construct()",
+        "    values = msg.__dict__",
+        "    decode_varint = aristaproto.decode_varint",
+        "    pos = 0",
+        "    end = len(data)",
+        # Enabled for the message with the `intern_strings` option or at runtime with `set_string_interning`
+        "    intern_strings = cls._aristaproto_intern_strings",
+        "    while pos < end:",
+        "        start = pos",
+        "        tag, pos = decode_varint(data, pos)",
+    ]
+
+    keyword = "if"
+    for field in message.fields:
+        proto_type = _proto_type(field)
+        assert proto_type is not None
+
+        branches = []
+        if field.repeated and proto_type in aristaproto.PACKED_TYPES:
+            # Parsers must accept both the packed and the unpacked encodings
+            branches.append((WIRE_LEN_DELIM, _decode_packed_lines(field, proto_type)))
+        branches.append((_wire_type(proto_type), _decode_lines(field, proto_type)))
+
+        for wire_type, body in branches:
+            lines.append(f"        {keyword} tag == {(field.proto_obj.number << 3) | wire_type}:")
+            lines.extend(f"            {line}" for line in body)
+            keyword = "elif"
+
+    # The unknown fields are kept as they are
+    indent = "        "
+    if keyword == "elif":
+        lines.append("        else:")
+        indent += "    "
+    lines.append(f"{indent}pos = aristaproto.skip_field(data, pos, tag & 7)")
+    lines.append(f"{indent}msg._unknown_fields += data[start:pos]")
+    lines.append("    return msg")
+    return "\n    ".join(lines)
+
+
+def _decode_lines(field: "FieldCompiler", proto_type: str) -> list[str]:
+    name = field.attribute_name
+
+    if proto_type == aristaproto.TYPE_MAP:
+        intern = "True" if field.intern else "intern_strings"
+        return [
+            "length, pos = decode_varint(data, pos)",
+            f'key, item = cls._aristaproto.map_codecs["{name}"].decode(data[pos : pos + length], {intern})',
+            "pos += length",
+            *_get_container_lines(name, "{}"),
+            "items[key] = item",
+        ]
+
+    lines = _decode_single_lines(field, proto_type)
+    if field.repeated:
+        return [*lines, *_get_container_lines(name, "[]"), "items.append(value)"]
+    return [*lines, f'values["{name}"] = value']
+
+
+def _get_container_lines(name: str, empty: str) -> list[str]:
+    return [f'items = values.get("{name}")', "if items is None:", f'    items = values["{name}"] = {empty}']
+
+
+def _decode_single_lines(field: "FieldCompiler", proto_type: str) -> list[str]:
+    """Lines reading the value at `pos` to the `value` variable."""
+    if proto_type in _PACK_FORMATS:
+        fmt = _PACK_FORMATS[proto_type]
+        return [
+            f'value = struct.unpack("<{fmt}", data[pos : pos + {_FIXED_SIZES[fmt]}])[0]',
+            f"pos += {_FIXED_SIZES[fmt]}",
+        ]
+
+    if _wire_type(proto_type) == WIRE_VARINT:
+        return ["value, pos = decode_varint(data, pos)", f"value = {_decode_varint_expression(field, proto_type)}"]
+
+    lines = ["length, pos = decode_varint(data, pos)", "chunk = data[pos : pos + length]", "pos += length"]
+    if proto_type == aristaproto.TYPE_STRING:
+        lines.append('value = str(chunk, "utf-8")')
+        if field.intern:
+            lines.append("value = aristaproto.default_intern_table(value)")
+        else:
+            lines += ["if intern_strings:", "    value = aristaproto.default_intern_table(value)"]
+    elif proto_type == aristaproto.TYPE_BYTES:
+        lines.append("value = chunk")
+    elif field.is_wrapped:
+        lines.append(f"value = {_type_reference(field, proto_type)}.decode_wrapped(chunk)")
+    else:
+        lines.append(f"value = {_type_reference(field, proto_type)}.parse(chunk)")
+    return lines
+
+
+def _decode_varint_expression(field: "FieldCompiler", proto_type: str) -> str:
+    if proto_type == aristaproto.TYPE_ENUM:
+        return f"{_type_reference(field, proto_type)}._from_value({_VARINT_DECODERS[aristaproto.TYPE_INT64]})"
+    return _VARINT_DECODERS[proto_type]
+
+
+def _decode_packed_lines(field: "FieldCompiler", proto_type: str) -> list[str]:
+    lines = ["length, pos = decode_varint(data, pos)", *_get_container_lines(field.attribute_name, "[]")]
+
+    if proto_type in _PACK_FORMATS:
+        fmt = _PACK_FORMATS[proto_type]
+        return [
+            *lines,
+            f'items.extend(struct.unpack(f"<{{length // {_FIXED_SIZES[fmt]}}}{fmt}", data[pos : pos + length]))',
+            "pos += length",
+        ]
+
+    return [
+        *lines,
+        "packed_end = pos + length",
+        "while pos < packed_end:",
+        "    value, pos = decode_varint(data, pos)",
+        f"    items.append({_decode_varint_expression(field, proto_type)})",
+    ]
@@ -9,7 +9,7 @@ from aristaproto_compiler.known_types import WRAPPED_TYPES
 from aristaproto_compiler.settings import Settings
 
 from ..casing import safe_snake_case
-from .naming import pythonize_class_name
+from .naming import pythonize_class_name, pythonize_submodule_name
 
 if TYPE_CHECKING:
     from ..plugin.models import PluginRequestCompiler
@@ -89,10 +89,14 @@ def get_type_reference(
     request: PluginRequestCompiler,
     wrap: bool = True,
     settings: Settings,
+    source_file_name: str | None = None,
 ) -> str:
     """
     Return a Python type name for a proto type reference. Adds the import if
     necessary. Unwraps well known type if required.
+
+    With the `lazy_submodules` option, `source_file_name` is the name of the proto file where the reference is made,
+    and the types defined by the other files of the package are referenced through their submodules.
     """
     source_package, source_type = parse_source_type_name(source_type, request)
 
@@ -100,6 +104,15 @@ def get_type_reference(
         return WRAPPED_TYPES[(source_package, source_type)]
 
     py_type: str = pythonize_class_name(source_type)
+
+    if settings.lazy_submodules and source_package == package and source_file_name is not None:
+        output_package = request.output_packages[source_package]
+        definition = output_package.messages.get(source_type) or output_package.enums[source_type]
+        submodule = pythonize_submodule_name(definition.source_file.name)
+        if submodule != pythonize_submodule_name(source_file_name):
+            imports.add(f"from . import {submodule}")
+            return f"{submodule}.{py_type}"
+
     (ref, _) = get_symbol_reference(
         package=package,
         imports=imports,
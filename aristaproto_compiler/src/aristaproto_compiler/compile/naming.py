@@ -1,3 +1,5 @@
+import re
+
 from aristaproto_compiler import casing
 
 
@@ -19,3 +21,8 @@ def pythonize_enum_member_name(name: str, enum_name: str) -> str:
     if find != -1:
         name = name[find + len(enum_name) :].strip("_")
     return casing.sanitize_name(name)
+
+
+def pythonize_submodule_name(proto_file_name: str) -> str:
+    """Name of the submodule defining the types of a proto file, with the `lazy_submodules` option."""
+    return "_" + re.sub(r"\W", "_", proto_file_name.removesuffix(".proto"))
@@ -0,0 +1,71 @@
+"""
+Generation of the `.pyi` stubs of the modules, for the `documented_stubs` option.
+
+The stubs keep the declarations and the documentation of the generated modules, so that the IDEs can show the
+documentation of the modules generated with the `strip_comments` option.
+"""
+
+import ast
+
+
+def stub_source(code: str) -> str:
+    """
+    Return the source of the stub of a module, which is not formatted.
+
+    The module-level statements other than the imports, definitions and assignments are deleted, and the body of each
+    function is replaced by its docstring followed by an ellipsis. The source is edited in place to keep the layout of
+    the docstrings.
+
+    Parameters
+    -----------
+    code: :class:`str`
+        The formatted source of the module.
+    """
+    lines = code.splitlines()
+
+    # Replacements of the ranges of lines, as the index of the first line, the index after the last line and the new
+    # lines
+    edits: list[tuple[int, int, list[str]]] = []
+
+    def visit_body(body: list[ast.stmt], module_level: bool) -> None:
+        for statement in body:
+            if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                visit_function(statement)
+            elif isinstance(statement, ast.ClassDef):
+                visit_body(statement.body, module_level=False)
+            elif isinstance(statement, ast.If):
+                visit_body(statement.body, module_level)
+                visit_body(statement.orelse, module_level)
+            elif module_level and isinstance(statement, ast.Expr):
+                # Registrations and checks run on import
+                edits.append((statement.lineno - 1, _end(statement), []))
+
+    def visit_function(function: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        body = function.body
+        if _is_docstring(body[0]):
+            body = body[1:]
+        if not body:
+            return
+
+        indentation = " " * body[0].col_offset
+        edits.append((body[0].lineno - 1, _end(body[-1]), [f"{indentation}..."]))
+
+    visit_body(ast.parse(code).body, module_level=True)
+
+    for start, end, replacement in sorted(edits, reverse=True):
+        lines[start:end] = replacement
+
+    return "\n".join(lines) + "\n"
+
+
+def _is_docstring(statement: ast.stmt) -> bool:
+    return (
+        isinstance(statement, ast.Expr)
+        and isinstance(statement.value, ast.Constant)
+        and isinstance(statement.value.value, str)
+    )
+
+
+def _end(statement: ast.stmt) -> int:
+    assert statement.end_lineno is not None
+    return statement.end_lineno
@@ -19,7 +19,18 @@ from .timestamp import Timestamp
 # For each (package, message name), lists the methods that should be added to the message definition.
 # The source code of the method is read from the `known_types` folder.
 KNOWN_METHODS: dict[tuple[str, str], list[Callable]] = {
-    ("google.protobuf", "Any"): [Any.pack, Any.unpack, Any.to_dict, Any.from_dict],
+    ("google.protobuf", "Any"): [
+        Any.pack,
+        Any.unpack,
+        Any._encode_pending,
+        Any.__getattr__,
+        Any.__bytes__,
+        Any.__eq__,
+        Any.__copy__,
+        Any.__deepcopy__,
+        Any.to_dict,
+        Any.from_dict,
+    ],
     ("google.protobuf", "Timestamp"): [
         Timestamp.from_datetime,
         Timestamp.to_datetime,
@@ -28,6 +39,8 @@ KNOWN_METHODS: dict[tuple[str, str], list[Callable]] = {
         Timestamp.to_dict,
         Timestamp.from_wrapped,
         Timestamp.to_wrapped,
+        Timestamp.decode_wrapped,
+        Timestamp.encode_wrapped,
     ],
     ("google.protobuf", "Duration"): [
         Duration.from_timedelta,
@@ -37,78 +50,117 @@ KNOWN_METHODS: dict[tuple[str, str], list[Callable]] = {
         Duration.to_dict,
         Duration.from_wrapped,
         Duration.to_wrapped,
+        Duration.decode_wrapped,
+        Duration.encode_wrapped,
     ],
     ("google.protobuf", "BoolValue"): [
         BoolValue.from_dict,
         BoolValue.to_dict,
         BoolValue.from_wrapped,
         BoolValue.to_wrapped,
+        BoolValue.decode_wrapped,
+        BoolValue.encode_wrapped,
     ],
     ("google.protobuf", "Int32Value"): [
         Int32Value.from_dict,
         Int32Value.to_dict,
         Int32Value.from_wrapped,
         Int32Value.to_wrapped,
+        Int32Value.decode_wrapped,
+        Int32Value.encode_wrapped,
     ],
     ("google.protobuf", "Int64Value"): [
         Int64Value.from_dict,
         Int64Value.to_dict,
         Int64Value.from_wrapped,
         Int64Value.to_wrapped,
+        Int64Value.decode_wrapped,
+        Int64Value.encode_wrapped,
     ],
     ("google.protobuf", "UInt32Value"): [
         UInt32Value.from_dict,
         UInt32Value.to_dict,
         UInt32Value.from_wrapped,
         UInt32Value.to_wrapped,
+        UInt32Value.decode_wrapped,
+        UInt32Value.encode_wrapped,
     ],
     ("google.protobuf", "UInt64Value"): [
         UInt64Value.from_dict,
         UInt64Value.to_dict,
         UInt64Value.from_wrapped,
         UInt64Value.to_wrapped,
+        UInt64Value.decode_wrapped,
+        UInt64Value.encode_wrapped,
     ],
     ("google.protobuf", "FloatValue"): [
         FloatValue.from_dict,
         FloatValue.to_dict,
         FloatValue.from_wrapped,
         FloatValue.to_wrapped,
+        FloatValue.decode_wrapped,
+        FloatValue.encode_wrapped,
     ],
     ("google.protobuf", "DoubleValue"): [
         DoubleValue.from_dict,
         DoubleValue.to_dict,
         DoubleValue.from_wrapped,
         DoubleValue.to_wrapped,
+        DoubleValue.decode_wrapped,
+        DoubleValue.encode_wrapped,
     ],
     ("google.protobuf", "StringValue"): [
         StringValue.from_dict,
         StringValue.to_dict,
         StringValue.from_wrapped,
         StringValue.to_wrapped,
+        StringValue.decode_wrapped,
+        StringValue.encode_wrapped,
     ],
     ("google.protobuf", "BytesValue"): [
         BytesValue.from_dict,
         BytesValue.to_dict,
         BytesValue.from_wrapped,
         BytesValue.to_wrapped,
+        BytesValue.decode_wrapped,
+        BytesValue.encode_wrapped,
     ],
     ("google.protobuf", "Struct"): [
+        Struct.parse,
+        Struct._from_pending,
+        Struct._decode_pending,
+        Struct.__getattr__,
+        Struct._is_field_set,
+        Struct.__bytes__,
+        Struct.__eq__,
+        Struct.__copy__,
+        Struct.__deepcopy__,
         Struct.from_dict,
         Struct.to_dict,
+        Struct.bytes_to_python,
+        Struct.python_to_bytes,
     ],
     ("google.protobuf", "ListValue"): [
         ListValue.from_dict,
         ListValue.to_dict,
+        ListValue.bytes_to_python,
+        ListValue.python_to_bytes,
     ],
     ("google.protobuf", "Value"): [
         Value.from_dict,
         Value.to_dict,
+        Value.bytes_to_python,
+        Value.python_to_bytes,
+        Value.copy_python,
+        Value._skip_field,
     ],
 }
 
 # For each (package, message name), lists imports required by known-type methods.
 KNOWN_IMPORTS: dict[tuple[str, str], tuple[str, ...]] = {
     ("google.protobuf", "Timestamp"): ("from aristaproto.nano_datetime import NanoDatetime",),
+    ("google.protobuf", "BytesValue"): ("from base64 import b64decode, b64encode",),
+    ("google.protobuf", "Value"): ("import struct",),
 }
 
 # A wrapped type is the type of a message that is automatically replaced by a known Python type.
@@ -10,19 +10,30 @@ default_message_pool = aristaproto.MessagePool()  # Only for typing purpose
 
 class Any(VanillaAny):
     @classmethod
-    def pack(cls, message: aristaproto.Message, message_pool: "aristaproto.MessagePool | None" = None) -> "Any":
+    def pack(
+        cls, message: aristaproto.Message, message_pool: "aristaproto.MessagePool | None" = None, *, lazy: bool = False
+    ) -> "Any":
         """
         Pack the given message in the `Any` object.
 
         The message type must be registered in the message pool, which is done automatically when the module defining
         the message type is imported.
+
+        If `lazy` is set, the message is only encoded when the `Any` object is serialized, compared or copied, or when
+        its `value` is read. The message is not copied, so the changes made to it until then are included in the `Any`
+        object, and `unpack` returns the message itself.
         """
         message_pool = message_pool or default_message_pool
 
         type_url = message_pool.type_to_url[type(message)]
-        value = bytes(message)
+        if not lazy:
+            return cls(type_url=type_url, value=bytes(message))
 
-        return cls(type_url=type_url, value=value)
+        packed = cls(type_url=type_url)
+        # The value is left unset until it is encoded, which is done by `__getattr__` when it is read
+        del packed.__dict__["value"]
+        packed.__dict__["_pending"] = (type_url, message)
+        return packed
 
     def unpack(self, message_pool: "aristaproto.MessagePool | None" = None) -> aristaproto.Message | None:
         """
@@ -30,42 +41,106 @@ class Any(VanillaAny):
 
         The target message type must be registered in the message pool, which is done automatically when the module
         defining the message type is imported.
+
+        The unpacked message is cached until `type_url` or `value` are changed, and the same instance is returned by
+        the next calls, so it must not be modified. A message packed lazily is returned as it is, without being encoded.
         """
-        if not self.type_url:
+        values = self.__dict__
+        type_url = values["type_url"]
+        if not type_url:
             return None
 
+        if "value" not in values:
+            pending_type_url, message = values["_pending"]
+            if pending_type_url == type_url:
+                return message
+
         message_pool = message_pool or default_message_pool
+        value = self.value
+
+        cached = values.get("_unpacked")
+        if cached is not None and cached[0] == type_url and cached[1] is value and cached[2] is message_pool:
+            return cached[3]
 
         try:
-            message_type = message_pool.url_to_type[self.type_url]
+            message_type = message_pool.url_to_type[type_url]
         except KeyError:
-            raise TypeError(f"Can't unpack unregistered type: {self.type_url}")
-
-        return message_type.parse(self.value)
+            raise TypeError(f"Can't unpack unregistered type: {type_url}")
 
-    def to_dict(self, **kwargs) -> dict[str, typing.Any]:
-        # TODO allow passing a message pool to `to_dict`
+        message = message_type.parse(value)
+        values["_unpacked"] = (type_url, value, message_pool, message)
+        return message
+
+    def _encode_pending(self) -> None:
+        # Encodes the message packed lazily, unless `type_url` was changed since
+        values = self.__dict__
+        if "value" not in values:
+            type_url, message = values.pop("_pending")
+            values["value"] = bytes(message) if type_url == values["type_url"] else b""
+
+    def __getattr__(self, name: str) -> typing.Any:
+        # Only called when the attribute is not set, which is the case of the value of a message packed lazily
+        if name == "value" and "_pending" in self.__dict__:
+            self._encode_pending()
+            return self.__dict__["value"]
+        return super().__getattr__(name)
+
+    def __bytes__(self) -> bytes:
+        self._encode_pending()
+        return super().__bytes__()
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Any):
+            self._encode_pending()
+            other._encode_pending()
+        return super().__eq__(other)
+
+    def __copy__(self, _: typing.Any = {}) -> Self:
+        self._encode_pending()
+        return super().__copy__()
+
+    def __deepcopy__(self, _: typing.Any = {}) -> Self:
+        self._encode_pending()
+        return super().__deepcopy__()
+
+    def to_dict(self, *, message_pool: "aristaproto.MessagePool | None" = None, **kwargs) -> dict[str, typing.Any]:
         output: dict[str, typing.Any] = {"@type": self.type_url}
 
-        value = self.unpack()
+        # The pool is also used by the `Any` messages nested in the value
+        message_pool = message_pool or aristaproto.message_pool.current_message_pool.get()
+
+        value = self.unpack(message_pool)
 
         if value is None:
             return output
 
-        if type(value).to_dict == aristaproto.Message.to_dict:
-            output.update(value.to_dict(**kwargs))
-        else:
-            output["value"] = value.to_dict(**kwargs)
+        token = aristaproto.message_pool.current_message_pool.set(message_pool)
+        try:
+            if type(value).to_dict == aristaproto.Message.to_dict:
+                output.update(value.to_dict(**kwargs))
+            else:
+                output["value"] = value.to_dict(**kwargs)
+        finally:
+            aristaproto.message_pool.current_message_pool.reset(token)
 
         return output
 
     # TODO typing
     @classmethod
-    def from_dict(cls, value, *, ignore_unknown_fields: bool = False) -> Self:
+    def from_dict(
+        cls,
+        value,
+        *,
+        ignore_unknown_fields: bool = False,
+        message_pool: "aristaproto.MessagePool | None" = None,
+    ) -> Self:
         value = dict(value)  # Make a copy
 
+        # The pool is also used by the `Any` messages nested in the value
+        message_pool = message_pool or aristaproto.message_pool.current_message_pool.get()
+
         type_url = value.pop("@type", None)
-        msg_cls = default_message_pool.url_to_type.get(type_url, None)
+        msg_cls = (message_pool or default_message_pool).url_to_type.get(type_url, None)
 
         if not msg_cls:
             raise TypeError(f"Can't unpack unregistered type: {type_url}")
@@ -73,6 +148,14 @@ class Any(VanillaAny):
         if not msg_cls.to_dict == aristaproto.Message.to_dict:
             value = value["value"]
 
-        return cls(
-            type_url=type_url, value=bytes(msg_cls.from_dict(value, ignore_unknown_fields=ignore_unknown_fields))
-        )
+        token = aristaproto.message_pool.current_message_pool.set(message_pool)
+        try:
+            message = msg_cls.from_dict(value, ignore_unknown_fields=ignore_unknown_fields)
+        finally:
+            aristaproto.message_pool.current_message_pool.reset(token)
+
+        # The message is only encoded when the value is needed
+        packed = cls(type_url=type_url)
+        del packed.__dict__["value"]
+        packed.__dict__["_pending"] = (type_url, message)
+        return packed
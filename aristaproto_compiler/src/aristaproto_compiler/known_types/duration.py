@@ -1,5 +1,4 @@
 import datetime
-import re
 import typing
 
 import aristaproto
@@ -10,34 +9,51 @@ from aristaproto_compiler.lib.google.protobuf import Duration as VanillaDuration
 
 class Duration(VanillaDuration):
     @classmethod
-    def from_timedelta(
-        cls, delta: datetime.timedelta, *, _1_microsecond: datetime.timedelta = datetime.timedelta(microseconds=1)
-    ) -> "Duration":
-        total_ms = delta // _1_microsecond
-        seconds = int(total_ms / 1e6)
-        nanos = int((total_ms % 1e6) * 1e3)
-        return cls(seconds, nanos)
+    def from_timedelta(cls, delta: datetime.timedelta) -> "Duration":
+        # The seconds and the nanos have the same sign
+        micros = (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+        seconds, micros = divmod(abs(micros), 1_000_000)
+        if delta < datetime.timedelta(0):
+            return cls(-seconds, -micros * 1000)
+        return cls(seconds, micros * 1000)
 
     def to_timedelta(self) -> datetime.timedelta:
         return datetime.timedelta(seconds=self.seconds, microseconds=self.nanos / 1e3)
 
     @staticmethod
     def delta_to_json(delta: datetime.timedelta) -> str:
-        parts = str(delta.total_seconds()).split(".")
-        if len(parts) > 1:
-            while len(parts[1]) not in (3, 6, 9):
-                parts[1] = f"{parts[1]}0"
-        return f"{'.'.join(parts)}s"
+        micros = (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+        sign = "-" if micros < 0 else ""
+        seconds, micros = divmod(abs(micros), 1_000_000)
+        if micros == 0:
+            return f"{sign}{seconds}s"
+        if micros % 1_000 == 0:
+            return f"{sign}{seconds}.{micros // 1_000:03d}s"
+        return f"{sign}{seconds}.{micros:06d}s"
 
     # TODO typing
     @classmethod
     def from_dict(cls, value, *, ignore_unknown_fields: bool = False) -> Self:
         if isinstance(value, str):
-            if not re.match(r"^\d+(\.\d+)?s$", value):
+            # The seconds and the fraction are parsed as integers, so that no precision is lost
+            seconds, dot, fraction = value[:-1].partition(".")
+            negative = seconds.startswith("-")
+            if negative:
+                seconds = seconds[1:]
+
+            if not (
+                value.endswith("s")
+                and seconds.isascii()
+                and seconds.isdigit()
+                and (not dot or (fraction.isascii() and fraction.isdigit()))
+            ):
                 raise ValueError(f"Invalid duration string: {value}")
 
-            seconds = float(value[:-1])
-            return cls(seconds=int(seconds), nanos=int((seconds - int(seconds)) * 1e9))
+            # The digits after the nanoseconds are truncated
+            nanos = int(fraction[:9].ljust(9, "0")) if fraction else 0
+            if negative:
+                return cls(seconds=-int(seconds), nanos=-nanos)
+            return cls(seconds=int(seconds), nanos=nanos)
 
         return super().from_dict(value, ignore_unknown_fields=ignore_unknown_fields)
 
@@ -52,16 +68,20 @@ class Duration(VanillaDuration):
         # If the output format is PYTHON, we should have kept the wrapped type without building the real class
         assert output_format == aristaproto.OutputFormat.PROTO_JSON
 
-        assert 0 <= self.nanos < 1e9
+        assert -1e9 < self.nanos < 1e9
 
         if self.nanos == 0:
             return f"{self.seconds}s"
 
-        nanos = f"{self.nanos:09d}".rstrip("0")
-        if len(nanos) < 3:
-            nanos += "0" * (3 - len(nanos))
-
-        return f"{self.seconds}.{nanos}s"
+        # The fraction of second uses 3, 6 or 9 digits
+        sign = "-" if self.seconds < 0 or self.nanos < 0 else ""
+        seconds = abs(self.seconds)
+        nanos = abs(self.nanos)
+        if nanos % 1_000_000 == 0:
+            return f"{sign}{seconds}.{nanos // 1_000_000:03d}s"
+        if nanos % 1_000 == 0:
+            return f"{sign}{seconds}.{nanos // 1_000:06d}s"
+        return f"{sign}{seconds}.{nanos:09d}s"
 
     @staticmethod
     def from_wrapped(wrapped: datetime.timedelta) -> "Duration":
@@ -69,3 +89,15 @@ class Duration(VanillaDuration):
 
     def to_wrapped(self) -> datetime.timedelta:
         return self.to_timedelta()
+
+    @staticmethod
+    def decode_wrapped(data: bytes) -> datetime.timedelta:
+        seconds, nanos = aristaproto.decode_scalar_fields(data, (aristaproto.TYPE_INT64, aristaproto.TYPE_INT32))
+        return datetime.timedelta(seconds=seconds, microseconds=nanos / 1e3)
+
+    @staticmethod
+    def encode_wrapped(wrapped: datetime.timedelta) -> bytes:
+        duration = Duration.from_timedelta(wrapped)
+        return aristaproto.encode_scalar_fields(
+            (duration.seconds, duration.nanos), (aristaproto.TYPE_INT64, aristaproto.TYPE_INT32)
+        )
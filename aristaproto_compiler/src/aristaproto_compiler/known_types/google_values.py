@@ -1,4 +1,5 @@
 import typing
+from base64 import b64decode, b64encode
 
 import aristaproto
 from typing_extensions import Self
@@ -24,6 +25,14 @@ class BoolValue(VanillaBoolValue):
     def to_wrapped(self) -> bool:
         return self.value
 
+    @staticmethod
+    def decode_wrapped(data: bytes) -> bool:
+        return aristaproto.decode_scalar_fields(data, (aristaproto.TYPE_BOOL,))[0]
+
+    @staticmethod
+    def encode_wrapped(wrapped: bool) -> bytes:
+        return aristaproto.encode_scalar_fields((wrapped,), (aristaproto.TYPE_BOOL,))
+
     @classmethod
     def from_dict(cls, value, *, ignore_unknown_fields: bool = False) -> Self:
         if isinstance(value, bool):
@@ -48,6 +57,14 @@ class Int32Value(VanillaInt32Value):
     def to_wrapped(self) -> int:
         return self.value
 
+    @staticmethod
+    def decode_wrapped(data: bytes) -> int:
+        return aristaproto.decode_scalar_fields(data, (aristaproto.TYPE_INT32,))[0]
+
+    @staticmethod
+    def encode_wrapped(wrapped: int) -> bytes:
+        return aristaproto.encode_scalar_fields((wrapped,), (aristaproto.TYPE_INT32,))
+
     @classmethod
     def from_dict(cls, value, *, ignore_unknown_fields: bool = False) -> Self:
         if isinstance(value, int):
@@ -72,6 +89,14 @@ class Int64Value(VanillaInt64Value):
     def to_wrapped(self) -> int:
         return self.value
 
+    @staticmethod
+    def decode_wrapped(data: bytes) -> int:
+        return aristaproto.decode_scalar_fields(data, (aristaproto.TYPE_INT64,))[0]
+
+    @staticmethod
+    def encode_wrapped(wrapped: int) -> bytes:
+        return aristaproto.encode_scalar_fields((wrapped,), (aristaproto.TYPE_INT64,))
+
     @classmethod
     def from_dict(cls, value, *, ignore_unknown_fields: bool = False) -> Self:
         if isinstance(value, int):
@@ -96,6 +121,14 @@ class UInt32Value(VanillaUInt32Value):
     def to_wrapped(self) -> int:
         return self.value
 
+    @staticmethod
+    def decode_wrapped(data: bytes) -> int:
+        return aristaproto.decode_scalar_fields(data, (aristaproto.TYPE_UINT32,))[0]
+
+    @staticmethod
+    def encode_wrapped(wrapped: int) -> bytes:
+        return aristaproto.encode_scalar_fields((wrapped,), (aristaproto.TYPE_UINT32,))
+
     @classmethod
     def from_dict(cls, value, *, ignore_unknown_fields: bool = False) -> Self:
         if isinstance(value, int):
@@ -120,6 +153,14 @@ class UInt64Value(VanillaUInt64Value):
     def to_wrapped(self) -> int:
         return self.value
 
+    @staticmethod
+    def decode_wrapped(data: bytes) -> int:
+        return aristaproto.decode_scalar_fields(data, (aristaproto.TYPE_UINT64,))[0]
+
+    @staticmethod
+    def encode_wrapped(wrapped: int) -> bytes:
+        return aristaproto.encode_scalar_fields((wrapped,), (aristaproto.TYPE_UINT64,))
+
     @classmethod
     def from_dict(cls, value, *, ignore_unknown_fields: bool = False) -> Self:
         if isinstance(value, int):
@@ -144,6 +185,14 @@ class FloatValue(VanillaFloatValue):
     def to_wrapped(self) -> float:
         return self.value
 
+    @staticmethod
+    def decode_wrapped(data: bytes) -> float:
+        return aristaproto.decode_scalar_fields(data, (aristaproto.TYPE_FLOAT,))[0]
+
+    @staticmethod
+    def encode_wrapped(wrapped: float) -> bytes:
+        return aristaproto.encode_scalar_fields((wrapped,), (aristaproto.TYPE_FLOAT,))
+
     @classmethod
     def from_dict(cls, value, *, ignore_unknown_fields: bool = False) -> Self:
         if isinstance(value, float):
@@ -168,6 +217,14 @@ class DoubleValue(VanillaDoubleValue):
     def to_wrapped(self) -> float:
         return self.value
 
+    @staticmethod
+    def decode_wrapped(data: bytes) -> float:
+        return aristaproto.decode_scalar_fields(data, (aristaproto.TYPE_DOUBLE,))[0]
+
+    @staticmethod
+    def encode_wrapped(wrapped: float) -> bytes:
+        return aristaproto.encode_scalar_fields((wrapped,), (aristaproto.TYPE_DOUBLE,))
+
     @classmethod
     def from_dict(cls, value, *, ignore_unknown_fields: bool = False) -> Self:
         if isinstance(value, float):
@@ -192,6 +249,18 @@ class StringValue(VanillaStringValue):
     def to_wrapped(self) -> str:
         return self.value
 
+    @staticmethod
+    def decode_wrapped(data: bytes) -> str:
+        value = aristaproto.decode_scalar_fields(data, (aristaproto.TYPE_STRING,))[0]
+        # Interned like the strings parsed by `StringValue.parse`
+        if StringValue._aristaproto_intern_strings:
+            value = aristaproto.default_intern_table(value)
+        return value
+
+    @staticmethod
+    def encode_wrapped(wrapped: str) -> bytes:
+        return aristaproto.encode_scalar_fields((wrapped,), (aristaproto.TYPE_STRING,))
+
     @classmethod
     def from_dict(cls, value, *, ignore_unknown_fields: bool = False) -> Self:
         if isinstance(value, str):
@@ -216,10 +285,20 @@ class BytesValue(VanillaBytesValue):
     def to_wrapped(self) -> bytes:
         return self.value
 
+    @staticmethod
+    def decode_wrapped(data: bytes) -> bytes:
+        return aristaproto.decode_scalar_fields(data, (aristaproto.TYPE_BYTES,))[0]
+
+    @staticmethod
+    def encode_wrapped(wrapped: bytes) -> bytes:
+        return aristaproto.encode_scalar_fields((wrapped,), (aristaproto.TYPE_BYTES,))
+
     @classmethod
     def from_dict(cls, value, *, ignore_unknown_fields: bool = False) -> Self:
         if isinstance(value, bytes):
             return cls(value=value)
+        if isinstance(value, str):
+            return cls(value=b64decode(value))
         return super().from_dict(value, ignore_unknown_fields=ignore_unknown_fields)
 
     def to_dict(
@@ -229,4 +308,6 @@ class BytesValue(VanillaBytesValue):
         casing: aristaproto.Casing = aristaproto.Casing.CAMEL,
         include_default_values: bool = False,
     ) -> dict[str, typing.Any] | typing.Any:
-        return self.value
+        if output_format == aristaproto.OutputFormat.PYTHON:
+            return self.value
+        return b64encode(self.value).decode("utf8")
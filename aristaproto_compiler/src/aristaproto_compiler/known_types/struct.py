@@ -1,3 +1,4 @@
+import struct
 import typing
 
 import aristaproto
@@ -12,17 +13,79 @@ from aristaproto_compiler.lib.google.protobuf import (
 
 
 class Struct(VanillaStruct):
+    @classmethod
+    def parse(cls, data: bytes, *, zero_copy: bool = False) -> Self:
+        """
+        Parse the binary encoded Protobuf into a new message instance.
+
+        The fields are only decoded when they are first accessed. Until then, the conversions with `to_dict` and
+        `bytes` use the binary data directly, without building the intermediate messages.
+        """
+        return cls._from_pending(bytes(data))
+
+    @classmethod
+    def _from_pending(cls, data: bytes | dict[str, typing.Any]) -> Self:
+        # The fields are left unset until they are decoded from the binary data or the plain Python values, which are
+        # never modified
+        msg = cls.construct()
+        msg.__dict__["_pending"] = data
+        return msg
+
+    def _decode_pending(self) -> None:
+        # Decodes the binary data of a message parsed or built from a dict, unless the fields were set since
+        values = self.__dict__
+        data = values.pop("_pending", None)
+        if data is None or "fields" in values:
+            return
+        if isinstance(data, bytes):
+            values["fields"] = super().parse(data).fields
+        else:
+            values["fields"] = {key: Value.from_dict(item) for key, item in data.items()}
+
+    def __getattr__(self, name: str) -> typing.Any:
+        # Only called when the attribute is not set, which is the case of the fields that are not decoded yet
+        if name == "fields" and "_pending" in self.__dict__:
+            self._decode_pending()
+            return self.__dict__["fields"]
+        return super().__getattr__(name)
+
+    def _is_field_set(self, field_name: str) -> bool:
+        self._decode_pending()
+        return super()._is_field_set(field_name)
+
+    def __bytes__(self) -> bytes:
+        values = self.__dict__
+        if "_pending" in values and "fields" not in values:
+            data = values["_pending"]
+            return data if isinstance(data, bytes) else Struct.python_to_bytes(data)
+        return super().__bytes__()
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Struct):
+            self._decode_pending()
+            other._decode_pending()
+        return super().__eq__(other)
+
+    def __copy__(self, _: typing.Any = {}) -> Self:
+        values = self.__dict__
+        if "_pending" in values and "fields" not in values:
+            # The pending data is never modified and can be shared
+            return self._from_pending(values["_pending"])
+        return super().__copy__()
+
+    def __deepcopy__(self, _: typing.Any = {}) -> Self:
+        values = self.__dict__
+        if "_pending" in values and "fields" not in values:
+            return self._from_pending(values["_pending"])
+        return super().__deepcopy__()
+
     # TODO typing
     @classmethod
     def from_dict(cls, value, *, ignore_unknown_fields: bool = False) -> Self:
         assert isinstance(value, dict)
 
-        fields: dict[str, Value] = {}
-
-        for key, val in value.items():
-            fields[key] = Value.from_dict(val)
-
-        return cls(fields=fields)  # type: ignore[reportArgumentType]
+        # The values are copied and checked, and only converted to messages if the fields are accessed
+        return cls._from_pending(Value.copy_python(value))
 
     # TODO typing
     def to_dict(
@@ -35,6 +98,11 @@ class Struct(VanillaStruct):
         # If the output format is PYTHON, we should have kept the wrapped type without building the real class
         assert output_format == aristaproto.OutputFormat.PROTO_JSON
 
+        values = self.__dict__
+        if "_pending" in values and "fields" not in values:
+            data = values["_pending"]
+            return Struct.bytes_to_python(data) if isinstance(data, bytes) else Value.copy_python(data)
+
         return {
             key: value.to_dict(
                 output_format=output_format, casing=casing, include_default_values=include_default_values
@@ -42,6 +110,75 @@ class Struct(VanillaStruct):
             for key, value in self.fields.items()
         }
 
+    @staticmethod
+    def bytes_to_python(data: bytes) -> dict[str, typing.Any]:
+        """
+        Decode a binary encoded ``Struct`` directly to a dict of plain Python values, as returned by ``to_dict``,
+        without building the intermediate messages.
+        """
+        result = {}
+        pos = 0
+        end = len(data)
+        while pos < end:
+            num_wire, pos = aristaproto.decode_varint(data, pos)
+            wire_type = num_wire & 0x7
+            if wire_type != aristaproto.WIRE_LEN_DELIM:
+                pos = Value._skip_field(data, pos, wire_type)
+                continue
+
+            length, pos = aristaproto.decode_varint(data, pos)
+            entry_end = pos + length
+            if num_wire >> 3 != 1:
+                pos = entry_end
+                continue
+
+            # Map entry, with the key as field 1 and the value as field 2
+            key = ""
+            value = b""
+            while pos < entry_end:
+                entry_num_wire, pos = aristaproto.decode_varint(data, pos)
+                if entry_num_wire & 0x7 != aristaproto.WIRE_LEN_DELIM:
+                    pos = Value._skip_field(data, pos, entry_num_wire & 0x7)
+                    continue
+                length, pos = aristaproto.decode_varint(data, pos)
+                if entry_num_wire >> 3 == 1:
+                    key = str(data[pos : pos + length], "utf-8")
+                elif entry_num_wire >> 3 == 2:
+                    value = data[pos : pos + length]
+                pos += length
+
+            result[key] = Value.bytes_to_python(value)
+
+        return result
+
+    @staticmethod
+    def python_to_bytes(value: dict[str, typing.Any]) -> bytes:
+        """
+        Encode a dict of plain Python values directly as a binary encoded ``Struct``, without building the
+        intermediate messages. The output is the same as ``bytes(Struct.from_dict(value))``.
+        """
+        assert isinstance(value, dict)
+
+        chunks = []
+        for key, item in value.items():
+            key_bytes = key.encode("utf-8")
+            item_bytes = Value.python_to_bytes(item)
+            entry = b"".join(
+                (
+                    b"\n",
+                    aristaproto.encode_varint(len(key_bytes)),
+                    key_bytes,
+                    b"\x12",
+                    aristaproto.encode_varint(len(item_bytes)),
+                    item_bytes,
+                )
+            )
+            chunks.append(b"\n")
+            chunks.append(aristaproto.encode_varint(len(entry)))
+            chunks.append(entry)
+
+        return b"".join(chunks)
+
 
 # We can't use the unwrap mechanism to support directly using a Python object due to the None case: it would then be
 # impossible to distinguish between the absence of the message and a None value.
@@ -86,11 +223,110 @@ class Value(VanillaValue):
                 return s
             case Value(list_value=ListValue(values=l)):
                 return [v.to_dict() for v in l]
-            case Value(struct_value=Struct(fields=f)):
-                return {k: v.to_dict() for k, v in f.items()}
+            case Value(struct_value=Struct() as s):
+                # Without reading the fields, which may not be decoded yet
+                return s.to_dict()
 
         raise ValueError("Invalid value")
 
+    @staticmethod
+    def bytes_to_python(data: bytes) -> typing.Any:
+        """
+        Decode a binary encoded ``Value`` directly to a plain Python value, as returned by ``to_dict``, without
+        building the intermediate messages.
+        """
+        result = None
+        has_kind = False
+        pos = 0
+        end = len(data)
+        while pos < end:
+            num_wire, pos = aristaproto.decode_varint(data, pos)
+            number = num_wire >> 3
+            wire_type = num_wire & 0x7
+
+            if number == 1 and wire_type == aristaproto.WIRE_VARINT:
+                _, pos = aristaproto.decode_varint(data, pos)
+                result = None
+            elif number == 2 and wire_type == aristaproto.WIRE_FIXED_64:
+                result = struct.unpack_from("<d", data, pos)[0]
+                pos += 8
+            elif number == 4 and wire_type == aristaproto.WIRE_VARINT:
+                flag, pos = aristaproto.decode_varint(data, pos)
+                result = flag > 0
+            elif number in (3, 5, 6) and wire_type == aristaproto.WIRE_LEN_DELIM:
+                length, pos = aristaproto.decode_varint(data, pos)
+                nested = data[pos : pos + length]
+                pos += length
+                if number == 3:
+                    result = str(nested, "utf-8")
+                elif number == 5:
+                    result = Struct.bytes_to_python(nested)
+                else:
+                    result = ListValue.bytes_to_python(nested)
+            else:
+                pos = Value._skip_field(data, pos, wire_type)
+                continue
+
+            has_kind = True
+
+        # The kind of value must be set
+        if not has_kind:
+            raise ValueError("Invalid value")
+        return result
+
+    @staticmethod
+    def python_to_bytes(value: typing.Any) -> bytes:
+        """
+        Encode a plain Python value directly as a binary encoded ``Value``, without building the intermediate
+        messages. The output is the same as ``bytes(Value.from_dict(value))``.
+        """
+        match value:
+            case bool() as b:
+                return b"\x20\x01" if b else b"\x20\x00"
+            case int() | float() as num:
+                return b"\x11" + struct.pack("<d", num)
+            case str() as s:
+                encoded = s.encode("utf-8")
+                return b"\x1a" + aristaproto.encode_varint(len(encoded)) + encoded
+            case list() as l:
+                encoded = ListValue.python_to_bytes(l)
+                return b"\x32" + aristaproto.encode_varint(len(encoded)) + encoded
+            case dict() as d:
+                encoded = Struct.python_to_bytes(d)
+                return b"\x2a" + aristaproto.encode_varint(len(encoded)) + encoded
+            case None:
+                return b"\x08\x00"
+        raise ValueError(f"Unknown value type: {type(value)}")
+
+    @staticmethod
+    def copy_python(value: typing.Any) -> typing.Any:
+        """
+        Return a copy of a plain Python value, as accepted by ``from_dict``, without building the intermediate
+        messages. The dicts and lists are copied recursively.
+        """
+        match value:
+            case bool() | int() | float() | str() | None:
+                return value
+            case list() as l:
+                return [Value.copy_python(item) for item in l]
+            case dict() as d:
+                return {key: Value.copy_python(item) for key, item in d.items()}
+        raise ValueError(f"Unknown value type: {type(value)}")
+
+    @staticmethod
+    def _skip_field(data: bytes, pos: int, wire_type: int) -> int:
+        """Returns the position after the value of an unknown field, given the position after its tag."""
+        if wire_type == aristaproto.WIRE_VARINT:
+            return aristaproto.decode_varint(data, pos)[1]
+        if wire_type == aristaproto.WIRE_FIXED_64:
+            return pos + 8
+        if wire_type == aristaproto.WIRE_FIXED_32:
+            return pos + 4
+        if wire_type == aristaproto.WIRE_LEN_DELIM:
+            length, pos = aristaproto.decode_varint(data, pos)
+            return pos + length
+        raise ValueError(f"Unsupported wire type: {wire_type}")
+
 
 class ListValue(VanillaListValue):
     # TODO typing
@@ -110,3 +346,39 @@ class ListValue(VanillaListValue):
         assert output_format == aristaproto.OutputFormat.PROTO_JSON
 
         return [value.to_dict() for value in self.values]
+
+    @staticmethod
+    def bytes_to_python(data: bytes) -> list[typing.Any]:
+        """
+        Decode a binary encoded ``ListValue`` directly to a list of plain Python values, as returned by ``to_dict``,
+        without building the intermediate messages.
+        """
+        result = []
+        pos = 0
+        end = len(data)
+        while pos < end:
+            num_wire, pos = aristaproto.decode_varint(data, pos)
+            if num_wire != (1 << 3) | aristaproto.WIRE_LEN_DELIM:
+                pos = Value._skip_field(data, pos, num_wire & 0x7)
+                continue
+
+            length, pos = aristaproto.decode_varint(data, pos)
+            result.append(Value.bytes_to_python(data[pos : pos + length]))
+            pos += length
+
+        return result
+
+    @staticmethod
+    def python_to_bytes(value: list[typing.Any]) -> bytes:
+        """
+        Encode a list of plain Python values directly as a binary encoded ``ListValue``, without building the
+        intermediate messages. The output is the same as ``bytes(ListValue.from_dict(value))``.
+        """
+        chunks = []
+        for item in value:
+            item_bytes = Value.python_to_bytes(item)
+            chunks.append(b"\n")
+            chunks.append(aristaproto.encode_varint(len(item_bytes)))
+            chunks.append(item_bytes)
+
+        return b"".join(chunks)
@@ -25,7 +25,8 @@ class Timestamp(VanillaTimestamp):
     @classmethod
     def from_dict(cls, value, *, ignore_unknown_fields: bool = False) -> Self:
         if isinstance(value, str):
-            return cls.from_datetime(NanoDatetime.from_rfc3339(value))
+            seconds, nanos = NanoDatetime.rfc3339_to_timestamp(value)
+            return cls(seconds, nanos)
 
         return super().from_dict(value, ignore_unknown_fields=ignore_unknown_fields)
 
@@ -40,7 +41,7 @@ class Timestamp(VanillaTimestamp):
         # If the output format is PYTHON, we should have kept the wraped type without building the real class
         assert output_format == aristaproto.OutputFormat.PROTO_JSON
 
-        return Timestamp.timestamp_to_json(self.to_datetime())
+        return NanoDatetime.timestamp_to_rfc3339(self.seconds, self.nanos)
 
     @staticmethod
     def from_wrapped(wrapped: datetime.datetime) -> "Timestamp":
@@ -48,3 +49,14 @@ class Timestamp(VanillaTimestamp):
 
     def to_wrapped(self) -> datetime.datetime:
         return self.to_datetime()
+
+    @staticmethod
+    def decode_wrapped(data: bytes) -> datetime.datetime:
+        seconds, nanos = aristaproto.decode_scalar_fields(data, (aristaproto.TYPE_INT64, aristaproto.TYPE_INT32))
+        return NanoDatetime.from_timestamp(seconds, nanos)
+
+    @staticmethod
+    def encode_wrapped(wrapped: datetime.datetime) -> bytes:
+        return aristaproto.encode_scalar_fields(
+            NanoDatetime.to_timestamp(wrapped), (aristaproto.TYPE_INT64, aristaproto.TYPE_INT32)
+        )
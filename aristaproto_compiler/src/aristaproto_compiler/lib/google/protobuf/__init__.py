@@ -87,9 +87,10 @@ __all__ = (
 )
 
 import datetime
-import re
+import struct
 import typing
 import warnings
+from base64 import b64decode, b64encode
 from dataclasses import dataclass
 
 import aristaproto
@@ -867,20 +868,38 @@ class Any(aristaproto.Message):
     Must be a valid serialized protocol buffer of the above specified type.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "type_url": str,
+            "value": bytes,
+        }
+
     @classmethod
-    def pack(cls, message: aristaproto.Message, message_pool: "aristaproto.MessagePool | None" = None) -> "Any":
+    def pack(
+        cls, message: aristaproto.Message, message_pool: "aristaproto.MessagePool | None" = None, *, lazy: bool = False
+    ) -> "Any":
         """
         Pack the given message in the `Any` object.
 
         The message type must be registered in the message pool, which is done automatically when the module defining
         the message type is imported.
+
+        If `lazy` is set, the message is only encoded when the `Any` object is serialized, compared or copied, or when
+        its `value` is read. The message is not copied, so the changes made to it until then are included in the `Any`
+        object, and `unpack` returns the message itself.
         """
         message_pool = message_pool or default_message_pool
 
         type_url = message_pool.type_to_url[type(message)]
-        value = bytes(message)
+        if not lazy:
+            return cls(type_url=type_url, value=bytes(message))
 
-        return cls(type_url=type_url, value=value)
+        packed = cls(type_url=type_url)
+        # The value is left unset until it is encoded, which is done by `__getattr__` when it is read
+        del packed.__dict__["value"]
+        packed.__dict__["_pending"] = (type_url, message)
+        return packed
 
     def unpack(self, message_pool: "aristaproto.MessagePool | None" = None) -> aristaproto.Message | None:
         """
@@ -888,41 +907,105 @@ class Any(aristaproto.Message):
 
         The target message type must be registered in the message pool, which is done automatically when the module
         defining the message type is imported.
+
+        The unpacked message is cached until `type_url` or `value` are changed, and the same instance is returned by
+        the next calls, so it must not be modified. A message packed lazily is returned as it is, without being encoded.
         """
-        if not self.type_url:
+        values = self.__dict__
+        type_url = values["type_url"]
+        if not type_url:
             return None
 
+        if "value" not in values:
+            pending_type_url, message = values["_pending"]
+            if pending_type_url == type_url:
+                return message
+
         message_pool = message_pool or default_message_pool
+        value = self.value
+
+        cached = values.get("_unpacked")
+        if cached is not None and cached[0] == type_url and cached[1] is value and cached[2] is message_pool:
+            return cached[3]
 
         try:
-            message_type = message_pool.url_to_type[self.type_url]
+            message_type = message_pool.url_to_type[type_url]
         except KeyError:
-            raise TypeError(f"Can't unpack unregistered type: {self.type_url}")
-
-        return message_type.parse(self.value)
+            raise TypeError(f"Can't unpack unregistered type: {type_url}")
 
-    def to_dict(self, **kwargs) -> dict[str, typing.Any]:
-        # TODO allow passing a message pool to `to_dict`
+        message = message_type.parse(value)
+        values["_unpacked"] = (type_url, value, message_pool, message)
+        return message
+
+    def _encode_pending(self) -> None:
+        # Encodes the message packed lazily, unless `type_url` was changed since
+        values = self.__dict__
+        if "value" not in values:
+            type_url, message = values.pop("_pending")
+            values["value"] = bytes(message) if type_url == values["type_url"] else b""
+
+    def __getattr__(self, name: str) -> typing.Any:
+        # Only called when the attribute is not set, which is the case of the value of a message packed lazily
+        if name == "value" and "_pending" in self.__dict__:
+            self._encode_pending()
+            return self.__dict__["value"]
+        return super().__getattr__(name)
+
+    def __bytes__(self) -> bytes:
+        self._encode_pending()
+        return super().__bytes__()
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Any):
+            self._encode_pending()
+            other._encode_pending()
+        return super().__eq__(other)
+
+    def __copy__(self, _: typing.Any = {}) -> Self:
+        self._encode_pending()
+        return super().__copy__()
+
+    def __deepcopy__(self, _: typing.Any = {}) -> Self:
+        self._encode_pending()
+        return super().__deepcopy__()
+
+    def to_dict(self, *, message_pool: "aristaproto.MessagePool | None" = None, **kwargs) -> dict[str, typing.Any]:
         output: dict[str, typing.Any] = {"@type": self.type_url}
 
-        value = self.unpack()
+        # The pool is also used by the `Any` messages nested in the value
+        message_pool = message_pool or aristaproto.message_pool.current_message_pool.get()
+
+        value = self.unpack(message_pool)
 
         if value is None:
             return output
 
-        if type(value).to_dict == aristaproto.Message.to_dict:
-            output.update(value.to_dict(**kwargs))
-        else:
-            output["value"] = value.to_dict(**kwargs)
+        token = aristaproto.message_pool.current_message_pool.set(message_pool)
+        try:
+            if type(value).to_dict == aristaproto.Message.to_dict:
+                output.update(value.to_dict(**kwargs))
+            else:
+                output["value"] = value.to_dict(**kwargs)
+        finally:
+            aristaproto.message_pool.current_message_pool.reset(token)
 
         return output
 
     @classmethod
-    def from_dict(cls, value, *, ignore_unknown_fields: bool = False) -> Self:
+    def from_dict(
+        cls,
+        value,
+        *,
+        ignore_unknown_fields: bool = False,
+        message_pool: "aristaproto.MessagePool | None" = None,
+    ) -> Self:
         value = dict(value)  # Make a copy
 
+        # The pool is also used by the `Any` messages nested in the value
+        message_pool = message_pool or aristaproto.message_pool.current_message_pool.get()
+
         type_url = value.pop("@type", None)
-        msg_cls = default_message_pool.url_to_type.get(type_url, None)
+        msg_cls = (message_pool or default_message_pool).url_to_type.get(type_url, None)
 
         if not msg_cls:
             raise TypeError(f"Can't unpack unregistered type: {type_url}")
@@ -930,9 +1013,17 @@ class Any(aristaproto.Message):
         if not msg_cls.to_dict == aristaproto.Message.to_dict:
             value = value["value"]
 
-        return cls(
-            type_url=type_url, value=bytes(msg_cls.from_dict(value, ignore_unknown_fields=ignore_unknown_fields))
-        )
+        token = aristaproto.message_pool.current_message_pool.set(message_pool)
+        try:
+            message = msg_cls.from_dict(value, ignore_unknown_fields=ignore_unknown_fields)
+        finally:
+            aristaproto.message_pool.current_message_pool.reset(token)
+
+        # The message is only encoded when the value is needed
+        packed = cls(type_url=type_url)
+        del packed.__dict__["value"]
+        packed.__dict__["_pending"] = (type_url, message)
+        return packed
 
 
 default_message_pool.register_message("google.protobuf", "Any", Any)
@@ -1007,6 +1098,18 @@ class Api(aristaproto.Message):
     The source syntax of the service.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "name": str,
+            "methods": list[Method],
+            "options": list[Option],
+            "version": str,
+            "source_context": SourceContext | None,
+            "mixins": list[Mixin],
+            "syntax": Syntax,
+        }
+
 
 default_message_pool.register_message("google.protobuf", "Api", Api)
 
@@ -1024,6 +1127,12 @@ class BoolValue(aristaproto.Message):
     The bool value.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "value": bool,
+        }
+
     @classmethod
     def from_dict(cls, value, *, ignore_unknown_fields: bool = False) -> Self:
         if isinstance(value, bool):
@@ -1046,6 +1155,14 @@ class BoolValue(aristaproto.Message):
     def to_wrapped(self) -> bool:
         return self.value
 
+    @staticmethod
+    def decode_wrapped(data: bytes) -> bool:
+        return aristaproto.decode_scalar_fields(data, (aristaproto.TYPE_BOOL,))[0]
+
+    @staticmethod
+    def encode_wrapped(wrapped: bool) -> bytes:
+        return aristaproto.encode_scalar_fields((wrapped,), (aristaproto.TYPE_BOOL,))
+
 
 default_message_pool.register_message("google.protobuf", "BoolValue", BoolValue)
 
@@ -1063,10 +1180,18 @@ class BytesValue(aristaproto.Message):
     The bytes value.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "value": bytes,
+        }
+
     @classmethod
     def from_dict(cls, value, *, ignore_unknown_fields: bool = False) -> Self:
         if isinstance(value, bytes):
             return cls(value=value)
+        if isinstance(value, str):
+            return cls(value=b64decode(value))
         return super().from_dict(value, ignore_unknown_fields=ignore_unknown_fields)
 
     def to_dict(
@@ -1076,7 +1201,9 @@ class BytesValue(aristaproto.Message):
         casing: aristaproto.Casing = aristaproto.Casing.CAMEL,
         include_default_values: bool = False,
     ) -> dict[str, typing.Any] | typing.Any:
-        return self.value
+        if output_format == aristaproto.OutputFormat.PYTHON:
+            return self.value
+        return b64encode(self.value).decode("utf8")
 
     @staticmethod
     def from_wrapped(wrapped: bytes) -> "BytesValue":
@@ -1085,6 +1212,14 @@ class BytesValue(aristaproto.Message):
     def to_wrapped(self) -> bytes:
         return self.value
 
+    @staticmethod
+    def decode_wrapped(data: bytes) -> bytes:
+        return aristaproto.decode_scalar_fields(data, (aristaproto.TYPE_BYTES,))[0]
+
+    @staticmethod
+    def encode_wrapped(wrapped: bytes) -> bytes:
+        return aristaproto.encode_scalar_fields((wrapped,), (aristaproto.TYPE_BYTES,))
+
 
 default_message_pool.register_message("google.protobuf", "BytesValue", BytesValue)
 
@@ -1121,6 +1256,21 @@ class DescriptorProto(aristaproto.Message):
     A given name may only be reserved once.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "name": str,
+            "field": list[FieldDescriptorProto],
+            "extension": list[FieldDescriptorProto],
+            "nested_type": list[DescriptorProto],
+            "enum_type": list[EnumDescriptorProto],
+            "extension_range": list[DescriptorProtoExtensionRange],
+            "oneof_decl": list[OneofDescriptorProto],
+            "options": MessageOptions | None,
+            "reserved_range": list[DescriptorProtoReservedRange],
+            "reserved_name": list[str],
+        }
+
 
 default_message_pool.register_message("google.protobuf", "DescriptorProto", DescriptorProto)
 
@@ -1139,6 +1289,14 @@ class DescriptorProtoExtensionRange(aristaproto.Message):
 
     options: "ExtensionRangeOptions | None" = aristaproto.field(3, aristaproto.TYPE_MESSAGE, optional=True)
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "start": int,
+            "end": int,
+            "options": ExtensionRangeOptions | None,
+        }
+
 
 default_message_pool.register_message(
     "google.protobuf", "DescriptorProto.ExtensionRange", DescriptorProtoExtensionRange
@@ -1163,6 +1321,13 @@ class DescriptorProtoReservedRange(aristaproto.Message):
     Exclusive.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "start": int,
+            "end": int,
+        }
+
 
 default_message_pool.register_message("google.protobuf", "DescriptorProto.ReservedRange", DescriptorProtoReservedRange)
 
@@ -1180,6 +1345,12 @@ class DoubleValue(aristaproto.Message):
     The double value.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "value": float,
+        }
+
     @classmethod
     def from_dict(cls, value, *, ignore_unknown_fields: bool = False) -> Self:
         if isinstance(value, float):
@@ -1202,6 +1373,14 @@ class DoubleValue(aristaproto.Message):
     def to_wrapped(self) -> float:
         return self.value
 
+    @staticmethod
+    def decode_wrapped(data: bytes) -> float:
+        return aristaproto.decode_scalar_fields(data, (aristaproto.TYPE_DOUBLE,))[0]
+
+    @staticmethod
+    def encode_wrapped(wrapped: float) -> bytes:
+        return aristaproto.encode_scalar_fields((wrapped,), (aristaproto.TYPE_DOUBLE,))
+
 
 default_message_pool.register_message("google.protobuf", "DoubleValue", DoubleValue)
 
@@ -1286,34 +1465,58 @@ class Duration(aristaproto.Message):
     to +999,999,999 inclusive.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "seconds": int,
+            "nanos": int,
+        }
+
     @classmethod
-    def from_timedelta(
-        cls, delta: datetime.timedelta, *, _1_microsecond: datetime.timedelta = datetime.timedelta(microseconds=1)
-    ) -> "Duration":
-        total_ms = delta // _1_microsecond
-        seconds = int(total_ms / 1e6)
-        nanos = int((total_ms % 1e6) * 1e3)
-        return cls(seconds, nanos)
+    def from_timedelta(cls, delta: datetime.timedelta) -> "Duration":
+        # The seconds and the nanos have the same sign
+        micros = (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+        seconds, micros = divmod(abs(micros), 1_000_000)
+        if delta < datetime.timedelta(0):
+            return cls(-seconds, -micros * 1000)
+        return cls(seconds, micros * 1000)
 
     def to_timedelta(self) -> datetime.timedelta:
         return datetime.timedelta(seconds=self.seconds, microseconds=self.nanos / 1e3)
 
     @staticmethod
     def delta_to_json(delta: datetime.timedelta) -> str:
-        parts = str(delta.total_seconds()).split(".")
-        if len(parts) > 1:
-            while len(parts[1]) not in (3, 6, 9):
-                parts[1] = f"{parts[1]}0"
-        return f"{'.'.join(parts)}s"
+        micros = (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+        sign = "-" if micros < 0 else ""
+        seconds, micros = divmod(abs(micros), 1_000_000)
+        if micros == 0:
+            return f"{sign}{seconds}s"
+        if micros % 1_000 == 0:
+            return f"{sign}{seconds}.{micros // 1_000:03d}s"
+        return f"{sign}{seconds}.{micros:06d}s"
 
     @classmethod
     def from_dict(cls, value, *, ignore_unknown_fields: bool = False) -> Self:
         if isinstance(value, str):
-            if not re.match(r"^\d+(\.\d+)?s$", value):
+            # The seconds and the fraction are parsed as integers, so that no precision is lost
+            seconds, dot, fraction = value[:-1].partition(".")
+            negative = seconds.startswith("-")
+            if negative:
+                seconds = seconds[1:]
+
+            if not (
+                value.endswith("s")
+                and seconds.isascii()
+                and seconds.isdigit()
+                and (not dot or (fraction.isascii() and fraction.isdigit()))
+            ):
                 raise ValueError(f"Invalid duration string: {value}")
 
-            seconds = float(value[:-1])
-            return cls(seconds=int(seconds), nanos=int((seconds - int(seconds)) * 1e9))
+            # The digits after the nanoseconds are truncated
+            nanos = int(fraction[:9].ljust(9, "0")) if fraction else 0
+            if negative:
+                return cls(seconds=-int(seconds), nanos=-nanos)
+            return cls(seconds=int(seconds), nanos=nanos)
 
         return super().from_dict(value, ignore_unknown_fields=ignore_unknown_fields)
 
@@ -1327,16 +1530,20 @@ class Duration(aristaproto.Message):
         # If the output format is PYTHON, we should have kept the wrapped type without building the real class
         assert output_format == aristaproto.OutputFormat.PROTO_JSON
 
-        assert 0 <= self.nanos < 1e9
+        assert -1e9 < self.nanos < 1e9
 
         if self.nanos == 0:
             return f"{self.seconds}s"
 
-        nanos = f"{self.nanos:09d}".rstrip("0")
-        if len(nanos) < 3:
-            nanos += "0" * (3 - len(nanos))
-
-        return f"{self.seconds}.{nanos}s"
+        # The fraction of second uses 3, 6 or 9 digits
+        sign = "-" if self.seconds < 0 or self.nanos < 0 else ""
+        seconds = abs(self.seconds)
+        nanos = abs(self.nanos)
+        if nanos % 1_000_000 == 0:
+            return f"{sign}{seconds}.{nanos // 1_000_000:03d}s"
+        if nanos % 1_000 == 0:
+            return f"{sign}{seconds}.{nanos // 1_000:06d}s"
+        return f"{sign}{seconds}.{nanos:09d}s"
 
     @staticmethod
     def from_wrapped(wrapped: datetime.timedelta) -> "Duration":
@@ -1345,6 +1552,18 @@ class Duration(aristaproto.Message):
     def to_wrapped(self) -> datetime.timedelta:
         return self.to_timedelta()
 
+    @staticmethod
+    def decode_wrapped(data: bytes) -> datetime.timedelta:
+        seconds, nanos = aristaproto.decode_scalar_fields(data, (aristaproto.TYPE_INT64, aristaproto.TYPE_INT32))
+        return datetime.timedelta(seconds=seconds, microseconds=nanos / 1e3)
+
+    @staticmethod
+    def encode_wrapped(wrapped: datetime.timedelta) -> bytes:
+        duration = Duration.from_timedelta(wrapped)
+        return aristaproto.encode_scalar_fields(
+            (duration.seconds, duration.nanos), (aristaproto.TYPE_INT64, aristaproto.TYPE_INT32)
+        )
+
 
 default_message_pool.register_message("google.protobuf", "Duration", Duration)
 
@@ -1403,6 +1622,17 @@ class Enum(aristaproto.Message):
     The source edition string, only valid when syntax is SYNTAX_EDITIONS.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "name": str,
+            "enumvalue": list[EnumValue],
+            "options": list[Option],
+            "source_context": SourceContext | None,
+            "syntax": Syntax,
+            "edition": str,
+        }
+
 
 default_message_pool.register_message("google.protobuf", "Enum", Enum)
 
@@ -1434,6 +1664,16 @@ class EnumDescriptorProto(aristaproto.Message):
     be reserved once.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "name": str,
+            "value": list[EnumValueDescriptorProto],
+            "options": EnumOptions | None,
+            "reserved_range": list[EnumDescriptorProtoEnumReservedRange],
+            "reserved_name": list[str],
+        }
+
 
 default_message_pool.register_message("google.protobuf", "EnumDescriptorProto", EnumDescriptorProto)
 
@@ -1459,6 +1699,13 @@ class EnumDescriptorProtoEnumReservedRange(aristaproto.Message):
     Inclusive.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "start": int,
+            "end": int,
+        }
+
 
 default_message_pool.register_message(
     "google.protobuf", "EnumDescriptorProto.EnumReservedRange", EnumDescriptorProtoEnumReservedRange
@@ -1481,7 +1728,7 @@ class EnumOptions(aristaproto.Message):
     is a formalization for deprecating enums.
     """
 
-    deprecated_legacy_json_field_conflicts: "bool" = aristaproto.field(6, aristaproto.TYPE_BOOL)
+    deprecated_legacy_json_field_conflicts: "bool" = aristaproto.field(6, aristaproto.TYPE_BOOL, deprecated=True)
     """
     Enable the legacy handling of JSON field name conflicts.  This lowercases
     and strips underscored from the fields before comparison in proto3 only.
@@ -1501,6 +1748,16 @@ class EnumOptions(aristaproto.Message):
     The parser stores options it doesn't recognize here. See above.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "allow_alias": bool,
+            "deprecated": bool,
+            "deprecated_legacy_json_field_conflicts": bool,
+            "features": FeatureSet | None,
+            "uninterpreted_option": list[UninterpretedOption],
+        }
+
     def __post_init__(self) -> None:
         super().__post_init__()
         if self.is_set("deprecated_legacy_json_field_conflicts"):
@@ -1531,6 +1788,14 @@ class EnumValue(aristaproto.Message):
     Protocol buffer options.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "name": str,
+            "number": int,
+            "options": list[Option],
+        }
+
 
 default_message_pool.register_message("google.protobuf", "EnumValue", EnumValue)
 
@@ -1547,6 +1812,14 @@ class EnumValueDescriptorProto(aristaproto.Message):
 
     options: "EnumValueOptions | None" = aristaproto.field(3, aristaproto.TYPE_MESSAGE, optional=True)
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "name": str,
+            "number": int,
+            "options": EnumValueOptions | None,
+        }
+
 
 default_message_pool.register_message("google.protobuf", "EnumValueDescriptorProto", EnumValueDescriptorProto)
 
@@ -1583,6 +1856,16 @@ class EnumValueOptions(aristaproto.Message):
     The parser stores options it doesn't recognize here. See above.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "deprecated": bool,
+            "features": FeatureSet | None,
+            "debug_redact": bool,
+            "feature_support": FieldOptionsFeatureSupport | None,
+            "uninterpreted_option": list[UninterpretedOption],
+        }
+
 
 default_message_pool.register_message("google.protobuf", "EnumValueOptions", EnumValueOptions)
 
@@ -1617,6 +1900,15 @@ class ExtensionRangeOptions(aristaproto.Message):
     are marked as UNVERIFIED.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "uninterpreted_option": list[UninterpretedOption],
+            "declaration": list[ExtensionRangeOptionsDeclaration],
+            "features": FeatureSet | None,
+            "verification": ExtensionRangeOptionsVerificationState,
+        }
+
 
 default_message_pool.register_message("google.protobuf", "ExtensionRangeOptions", ExtensionRangeOptions)
 
@@ -1654,6 +1946,16 @@ class ExtensionRangeOptionsDeclaration(aristaproto.Message):
     Otherwise the extension must be defined as optional.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "number": int,
+            "full_name": str,
+            "type": str,
+            "reserved": bool,
+            "repeated": bool,
+        }
+
 
 default_message_pool.register_message(
     "google.protobuf", "ExtensionRangeOptions.Declaration", ExtensionRangeOptionsDeclaration
@@ -1698,6 +2000,17 @@ class FeatureSet(aristaproto.Message):
         6, aristaproto.TYPE_ENUM, default_factory=lambda: FeatureSetJsonFormat(0)
     )
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "field_presence": FeatureSetFieldPresence,
+            "enum_type": FeatureSetEnumType,
+            "repeated_field_encoding": FeatureSetRepeatedFieldEncoding,
+            "utf8_validation": FeatureSetUtf8Validation,
+            "message_encoding": FeatureSetMessageEncoding,
+            "json_format": FeatureSetJsonFormat,
+        }
+
 
 default_message_pool.register_message("google.protobuf", "FeatureSet", FeatureSet)
 
@@ -1727,6 +2040,14 @@ class FeatureSetDefaults(aristaproto.Message):
     after this will not have reliable defaults.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "defaults": list[FeatureSetDefaultsFeatureSetEditionDefault],
+            "minimum_edition": Edition,
+            "maximum_edition": Edition,
+        }
+
 
 default_message_pool.register_message("google.protobuf", "FeatureSetDefaults", FeatureSetDefaults)
 
@@ -1752,6 +2073,14 @@ class FeatureSetDefaultsFeatureSetEditionDefault(aristaproto.Message):
     Defaults of features that can't be overridden in this edition.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "edition": Edition,
+            "overridable_features": FeatureSet | None,
+            "fixed_features": FeatureSet | None,
+        }
+
 
 default_message_pool.register_message(
     "google.protobuf", "FeatureSetDefaults.FeatureSetEditionDefault", FeatureSetDefaultsFeatureSetEditionDefault
@@ -1818,6 +2147,21 @@ class Field(aristaproto.Message):
     The string value of the default value of this field. Proto2 syntax only.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "kind": FieldKind,
+            "cardinality": FieldCardinality,
+            "number": int,
+            "name": str,
+            "type_url": str,
+            "oneof_index": int | None,
+            "packed": bool,
+            "options": list[Option],
+            "json_name": str,
+            "default_value": str,
+        }
+
 
 default_message_pool.register_message("google.protobuf", "Field", Field)
 
@@ -1908,6 +2252,22 @@ class FieldDescriptorProto(aristaproto.Message):
     optional with `LABEL_OPTIONAL`.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "name": str,
+            "number": int,
+            "label": FieldDescriptorProtoLabel,
+            "type": FieldDescriptorProtoType,
+            "type_name": str,
+            "extendee": str,
+            "default_value": str,
+            "oneof_index": int | None,
+            "json_name": str,
+            "options": FieldOptions | None,
+            "proto3_optional": bool,
+        }
+
 
 default_message_pool.register_message("google.protobuf", "FieldDescriptorProto", FieldDescriptorProto)
 
@@ -2120,6 +2480,12 @@ class FieldMask(aristaproto.Message):
     The set of field mask paths.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "paths": list[str],
+        }
+
 
 default_message_pool.register_message("google.protobuf", "FieldMask", FieldMask)
 
@@ -2243,6 +2609,25 @@ class FieldOptions(aristaproto.Message):
     The parser stores options it doesn't recognize here. See above.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "ctype": FieldOptionsCType,
+            "packed": bool,
+            "jstype": FieldOptionsJsType,
+            "lazy": bool,
+            "unverified_lazy": bool,
+            "deprecated": bool,
+            "weak": bool,
+            "debug_redact": bool,
+            "retention": FieldOptionsOptionRetention,
+            "targets": list[FieldOptionsOptionTargetType],
+            "edition_defaults": list[FieldOptionsEditionDefault],
+            "features": FeatureSet | None,
+            "feature_support": FieldOptionsFeatureSupport | None,
+            "uninterpreted_option": list[UninterpretedOption],
+        }
+
 
 default_message_pool.register_message("google.protobuf", "FieldOptions", FieldOptions)
 
@@ -2256,6 +2641,13 @@ class FieldOptionsEditionDefault(aristaproto.Message):
     Textproto value.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "edition": Edition,
+            "value": str,
+        }
+
 
 default_message_pool.register_message("google.protobuf", "FieldOptions.EditionDefault", FieldOptionsEditionDefault)
 
@@ -2292,6 +2684,15 @@ class FieldOptionsFeatureSupport(aristaproto.Message):
     not be able to override it.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "edition_introduced": Edition,
+            "edition_deprecated": Edition,
+            "deprecation_warning": str,
+            "edition_removed": Edition,
+        }
+
 
 default_message_pool.register_message("google.protobuf", "FieldOptions.FeatureSupport", FieldOptionsFeatureSupport)
 
@@ -2362,6 +2763,24 @@ class FileDescriptorProto(aristaproto.Message):
     The edition of the proto file.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "name": str,
+            "package": str,
+            "dependency": list[str],
+            "public_dependency": list[int],
+            "weak_dependency": list[int],
+            "message_type": list[DescriptorProto],
+            "enum_type": list[EnumDescriptorProto],
+            "service": list[ServiceDescriptorProto],
+            "extension": list[FieldDescriptorProto],
+            "options": FileOptions | None,
+            "source_code_info": SourceCodeInfo | None,
+            "syntax": str,
+            "edition": Edition,
+        }
+
 
 default_message_pool.register_message("google.protobuf", "FileDescriptorProto", FileDescriptorProto)
 
@@ -2375,6 +2794,12 @@ class FileDescriptorSet(aristaproto.Message):
 
     file: "list[FileDescriptorProto]" = aristaproto.field(1, aristaproto.TYPE_MESSAGE, repeated=True)
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "file": list[FileDescriptorProto],
+        }
+
 
 default_message_pool.register_message("google.protobuf", "FileDescriptorSet", FileDescriptorSet)
 
@@ -2442,7 +2867,7 @@ class FileOptions(aristaproto.Message):
     top-level extensions defined in the file.
     """
 
-    java_generate_equals_and_hash: "bool" = aristaproto.field(20, aristaproto.TYPE_BOOL)
+    java_generate_equals_and_hash: "bool" = aristaproto.field(20, aristaproto.TYPE_BOOL, deprecated=True)
     """
     This option does nothing.
     """
@@ -2563,6 +2988,32 @@ class FileOptions(aristaproto.Message):
     See the documentation for the "Options" section above.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "java_package": str,
+            "java_outer_classname": str,
+            "java_multiple_files": bool,
+            "java_generate_equals_and_hash": bool,
+            "java_string_check_utf8": bool,
+            "optimize_for": FileOptionsOptimizeMode,
+            "go_package": str,
+            "cc_generic_services": bool,
+            "java_generic_services": bool,
+            "py_generic_services": bool,
+            "deprecated": bool,
+            "cc_enable_arenas": bool,
+            "objc_class_prefix": str,
+            "csharp_namespace": str,
+            "swift_prefix": str,
+            "php_class_prefix": str,
+            "php_namespace": str,
+            "php_metadata_namespace": str,
+            "ruby_package": str,
+            "features": FeatureSet | None,
+            "uninterpreted_option": list[UninterpretedOption],
+        }
+
     def __post_init__(self) -> None:
         super().__post_init__()
         if self.is_set("java_generate_equals_and_hash"):
@@ -2585,6 +3036,12 @@ class FloatValue(aristaproto.Message):
     The float value.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "value": float,
+        }
+
     @classmethod
     def from_dict(cls, value, *, ignore_unknown_fields: bool = False) -> Self:
         if isinstance(value, float):
@@ -2607,6 +3064,14 @@ class FloatValue(aristaproto.Message):
     def to_wrapped(self) -> float:
         return self.value
 
+    @staticmethod
+    def decode_wrapped(data: bytes) -> float:
+        return aristaproto.decode_scalar_fields(data, (aristaproto.TYPE_FLOAT,))[0]
+
+    @staticmethod
+    def encode_wrapped(wrapped: float) -> bytes:
+        return aristaproto.encode_scalar_fields((wrapped,), (aristaproto.TYPE_FLOAT,))
+
 
 default_message_pool.register_message("google.protobuf", "FloatValue", FloatValue)
 
@@ -2625,6 +3090,12 @@ class GeneratedCodeInfo(aristaproto.Message):
     of its generating .proto file.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "annotation": list[GeneratedCodeInfoAnnotation],
+        }
+
 
 default_message_pool.register_message("google.protobuf", "GeneratedCodeInfo", GeneratedCodeInfo)
 
@@ -2659,6 +3130,16 @@ class GeneratedCodeInfoAnnotation(aristaproto.Message):
         5, aristaproto.TYPE_ENUM, default_factory=lambda: GeneratedCodeInfoAnnotationSemantic(0)
     )
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "path": list[int],
+            "source_file": str,
+            "begin": int,
+            "end": int,
+            "semantic": GeneratedCodeInfoAnnotationSemantic,
+        }
+
 
 default_message_pool.register_message("google.protobuf", "GeneratedCodeInfo.Annotation", GeneratedCodeInfoAnnotation)
 
@@ -2676,6 +3157,12 @@ class Int32Value(aristaproto.Message):
     The int32 value.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "value": int,
+        }
+
     @classmethod
     def from_dict(cls, value, *, ignore_unknown_fields: bool = False) -> Self:
         if isinstance(value, int):
@@ -2698,6 +3185,14 @@ class Int32Value(aristaproto.Message):
     def to_wrapped(self) -> int:
         return self.value
 
+    @staticmethod
+    def decode_wrapped(data: bytes) -> int:
+        return aristaproto.decode_scalar_fields(data, (aristaproto.TYPE_INT32,))[0]
+
+    @staticmethod
+    def encode_wrapped(wrapped: int) -> bytes:
+        return aristaproto.encode_scalar_fields((wrapped,), (aristaproto.TYPE_INT32,))
+
 
 default_message_pool.register_message("google.protobuf", "Int32Value", Int32Value)
 
@@ -2715,6 +3210,12 @@ class Int64Value(aristaproto.Message):
     The int64 value.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "value": int,
+        }
+
     @classmethod
     def from_dict(cls, value, *, ignore_unknown_fields: bool = False) -> Self:
         if isinstance(value, int):
@@ -2737,6 +3238,14 @@ class Int64Value(aristaproto.Message):
     def to_wrapped(self) -> int:
         return self.value
 
+    @staticmethod
+    def decode_wrapped(data: bytes) -> int:
+        return aristaproto.decode_scalar_fields(data, (aristaproto.TYPE_INT64,))[0]
+
+    @staticmethod
+    def encode_wrapped(wrapped: int) -> bytes:
+        return aristaproto.encode_scalar_fields((wrapped,), (aristaproto.TYPE_INT64,))
+
 
 default_message_pool.register_message("google.protobuf", "Int64Value", Int64Value)
 
@@ -2754,6 +3263,12 @@ class ListValue(aristaproto.Message):
     Repeated field of dynamically typed values.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "values": list[Value],
+        }
+
     @classmethod
     def from_dict(cls, value, *, ignore_unknown_fields: bool = False) -> Self:
         return cls(values=[Value.from_dict(v) for v in value])
@@ -2770,6 +3285,42 @@ class ListValue(aristaproto.Message):
 
         return [value.to_dict() for value in self.values]
 
+    @staticmethod
+    def bytes_to_python(data: bytes) -> list[typing.Any]:
+        """
+        Decode a binary encoded ``ListValue`` directly to a list of plain Python values, as returned by ``to_dict``,
+        without building the intermediate messages.
+        """
+        result = []
+        pos = 0
+        end = len(data)
+        while pos < end:
+            num_wire, pos = aristaproto.decode_varint(data, pos)
+            if num_wire != (1 << 3) | aristaproto.WIRE_LEN_DELIM:
+                pos = Value._skip_field(data, pos, num_wire & 0x7)
+                continue
+
+            length, pos = aristaproto.decode_varint(data, pos)
+            result.append(Value.bytes_to_python(data[pos : pos + length]))
+            pos += length
+
+        return result
+
+    @staticmethod
+    def python_to_bytes(value: list[typing.Any]) -> bytes:
+        """
+        Encode a list of plain Python values directly as a binary encoded ``ListValue``, without building the
+        intermediate messages. The output is the same as ``bytes(ListValue.from_dict(value))``.
+        """
+        chunks = []
+        for item in value:
+            item_bytes = Value.python_to_bytes(item)
+            chunks.append(b"\n")
+            chunks.append(aristaproto.encode_varint(len(item_bytes)))
+            chunks.append(item_bytes)
+
+        return b"".join(chunks)
+
 
 default_message_pool.register_message("google.protobuf", "ListValue", ListValue)
 
@@ -2838,7 +3389,7 @@ class MessageOptions(aristaproto.Message):
     parser.
     """
 
-    deprecated_legacy_json_field_conflicts: "bool" = aristaproto.field(11, aristaproto.TYPE_BOOL)
+    deprecated_legacy_json_field_conflicts: "bool" = aristaproto.field(11, aristaproto.TYPE_BOOL, deprecated=True)
     """
     Enable the legacy handling of JSON field name conflicts.  This lowercases
     and strips underscored from the fields before comparison in proto3 only.
@@ -2862,6 +3413,18 @@ class MessageOptions(aristaproto.Message):
     The parser stores options it doesn't recognize here. See above.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "message_set_wire_format": bool,
+            "no_standard_descriptor_accessor": bool,
+            "deprecated": bool,
+            "map_entry": bool,
+            "deprecated_legacy_json_field_conflicts": bool,
+            "features": FeatureSet | None,
+            "uninterpreted_option": list[UninterpretedOption],
+        }
+
     def __post_init__(self) -> None:
         super().__post_init__()
         if self.is_set("deprecated_legacy_json_field_conflicts"):
@@ -2912,6 +3475,18 @@ class Method(aristaproto.Message):
     The source syntax of this method.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "name": str,
+            "request_type_url": str,
+            "request_streaming": bool,
+            "response_type_url": str,
+            "response_streaming": bool,
+            "options": list[Option],
+            "syntax": Syntax,
+        }
+
 
 default_message_pool.register_message("google.protobuf", "Method", Method)
 
@@ -2944,6 +3519,17 @@ class MethodDescriptorProto(aristaproto.Message):
     Identifies if server streams multiple server messages
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "name": str,
+            "input_type": str,
+            "output_type": str,
+            "options": MethodOptions | None,
+            "client_streaming": bool,
+            "server_streaming": bool,
+        }
+
 
 default_message_pool.register_message("google.protobuf", "MethodDescriptorProto", MethodDescriptorProto)
 
@@ -2977,6 +3563,15 @@ class MethodOptions(aristaproto.Message):
     The parser stores options it doesn't recognize here. See above.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "deprecated": bool,
+            "idempotency_level": MethodOptionsIdempotencyLevel,
+            "features": FeatureSet | None,
+            "uninterpreted_option": list[UninterpretedOption],
+        }
+
 
 default_message_pool.register_message("google.protobuf", "MethodOptions", MethodOptions)
 
@@ -3075,6 +3670,13 @@ class Mixin(aristaproto.Message):
     are rooted.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "name": str,
+            "root": str,
+        }
+
 
 default_message_pool.register_message("google.protobuf", "Mixin", Mixin)
 
@@ -3089,6 +3691,13 @@ class OneofDescriptorProto(aristaproto.Message):
 
     options: "OneofOptions | None" = aristaproto.field(2, aristaproto.TYPE_MESSAGE, optional=True)
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "name": str,
+            "options": OneofOptions | None,
+        }
+
 
 default_message_pool.register_message("google.protobuf", "OneofDescriptorProto", OneofDescriptorProto)
 
@@ -3105,6 +3714,13 @@ class OneofOptions(aristaproto.Message):
     The parser stores options it doesn't recognize here. See above.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "features": FeatureSet | None,
+            "uninterpreted_option": list[UninterpretedOption],
+        }
+
 
 default_message_pool.register_message("google.protobuf", "OneofOptions", OneofOptions)
 
@@ -3132,6 +3748,13 @@ class Option(aristaproto.Message):
     value using the google.protobuf.Int32Value type.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "name": str,
+            "value": Any | None,
+        }
+
 
 default_message_pool.register_message("google.protobuf", "Option", Option)
 
@@ -3148,6 +3771,14 @@ class ServiceDescriptorProto(aristaproto.Message):
 
     options: "ServiceOptions | None" = aristaproto.field(3, aristaproto.TYPE_MESSAGE, optional=True)
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "name": str,
+            "method": list[MethodDescriptorProto],
+            "options": ServiceOptions | None,
+        }
+
 
 default_message_pool.register_message("google.protobuf", "ServiceDescriptorProto", ServiceDescriptorProto)
 
@@ -3177,6 +3808,14 @@ class ServiceOptions(aristaproto.Message):
     The parser stores options it doesn't recognize here. See above.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "features": FeatureSet | None,
+            "deprecated": bool,
+            "uninterpreted_option": list[UninterpretedOption],
+        }
+
 
 default_message_pool.register_message("google.protobuf", "ServiceOptions", ServiceOptions)
 
@@ -3238,6 +3877,12 @@ class SourceCodeInfo(aristaproto.Message):
       be recorded in the future.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "location": list[SourceCodeInfoLocation],
+        }
+
 
 default_message_pool.register_message("google.protobuf", "SourceCodeInfo", SourceCodeInfo)
 
@@ -3335,6 +3980,16 @@ class SourceCodeInfoLocation(aristaproto.Message):
 
     leading_detached_comments: "list[str]" = aristaproto.field(6, aristaproto.TYPE_STRING, repeated=True)
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "path": list[int],
+            "span": list[int],
+            "leading_comments": str,
+            "trailing_comments": str,
+            "leading_detached_comments": list[str],
+        }
+
 
 default_message_pool.register_message("google.protobuf", "SourceCodeInfo.Location", SourceCodeInfoLocation)
 
@@ -3352,6 +4007,12 @@ class SourceContext(aristaproto.Message):
     protobuf element.  For example: `"google/protobuf/source_context.proto"`.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "file_name": str,
+        }
+
 
 default_message_pool.register_message("google.protobuf", "SourceContext", SourceContext)
 
@@ -3369,6 +4030,12 @@ class StringValue(aristaproto.Message):
     The string value.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "value": str,
+        }
+
     @classmethod
     def from_dict(cls, value, *, ignore_unknown_fields: bool = False) -> Self:
         if isinstance(value, str):
@@ -3391,6 +4058,18 @@ class StringValue(aristaproto.Message):
     def to_wrapped(self) -> str:
         return self.value
 
+    @staticmethod
+    def decode_wrapped(data: bytes) -> str:
+        value = aristaproto.decode_scalar_fields(data, (aristaproto.TYPE_STRING,))[0]
+        # Interned like the strings parsed by `StringValue.parse`
+        if StringValue._aristaproto_intern_strings:
+            value = aristaproto.default_intern_table(value)
+        return value
+
+    @staticmethod
+    def encode_wrapped(wrapped: str) -> bytes:
+        return aristaproto.encode_scalar_fields((wrapped,), (aristaproto.TYPE_STRING,))
+
 
 default_message_pool.register_message("google.protobuf", "StringValue", StringValue)
 
@@ -3415,16 +4094,84 @@ class Struct(aristaproto.Message):
     Unordered map of dynamically typed values.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "fields": dict[str, Value],
+        }
+
     @classmethod
-    def from_dict(cls, value, *, ignore_unknown_fields: bool = False) -> Self:
-        assert isinstance(value, dict)
+    def parse(cls, data: bytes, *, zero_copy: bool = False) -> Self:
+        """
+        Parse the binary encoded Protobuf into a new message instance.
+
+        The fields are only decoded when they are first accessed. Until then, the conversions with `to_dict` and
+        `bytes` use the binary data directly, without building the intermediate messages.
+        """
+        return cls._from_pending(bytes(data))
 
-        fields: dict[str, Value] = {}
+    @classmethod
+    def _from_pending(cls, data: bytes | dict[str, typing.Any]) -> Self:
+        # The fields are left unset until they are decoded from the binary data or the plain Python values, which are
+        # never modified
+        msg = cls.construct()
+        msg.__dict__["_pending"] = data
+        return msg
+
+    def _decode_pending(self) -> None:
+        # Decodes the binary data of a message parsed or built from a dict, unless the fields were set since
+        values = self.__dict__
+        data = values.pop("_pending", None)
+        if data is None or "fields" in values:
+            return
+        if isinstance(data, bytes):
+            values["fields"] = super().parse(data).fields
+        else:
+            values["fields"] = {key: Value.from_dict(item) for key, item in data.items()}
+
+    def __getattr__(self, name: str) -> typing.Any:
+        # Only called when the attribute is not set, which is the case of the fields that are not decoded yet
+        if name == "fields" and "_pending" in self.__dict__:
+            self._decode_pending()
+            return self.__dict__["fields"]
+        return super().__getattr__(name)
+
+    def _is_field_set(self, field_name: str) -> bool:
+        self._decode_pending()
+        return super()._is_field_set(field_name)
+
+    def __bytes__(self) -> bytes:
+        values = self.__dict__
+        if "_pending" in values and "fields" not in values:
+            data = values["_pending"]
+            return data if isinstance(data, bytes) else Struct.python_to_bytes(data)
+        return super().__bytes__()
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Struct):
+            self._decode_pending()
+            other._decode_pending()
+        return super().__eq__(other)
+
+    def __copy__(self, _: typing.Any = {}) -> Self:
+        values = self.__dict__
+        if "_pending" in values and "fields" not in values:
+            # The pending data is never modified and can be shared
+            return self._from_pending(values["_pending"])
+        return super().__copy__()
+
+    def __deepcopy__(self, _: typing.Any = {}) -> Self:
+        values = self.__dict__
+        if "_pending" in values and "fields" not in values:
+            return self._from_pending(values["_pending"])
+        return super().__deepcopy__()
 
-        for key, val in value.items():
-            fields[key] = Value.from_dict(val)
+    @classmethod
+    def from_dict(cls, value, *, ignore_unknown_fields: bool = False) -> Self:
+        assert isinstance(value, dict)
 
-        return cls(fields=fields)  # type: ignore[reportArgumentType]
+        # The values are copied and checked, and only converted to messages if the fields are accessed
+        return cls._from_pending(Value.copy_python(value))
 
     def to_dict(
         self,
@@ -3436,6 +4183,11 @@ class Struct(aristaproto.Message):
         # If the output format is PYTHON, we should have kept the wrapped type without building the real class
         assert output_format == aristaproto.OutputFormat.PROTO_JSON
 
+        values = self.__dict__
+        if "_pending" in values and "fields" not in values:
+            data = values["_pending"]
+            return Struct.bytes_to_python(data) if isinstance(data, bytes) else Value.copy_python(data)
+
         return {
             key: value.to_dict(
                 output_format=output_format, casing=casing, include_default_values=include_default_values
@@ -3443,6 +4195,75 @@ class Struct(aristaproto.Message):
             for key, value in self.fields.items()
         }
 
+    @staticmethod
+    def bytes_to_python(data: bytes) -> dict[str, typing.Any]:
+        """
+        Decode a binary encoded ``Struct`` directly to a dict of plain Python values, as returned by ``to_dict``,
+        without building the intermediate messages.
+        """
+        result = {}
+        pos = 0
+        end = len(data)
+        while pos < end:
+            num_wire, pos = aristaproto.decode_varint(data, pos)
+            wire_type = num_wire & 0x7
+            if wire_type != aristaproto.WIRE_LEN_DELIM:
+                pos = Value._skip_field(data, pos, wire_type)
+                continue
+
+            length, pos = aristaproto.decode_varint(data, pos)
+            entry_end = pos + length
+            if num_wire >> 3 != 1:
+                pos = entry_end
+                continue
+
+            # Map entry, with the key as field 1 and the value as field 2
+            key = ""
+            value = b""
+            while pos < entry_end:
+                entry_num_wire, pos = aristaproto.decode_varint(data, pos)
+                if entry_num_wire & 0x7 != aristaproto.WIRE_LEN_DELIM:
+                    pos = Value._skip_field(data, pos, entry_num_wire & 0x7)
+                    continue
+                length, pos = aristaproto.decode_varint(data, pos)
+                if entry_num_wire >> 3 == 1:
+                    key = str(data[pos : pos + length], "utf-8")
+                elif entry_num_wire >> 3 == 2:
+                    value = data[pos : pos + length]
+                pos += length
+
+            result[key] = Value.bytes_to_python(value)
+
+        return result
+
+    @staticmethod
+    def python_to_bytes(value: dict[str, typing.Any]) -> bytes:
+        """
+        Encode a dict of plain Python values directly as a binary encoded ``Struct``, without building the
+        intermediate messages. The output is the same as ``bytes(Struct.from_dict(value))``.
+        """
+        assert isinstance(value, dict)
+
+        chunks = []
+        for key, item in value.items():
+            key_bytes = key.encode("utf-8")
+            item_bytes = Value.python_to_bytes(item)
+            entry = b"".join(
+                (
+                    b"\n",
+                    aristaproto.encode_varint(len(key_bytes)),
+                    key_bytes,
+                    b"\x12",
+                    aristaproto.encode_varint(len(item_bytes)),
+                    item_bytes,
+                )
+            )
+            chunks.append(b"\n")
+            chunks.append(aristaproto.encode_varint(len(entry)))
+            chunks.append(entry)
+
+        return b"".join(chunks)
+
 
 default_message_pool.register_message("google.protobuf", "Struct", Struct)
 
@@ -3556,6 +4377,13 @@ class Timestamp(aristaproto.Message):
     inclusive.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "seconds": int,
+            "nanos": int,
+        }
+
     @classmethod
     def from_datetime(cls, dt: datetime.datetime) -> Self:
         seconds, nanos = NanoDatetime.to_timestamp(dt)
@@ -3571,7 +4399,8 @@ class Timestamp(aristaproto.Message):
     @classmethod
     def from_dict(cls, value, *, ignore_unknown_fields: bool = False) -> Self:
         if isinstance(value, str):
-            return cls.from_datetime(NanoDatetime.from_rfc3339(value))
+            seconds, nanos = NanoDatetime.rfc3339_to_timestamp(value)
+            return cls(seconds, nanos)
 
         return super().from_dict(value, ignore_unknown_fields=ignore_unknown_fields)
 
@@ -3585,7 +4414,7 @@ class Timestamp(aristaproto.Message):
         # If the output format is PYTHON, we should have kept the wraped type without building the real class
         assert output_format == aristaproto.OutputFormat.PROTO_JSON
 
-        return Timestamp.timestamp_to_json(self.to_datetime())
+        return NanoDatetime.timestamp_to_rfc3339(self.seconds, self.nanos)
 
     @staticmethod
     def from_wrapped(wrapped: datetime.datetime) -> "Timestamp":
@@ -3594,6 +4423,17 @@ class Timestamp(aristaproto.Message):
     def to_wrapped(self) -> datetime.datetime:
         return self.to_datetime()
 
+    @staticmethod
+    def decode_wrapped(data: bytes) -> datetime.datetime:
+        seconds, nanos = aristaproto.decode_scalar_fields(data, (aristaproto.TYPE_INT64, aristaproto.TYPE_INT32))
+        return NanoDatetime.from_timestamp(seconds, nanos)
+
+    @staticmethod
+    def encode_wrapped(wrapped: datetime.datetime) -> bytes:
+        return aristaproto.encode_scalar_fields(
+            NanoDatetime.to_timestamp(wrapped), (aristaproto.TYPE_INT64, aristaproto.TYPE_INT32)
+        )
+
 
 default_message_pool.register_message("google.protobuf", "Timestamp", Timestamp)
 
@@ -3639,6 +4479,18 @@ class Type(aristaproto.Message):
     The source edition string, only valid when syntax is SYNTAX_EDITIONS.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "name": str,
+            "fields": list[Field],
+            "oneofs": list[str],
+            "options": list[Option],
+            "source_context": SourceContext | None,
+            "syntax": Syntax,
+            "edition": str,
+        }
+
 
 default_message_pool.register_message("google.protobuf", "Type", Type)
 
@@ -3656,6 +4508,12 @@ class UInt32Value(aristaproto.Message):
     The uint32 value.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "value": int,
+        }
+
     @classmethod
     def from_dict(cls, value, *, ignore_unknown_fields: bool = False) -> Self:
         if isinstance(value, int):
@@ -3678,6 +4536,14 @@ class UInt32Value(aristaproto.Message):
     def to_wrapped(self) -> int:
         return self.value
 
+    @staticmethod
+    def decode_wrapped(data: bytes) -> int:
+        return aristaproto.decode_scalar_fields(data, (aristaproto.TYPE_UINT32,))[0]
+
+    @staticmethod
+    def encode_wrapped(wrapped: int) -> bytes:
+        return aristaproto.encode_scalar_fields((wrapped,), (aristaproto.TYPE_UINT32,))
+
 
 default_message_pool.register_message("google.protobuf", "UInt32Value", UInt32Value)
 
@@ -3695,6 +4561,12 @@ class UInt64Value(aristaproto.Message):
     The uint64 value.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "value": int,
+        }
+
     @classmethod
     def from_dict(cls, value, *, ignore_unknown_fields: bool = False) -> Self:
         if isinstance(value, int):
@@ -3717,6 +4589,14 @@ class UInt64Value(aristaproto.Message):
     def to_wrapped(self) -> int:
         return self.value
 
+    @staticmethod
+    def decode_wrapped(data: bytes) -> int:
+        return aristaproto.decode_scalar_fields(data, (aristaproto.TYPE_UINT64,))[0]
+
+    @staticmethod
+    def encode_wrapped(wrapped: int) -> bytes:
+        return aristaproto.encode_scalar_fields((wrapped,), (aristaproto.TYPE_UINT64,))
+
 
 default_message_pool.register_message("google.protobuf", "UInt64Value", UInt64Value)
 
@@ -3750,6 +4630,18 @@ class UninterpretedOption(aristaproto.Message):
 
     aggregate_value: "str" = aristaproto.field(8, aristaproto.TYPE_STRING)
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "name": list[UninterpretedOptionNamePart],
+            "identifier_value": str,
+            "positive_int_value": int,
+            "negative_int_value": int,
+            "double_value": float,
+            "string_value": bytes,
+            "aggregate_value": str,
+        }
+
 
 default_message_pool.register_message("google.protobuf", "UninterpretedOption", UninterpretedOption)
 
@@ -3768,6 +4660,13 @@ class UninterpretedOptionNamePart(aristaproto.Message):
 
     is_extension: "bool" = aristaproto.field(2, aristaproto.TYPE_BOOL)
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "name_part": str,
+            "is_extension": bool,
+        }
+
 
 default_message_pool.register_message("google.protobuf", "UninterpretedOption.NamePart", UninterpretedOptionNamePart)
 
@@ -3816,6 +4715,17 @@ class Value(aristaproto.Message):
     Represents a repeated `Value`.
     """
 
+    @staticmethod
+    def _aristaproto_field_types() -> dict:
+        return {
+            "null_value": NullValue | None,
+            "number_value": float | None,
+            "string_value": str | None,
+            "bool_value": bool | None,
+            "struct_value": Struct | None,
+            "list_value": ListValue | None,
+        }
+
     @classmethod
     def from_dict(cls, value, *, ignore_unknown_fields: bool = False) -> Self:
         match value:
@@ -3854,10 +4764,109 @@ class Value(aristaproto.Message):
                 return s
             case Value(list_value=ListValue(values=l)):
                 return [v.to_dict() for v in l]
-            case Value(struct_value=Struct(fields=f)):
-                return {k: v.to_dict() for k, v in f.items()}
+            case Value(struct_value=Struct() as s):
+                # Without reading the fields, which may not be decoded yet
+                return s.to_dict()
 
         raise ValueError("Invalid value")
 
+    @staticmethod
+    def bytes_to_python(data: bytes) -> typing.Any:
+        """
+        Decode a binary encoded ``Value`` directly to a plain Python value, as returned by ``to_dict``, without
+        building the intermediate messages.
+        """
+        result = None
+        has_kind = False
+        pos = 0
+        end = len(data)
+        while pos < end:
+            num_wire, pos = aristaproto.decode_varint(data, pos)
+            number = num_wire >> 3
+            wire_type = num_wire & 0x7
+
+            if number == 1 and wire_type == aristaproto.WIRE_VARINT:
+                _, pos = aristaproto.decode_varint(data, pos)
+                result = None
+            elif number == 2 and wire_type == aristaproto.WIRE_FIXED_64:
+                result = struct.unpack_from("<d", data, pos)[0]
+                pos += 8
+            elif number == 4 and wire_type == aristaproto.WIRE_VARINT:
+                flag, pos = aristaproto.decode_varint(data, pos)
+                result = flag > 0
+            elif number in (3, 5, 6) and wire_type == aristaproto.WIRE_LEN_DELIM:
+                length, pos = aristaproto.decode_varint(data, pos)
+                nested = data[pos : pos + length]
+                pos += length
+                if number == 3:
+                    result = str(nested, "utf-8")
+                elif number == 5:
+                    result = Struct.bytes_to_python(nested)
+                else:
+                    result = ListValue.bytes_to_python(nested)
+            else:
+                pos = Value._skip_field(data, pos, wire_type)
+                continue
+
+            has_kind = True
+
+        # The kind of value must be set
+        if not has_kind:
+            raise ValueError("Invalid value")
+        return result
+
+    @staticmethod
+    def python_to_bytes(value: typing.Any) -> bytes:
+        """
+        Encode a plain Python value directly as a binary encoded ``Value``, without building the intermediate
+        messages. The output is the same as ``bytes(Value.from_dict(value))``.
+        """
+        match value:
+            case bool() as b:
+                return b"\x20\x01" if b else b"\x20\x00"
+            case int() | float() as num:
+                return b"\x11" + struct.pack("<d", num)
+            case str() as s:
+                encoded = s.encode("utf-8")
+                return b"\x1a" + aristaproto.encode_varint(len(encoded)) + encoded
+            case list() as l:
+                encoded = ListValue.python_to_bytes(l)
+                return b"\x32" + aristaproto.encode_varint(len(encoded)) + encoded
+            case dict() as d:
+                encoded = Struct.python_to_bytes(d)
+                return b"\x2a" + aristaproto.encode_varint(len(encoded)) + encoded
+            case None:
+                return b"\x08\x00"
+        raise ValueError(f"Unknown value type: {type(value)}")
+
+    @staticmethod
+    def copy_python(value: typing.Any) -> typing.Any:
+        """
+        Return a copy of a plain Python value, as accepted by ``from_dict``, without building the intermediate
+        messages. The dicts and lists are copied recursively.
+        """
+        match value:
+            case bool() | int() | float() | str() | None:
+                return value
+            case list() as l:
+                return [Value.copy_python(item) for item in l]
+            case dict() as d:
+                return {key: Value.copy_python(item) for key, item in d.items()}
+        raise ValueError(f"Unknown value type: {type(value)}")
+
+    @staticmethod
+    def _skip_field(data: bytes, pos: int, wire_type: int) -> int:
+        """Returns the position after the value of an unknown field, given the position after its tag."""
+        if wire_type == aristaproto.WIRE_VARINT:
+            return aristaproto.decode_varint(data, pos)[1]
+        if wire_type == aristaproto.WIRE_FIXED_64:
+            return pos + 8
+        if wire_type == aristaproto.WIRE_FIXED_32:
+            return pos + 4
+        if wire_type == aristaproto.WIRE_LEN_DELIM:
+            length, pos = aristaproto.decode_varint(data, pos)
+            return pos + length
+        raise ValueError(f"Unsupported wire type: {wire_type}")
+
 
 default_message_pool.register_message("google.protobuf", "Value", Value)
@@ -1,3 +1,75 @@
 import aristaproto
 
 default_message_pool = aristaproto.MessagePool()
+default_message_pool.index_modules(
+    __package__ or "",
+    {
+        "google.protobuf": (
+            "Any",
+            "Api",
+            "BoolValue",
+            "BytesValue",
+            "DescriptorProto",
+            "DescriptorProto.ExtensionRange",
+            "DescriptorProto.ReservedRange",
+            "DoubleValue",
+            "Duration",
+            "Empty",
+            "Enum",
+            "EnumDescriptorProto",
+            "EnumDescriptorProto.EnumReservedRange",
+            "EnumOptions",
+            "EnumValue",
+            "EnumValueDescriptorProto",
+            "EnumValueOptions",
+            "ExtensionRangeOptions",
+            "ExtensionRangeOptions.Declaration",
+            "FeatureSet",
+            "FeatureSetDefaults",
+            "FeatureSetDefaults.FeatureSetEditionDefault",
+            "Field",
+            "FieldDescriptorProto",
+            "FieldMask",
+            "FieldOptions",
+            "FieldOptions.EditionDefault",
+            "FieldOptions.FeatureSupport",
+            "FileDescriptorProto",
+            "FileDescriptorSet",
+            "FileOptions",
+            "FloatValue",
+            "GeneratedCodeInfo",
+            "GeneratedCodeInfo.Annotation",
+            "Int32Value",
+            "Int64Value",
+            "ListValue",
+            "MessageOptions",
+            "Method",
+            "MethodDescriptorProto",
+            "MethodOptions",
+            "Mixin",
+            "OneofDescriptorProto",
+            "OneofOptions",
+            "Option",
+            "ServiceDescriptorProto",
+            "ServiceOptions",
+            "SourceCodeInfo",
+            "SourceCodeInfo.Location",
+            "SourceContext",
+            "StringValue",
+            "Struct",
+            "Timestamp",
+            "Type",
+            "UInt32Value",
+            "UInt64Value",
+            "UninterpretedOption",
+            "UninterpretedOption.NamePart",
+            "Value",
+        ),
+        "google.protobuf.compiler": (
+            "CodeGeneratorRequest",
+            "CodeGeneratorResponse",
+            "CodeGeneratorResponse.File",
+            "Version",
+        ),
+    },
+)
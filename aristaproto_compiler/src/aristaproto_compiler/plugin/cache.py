@@ -0,0 +1,168 @@
+import dataclasses
+import functools
+import hashlib
+import json
+import os
+import subprocess
+import tempfile
+from importlib import metadata
+from pathlib import Path
+
+import aristaproto
+
+from aristaproto_compiler.lib.google.protobuf import FileDescriptorProto
+from aristaproto_compiler.settings import Settings
+
+from .models import OutputTemplate
+
+
+class OutputCache:
+    """
+    Persistent cache of the generated files of the output packages, for the `cache_dir` option.
+
+    The files of a package are reused when the package is generated again with the same inputs, which are the proto
+    files of the package and the files they import, the settings other than the cache directory, and the version of
+    the compiler and of the formatter.
+
+    The cache is unbounded: the files are never deleted, even when they can no longer be reused, so the directory can
+    be cleared when it grows too large.
+
+    Parameters
+    -----------
+    directory: :class:`str`
+        The directory containing the cached files, which is created if it does not exist.
+    proto_files: list[:class:`FileDescriptorProto`]
+        The proto files of the request.
+    settings: :class:`Settings`
+        The settings of the compiler.
+    serialized_proto_files: Optional[list[:class:`bytes`]]
+        The proto files as they were serialized in the request. The proto files are serialized again when they are
+        not given, which is slower.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        proto_files: list[FileDescriptorProto],
+        settings: Settings,
+        serialized_proto_files: list[bytes] | None = None,
+    ) -> None:
+        self.directory = Path(directory)
+        self._proto_files = {proto_file.name: proto_file for proto_file in proto_files}
+        self._serialized_files: dict[str, bytes] = {}
+        for serialized in serialized_proto_files or ():
+            # The files are matched by name rather than by position, the name being the first field of the files
+            name = next((field.value for field in aristaproto.parse_fields(serialized) if field.number == 1), b"")
+            self._serialized_files[name.decode()] = serialized
+
+        settings_values = {
+            name: sorted(value) if isinstance(value, frozenset) else str(value)
+            for name, value in dataclasses.asdict(settings).items()
+            if name != "cache_dir"
+        }
+        self._environment_key = json.dumps(
+            {
+                "compiler": _compiler_fingerprint(),
+                "formatter": _formatter_version(),
+                "settings": settings_values,
+            },
+            sort_keys=True,
+        ).encode()
+
+    def key(self, output_file: OutputTemplate) -> str:
+        """Return the hash of the inputs of an output package."""
+        digest = hashlib.sha256(self._environment_key)
+
+        # The files of the package first, in the order of the request, then the files they import
+        names = [input_file.name for input_file in output_file.input_files]
+        dependencies = sorted(self._dependencies(names) - set(names))
+        for name in [*names, "", *dependencies]:
+            serialized = self._serialize(name) if name else b""
+            digest.update(len(name).to_bytes(4, "little") + name.encode())
+            digest.update(len(serialized).to_bytes(8, "little") + serialized)
+
+        return digest.hexdigest()
+
+    def get(self, key: str) -> dict[str, str] | None:
+        """Return the cached files of a package, by file name in the package directory, or `None` if not cached."""
+        try:
+            with self._path(key).open(encoding="utf-8") as f:
+                files = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        # A file that is truncated or was not written by the compiler is ignored, and replaced by `put`
+        if not isinstance(files, dict) or not all(
+            isinstance(name, str) and isinstance(content, str) for name, content in files.items()
+        ):
+            return None
+        return files
+
+    def put(self, key: str, files: dict[str, str]) -> None:
+        """Store the files of a package, by file name in the package directory."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # Written to a temporary file first, since several compilations can share the cache
+        fd, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(files, f)
+            os.replace(temporary_path, self._path(key))
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _serialize(self, name: str) -> bytes:
+        serialized = self._serialized_files.get(name)
+        if serialized is None:
+            proto_file = self._proto_files.get(name)
+            serialized = bytes(proto_file) if proto_file is not None else b""
+            self._serialized_files[name] = serialized
+        return serialized
+
+    def _dependencies(self, names: list[str]) -> set[str]:
+        # The imported files, transitively, since they determine the names and the kinds of the referenced types
+        found: set[str] = set()
+        pending = list(names)
+        while pending:
+            name = pending.pop()
+            if name in found:
+                continue
+            found.add(name)
+            proto_file = self._proto_files.get(name)
+            if proto_file is not None:
+                pending.extend(proto_file.dependency)
+        return found
+
+
+@functools.cache
+def _compiler_fingerprint() -> str:
+    distribution = metadata.distribution("aristaproto_compiler")
+    digest = hashlib.sha256(distribution.version.encode())
+
+    # The RECORD of a regular installation lists the hash of each file. The sources of an editable installation are
+    # not listed, so they are hashed instead, so that the cache is not reused by development versions of the compiler.
+    record = distribution.read_text("RECORD") or ""
+    if "aristaproto_compiler/__init__.py," in record:
+        digest.update(record.encode())
+        return digest.hexdigest()
+
+    package_directory = Path(__file__).parent.parent
+    for path in sorted(package_directory.rglob("*")):
+        if path.suffix in (".py", ".j2"):
+            digest.update(str(path.relative_to(package_directory)).encode())
+            digest.update(path.read_bytes())
+
+    return digest.hexdigest()
+
+
+@functools.cache
+def _formatter_version() -> str:
+    try:
+        return metadata.version("ruff")
+    except metadata.PackageNotFoundError:
+        # A formatter installed without pip
+        return subprocess.check_output(["ruff", "--version"], encoding="utf-8").strip()
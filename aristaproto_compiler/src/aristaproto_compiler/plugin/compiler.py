@@ -5,24 +5,58 @@ from importlib import metadata
 
 import jinja2
 
+from ..compile.stubs import stub_source
 from .models import OutputTemplate
 from .module_validation import ModuleValidator
 
 
-def outputfile_compiler(output_file: OutputTemplate) -> str:
+def _environment() -> jinja2.Environment:
     templates_folder = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "templates"))
 
-    version = metadata.version("aristaproto_compiler")
-
-    env = jinja2.Environment(
+    return jinja2.Environment(
         trim_blocks=True,
         lstrip_blocks=True,
         loader=jinja2.FileSystemLoader(templates_folder),
         undefined=jinja2.StrictUndefined,
     )
 
+
+def package_compiler(output_file: OutputTemplate) -> dict[str, str]:
+    """Renders the files of an output.
+
+    Returns
+    -------
+    dict[str, str]
+        The source of each file, by file name in the package directory.
+    """
+    if output_file.settings.lazy_submodules:
+        return lazy_package_compiler(output_file)
+
+    files = {"__init__.py": outputfile_compiler(output_file)}
+    if output_file.settings.documented_stubs:
+        files["__init__.pyi"] = stub_compiler(output_file)
+    return files
+
+
+def outputfile_compiler(output_file: OutputTemplate, all: list[str] | None = None) -> str:
+    """Renders the module of an output. The symbols defined by the module are appended to `all` if it is given."""
+    return _format(_render(output_file, all, comments=not output_file.settings.strip_comments))
+
+
+def stub_compiler(output_file: OutputTemplate) -> str:
+    """Renders the `.pyi` stub of the module of an output, with the documentation of the proto files."""
+    return _format(stub_source(_format(_render(output_file, None, comments=True))))
+
+
+def _render(output_file: OutputTemplate, all: list[str] | None, comments: bool) -> str:
+    version = metadata.version("aristaproto_compiler")
+
+    env = _environment()
+    env.globals["comments"] = comments
+
     # List of the symbols that should appear in the `__all__` variable of the file
-    all: list[str] = []
+    if all is None:
+        all = []
 
     def add_to_all(name: str) -> str:
         all.append(name)
@@ -35,8 +69,34 @@ def outputfile_compiler(output_file: OutputTemplate) -> str:
 
     # Load the body first do know the symbols defined in the file
     code = body_template.render(output_file=output_file)
-    code = header_template.render(output_file=output_file, version=version, all=all) + "\n" + code
+    return header_template.render(output_file=output_file, version=version, all=all) + "\n" + code
+
+
+def lazy_package_compiler(output_file: OutputTemplate) -> dict[str, str]:
+    """Renders the modules of an output with the `lazy_submodules` option.
+
+    Returns
+    -------
+    dict[str, str]
+        The source of each module, by file name in the package directory. The `__init__.py` module imports the
+        submodule defining each symbol on first access. With the `documented_stubs` option, each submodule has a
+        `.pyi` stub.
+    """
+    files: dict[str, str] = {}
+    names: dict[str, list[str]] = {}
+
+    for submodule, submodule_output in output_file.submodules.items():
+        names[submodule] = []
+        files[f"{submodule}.py"] = outputfile_compiler(submodule_output, names[submodule])
+        if output_file.settings.documented_stubs:
+            files[f"{submodule}.pyi"] = stub_compiler(submodule_output)
+
+    code = _environment().get_template("lazy_package.py.j2").render(output_file=output_file, names=names)
+    files["__init__.py"] = _format(code)
+    return files
+
 
+def _format(code: str) -> str:
     try:
         # Sort imports, delete unused ones, sort __all__
         code = subprocess.check_output(
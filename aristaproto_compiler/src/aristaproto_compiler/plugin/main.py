@@ -3,6 +3,8 @@
 import os
 import sys
 
+import aristaproto
+
 from aristaproto_compiler.lib.google.protobuf.compiler import (
     CodeGeneratorRequest,
 )
@@ -21,8 +23,11 @@ def main() -> None:
     if dump_file:
         dump_request(dump_file, request)
 
+    # Keep the serialized proto files, to compute the keys of the cache without serializing them again
+    serialized_proto_files = [field.value for field in aristaproto.parse_fields(data) if field.number == 15]
+
     # Generate code
-    response = generate_code(request)
+    response = generate_code(request, serialized_proto_files)
 
     # Serialise response message
     output = response.SerializeToString()
@@ -32,11 +32,13 @@ from dataclasses import dataclass, field
 from aristaproto import unwrap
 
 from aristaproto_compiler import casing
+from aristaproto_compiler.compile.codecs import decode_method_source, encode_method_source, supports_codecs
 from aristaproto_compiler.compile.importing import get_type_reference, parse_source_type_name
 from aristaproto_compiler.compile.naming import (
     pythonize_class_name,
     pythonize_field_name,
     pythonize_method_name,
+    pythonize_submodule_name,
 )
 from aristaproto_compiler.known_types import KNOWN_IMPORTS, KNOWN_METHODS, WRAPPED_TYPES
 from aristaproto_compiler.lib.google.protobuf import (
@@ -186,6 +188,7 @@ class OutputTemplate:
     package_proto_obj: FileDescriptorProto
     input_files: list[FileDescriptorProto] = field(default_factory=list)
     imports_end: set[str] = field(default_factory=set)
+    imports_end_by_file: dict[str, set[str]] = field(default_factory=dict)
     messages: dict[str, "MessageCompiler"] = field(default_factory=dict)
     enums: dict[str, "EnumDefinitionCompiler"] = field(default_factory=dict)
     services: dict[str, "ServiceCompiler"] = field(default_factory=dict)
@@ -270,6 +273,58 @@ class OutputTemplate:
             or self.generates_grpclib_async_server
         )
 
+    def imports_for(self, source_file: FileDescriptorProto) -> set[str]:
+        """The imports placed at the end of the module defining the types of an input file.
+
+        Returns
+        -------
+        set[str]
+            The imports of the package module, or of the submodule of the input file with the `lazy_submodules`
+            option.
+        """
+        if self.settings.lazy_submodules:
+            return self.imports_end_by_file.setdefault(source_file.name, set())
+        return self.imports_end
+
+    @property
+    def submodules(self) -> dict[str, "OutputTemplate"]:
+        """Outputs of the input files defining types, for the `lazy_submodules` option.
+
+        Returns
+        -------
+        dict[str, OutputTemplate]
+            The output of each input file, by name of its submodule in the package.
+
+        Raises
+        ------
+        ValueError
+            Two input files have the same submodule name, such as `a/b.proto` and `a_b.proto`.
+        """
+        outputs: dict[str, OutputTemplate] = {}
+
+        for source_file in sorted(self.input_files, key=lambda f: f.name):
+            output = OutputTemplate(
+                parent_request=self.parent_request,
+                package_proto_obj=self.package_proto_obj,
+                input_files=[source_file],
+                imports_end=self.imports_for(source_file),
+                messages={k: v for k, v in self.messages.items() if v.source_file.name == source_file.name},
+                enums={k: v for k, v in self.enums.items() if v.source_file.name == source_file.name},
+                services={k: v for k, v in self.services.items() if v.source_file.name == source_file.name},
+                settings=self.settings,
+            )
+            if output.messages or output.enums or output.services:
+                submodule = pythonize_submodule_name(source_file.name)
+                if submodule in outputs:
+                    raise ValueError(
+                        f"The files {outputs[submodule].input_files[0].name} and {source_file.name} of the package "
+                        f"{self.package} would both be generated in the submodule {submodule}, rename one of them to "
+                        "use the lazy_submodules option"
+                    )
+                outputs[submodule] = output
+
+        return outputs
+
     def get_descriptor_name(self, source_file: FileDescriptorProto):
         return f"{source_file.name.replace('/', '_').replace('.', '_').upper()}_DESCRIPTOR"
 
@@ -280,7 +335,7 @@ class OutputTemplate:
         Returns
         -------
         str
-            A list of pool registrations for proto descriptors.
+            A list of records of the serialized proto descriptors, added to the pool on first use.
         """
         descriptors: list[str] = []
 
@@ -290,7 +345,8 @@ class OutputTemplate:
             f.source_code_info = None
 
             descriptors.append(
-                f"{self.get_descriptor_name(f)} = default_google_proto_descriptor_pool.AddSerializedFile({bytes(f)})"
+                "default_google_proto_descriptor_files.add_serialized_file("
+                f"{f.name!r}, {bytes(f)}, {tuple(f.dependency)})"
             )
 
             f.source_code_info = source_code_info
@@ -330,6 +386,18 @@ class MessageCompiler(ProtoContentBase):
     def deprecated(self) -> bool:
         return bool(self.proto_obj.options and self.proto_obj.options.deprecated)
 
+    @property
+    def full_proto_name(self) -> str:
+        return f"{self.source_file.package}.{self.prefixed_proto_name}".lstrip(".")
+
+    @property
+    def intern_strings(self) -> bool:
+        """Whether the strings of all the fields of the message are interned when parsing."""
+        return any(
+            self.full_proto_name == name or self.full_proto_name.startswith(f"{name}.")
+            for name in self.output_file.settings.intern_strings
+        )
+
     @property
     def deprecated_fields(self) -> Iterator[str]:
         for f in self.fields:
@@ -357,6 +425,16 @@ class MessageCompiler(ProtoContentBase):
 
         return methods_source
 
+    @property
+    def codec_methods(self) -> list[str]:
+        """
+        Return the encoding and decoding methods generated with the `codegen_codecs` option.
+        """
+        if not supports_codecs(self):
+            return []
+
+        return [encode_method_source(self), decode_method_source(self)]
+
     @property
     def custom_imports(self) -> tuple[str, ...]:
         """
@@ -439,12 +517,26 @@ class FieldCompiler(ProtoContentBase):
             args.append("repeated=True")
         elif self.field_type == FieldType.ENUM:
             args.append(f"default_factory=lambda: {self.py_type}(0)")
+
+        if self.deprecated:
+            args.append("deprecated=True")
+        if self.intern:
+            args.append("intern=True")
         return args
 
     @property
     def deprecated(self) -> bool:
         return bool(self.proto_obj.options and self.proto_obj.options.deprecated)
 
+    @property
+    def intern(self) -> bool:
+        """Whether the parsed strings of this field are interned, when it isn't already done for the whole message."""
+        return (
+            self.field_type == FieldType.STRING
+            and not self.message.intern_strings
+            and f"{self.message.full_proto_name}.{self.proto_name}" in self.output_file.settings.intern_strings
+        )
+
     @property
     def use_builtins(self) -> bool:
         return self.py_type in self.message.builtins_types or (
@@ -474,6 +566,14 @@ class FieldCompiler(ProtoContentBase):
         """Pythonized name."""
         return pythonize_field_name(self.proto_name)
 
+    @property
+    def attribute_name(self) -> str:
+        """Name of the dataclass field, which Python mangles if it starts with two underscores."""
+        name = self.py_name
+        if name.startswith("__") and not name.endswith("__"):
+            return f"_{self.message.py_name.lstrip('_')}{name}"
+        return name
+
     @property
     def proto_name(self) -> str:
         """Original protobuf name."""
@@ -502,11 +602,12 @@ class FieldCompiler(ProtoContentBase):
             # Type referencing another defined Message or a named enum
             return get_type_reference(
                 package=self.output_file.package,
-                imports=self.output_file.imports_end,
+                imports=self.output_file.imports_for(self.source_file),
                 source_type=self.proto_obj.type_name,
                 request=self.output_file.parent_request,
                 wrap=wrap,
                 settings=self.output_file.settings,
+                source_file_name=self.source_file.name,
             )
         else:
             raise NotImplementedError(f"Unknown type {self.proto_obj.type}")
@@ -548,13 +649,21 @@ class FieldCompiler(ProtoContentBase):
 
     @property
     def annotation(self) -> str:
+        return self._annotation(pydantic_annotations=self.output_file.settings.pydantic_dataclasses)
+
+    @property
+    def type_hint(self) -> str:
+        """The type of the field, as given by `typing.get_type_hints` on the annotation."""
+        return self._annotation(pydantic_annotations=False)
+
+    def _annotation(self, pydantic_annotations: bool) -> str:
         py_type = self.py_type
 
         if self.use_builtins:
             py_type = f"builtins.{py_type}"
 
         # Add the pydantic annotation if needed
-        if self.output_file.settings.pydantic_dataclasses:
+        if pydantic_annotations:
             annotations = self.annotations
             if annotations:
                 py_type = f"typing.Annotated[{py_type}, {', '.join(annotations)}]"
@@ -636,12 +745,15 @@ class MapEntryCompiler(FieldCompiler):
         if self.unwrap_v:
             unwrap_2 = f", unwrap_2=lambda: {self.unwrap_v}"
 
+        deprecated = ", deprecated=True" if self.deprecated else ""
+        intern = ", intern=True" if self.intern else ""
+
         aristaproto_field_type = (
             "aristaproto.field("
             f"{self.proto_obj.number}, "
             "aristaproto.TYPE_MAP, "
             f"map_meta=aristaproto.map_meta({proto_type_1}, {proto_type_2}{unwrap_2})"
-            ")"
+            f"{deprecated}{intern})"
         )
         if self.py_name in dir(builtins):
             self.message.builtins_types.add(self.py_name)
@@ -651,10 +763,22 @@ class MapEntryCompiler(FieldCompiler):
     def annotation(self) -> str:
         return f"dict[{self.py_k_type}, {self.py_v_type}]"
 
+    @property
+    def type_hint(self) -> str:
+        return self.annotation
+
     @property
     def repeated(self) -> bool:
         return False  # maps cannot be repeated
 
+    @property
+    def intern(self) -> bool:
+        return (
+            "STRING" in (self.proto_k_type, self.proto_v_type)
+            and not self.message.intern_strings
+            and f"{self.message.full_proto_name}.{self.proto_name}" in self.output_file.settings.intern_strings
+        )
+
 
 @dataclass(kw_only=True)
 class OneofCompiler(ProtoContentBase):
@@ -804,11 +928,12 @@ class ServiceMethodCompiler(ProtoContentBase):
         """
         return get_type_reference(
             package=self.parent.output_file.package,
-            imports=self.parent.output_file.imports_end,
+            imports=self.parent.output_file.imports_for(self.parent.source_file),
             source_type=self.proto_obj.input_type,
             request=self.parent.output_file.parent_request,
             wrap=False,
             settings=self.parent.output_file.settings,
+            source_file_name=self.parent.source_file.name,
         )
 
     @property
@@ -831,11 +956,12 @@ class ServiceMethodCompiler(ProtoContentBase):
         """
         return get_type_reference(
             package=self.parent.output_file.package,
-            imports=self.parent.output_file.imports_end,
+            imports=self.parent.output_file.imports_for(self.parent.source_file),
             source_type=self.proto_obj.output_type,
             request=self.parent.output_file.parent_request,
             wrap=False,
             settings=self.parent.output_file.settings,
+            source_file_name=self.parent.source_file.name,
         )
 
     @property
@@ -2,6 +2,7 @@ import pathlib
 import sys
 from collections.abc import Generator
 
+from aristaproto_compiler.compile.naming import pythonize_submodule_name
 from aristaproto_compiler.lib.google.protobuf import (
     DescriptorProto,
     EnumDescriptorProto,
@@ -22,7 +23,8 @@ from aristaproto_compiler.settings import (
     Settings,
 )
 
-from .compiler import outputfile_compiler
+from .cache import OutputCache
+from .compiler import package_compiler
 from .models import (
     EnumDefinitionCompiler,
     FieldCompiler,
@@ -72,6 +74,8 @@ def get_settings(plugin_options: list[str]) -> Settings:
     client_async_transport = ClientAsyncTransport.GRPCLIB
     server_generation = ServerGeneration.NONE
     server_async_transport = ServerAsyncTransport.GRPCLIB
+    intern_strings: set[str] = set()
+    cache_dir: str | None = None
 
     for opt in plugin_options:
         if opt.startswith("client_generation="):
@@ -102,6 +106,20 @@ def get_settings(plugin_options: list[str]) -> Settings:
             except ValueError:
                 raise ValueError(f"Invalid server_async_transport option: {name}")
 
+        if opt.startswith("intern_strings="):
+            intern_strings.add(opt.split("=")[1])
+
+        if opt.startswith("cache_dir="):
+            cache_dir = opt.split("=", 1)[1]
+
+    if "lazy_submodules" in plugin_options and "google_protobuf_descriptors" in plugin_options:
+        # The descriptors of a file can only be added to the pool after the descriptors of its dependencies
+        raise ValueError("The lazy_submodules option can't be used with the google_protobuf_descriptors option")
+
+    if "documented_stubs" in plugin_options and "strip_comments" not in plugin_options:
+        # The modules already have the documentation
+        raise ValueError("The documented_stubs option can only be used with the strip_comments option")
+
     return Settings(
         pydantic_dataclasses="pydantic_dataclasses" in plugin_options,
         google_protobuf_descriptors="google_protobuf_descriptors" in plugin_options,
@@ -109,10 +127,30 @@ def get_settings(plugin_options: list[str]) -> Settings:
         client_async_transport=client_async_transport,
         server_generation=server_generation,
         server_async_transport=server_async_transport,
+        intern_strings=frozenset(intern_strings),
+        codegen_codecs="codegen_codecs" in plugin_options,
+        lazy_submodules="lazy_submodules" in plugin_options,
+        lazy_enums="lazy_enums" in plugin_options,
+        strip_comments="strip_comments" in plugin_options,
+        documented_stubs="documented_stubs" in plugin_options,
+        cache_dir=cache_dir,
     )
 
 
-def generate_code(request: CodeGeneratorRequest) -> CodeGeneratorResponse:
+def generate_code(
+    request: CodeGeneratorRequest, serialized_proto_files: list[bytes] | None = None
+) -> CodeGeneratorResponse:
+    """
+    Generate the files of a request of protoc.
+
+    Parameters
+    -----------
+    request: :class:`CodeGeneratorRequest`
+        The request.
+    serialized_proto_files: Optional[list[:class:`bytes`]]
+        The proto files of the request as they were serialized, to compute the keys of the cache of the `cache_dir`
+        option without serializing them again.
+    """
     response = CodeGeneratorResponse(supported_features=CodeGeneratorResponseFeature.PROTO3_OPTIONAL)
 
     plugin_options = request.parameter.split(",") if request.parameter else []
@@ -164,19 +202,28 @@ def generate_code(request: CodeGeneratorRequest) -> CodeGeneratorResponse:
             service.ready()
 
     # Generate output files
+    cache = None
+    if settings.cache_dir:
+        cache = OutputCache(settings.cache_dir, request.proto_file, settings, serialized_proto_files)
     output_paths: set[pathlib.Path] = set()
     for output_package_name, output_package in request_data.output_packages.items():
-        # Add files to the response object
-        output_path = pathlib.Path(*output_package_name.split("."), "__init__.py")
-        output_paths.add(output_path)
+        package_path = pathlib.Path(*output_package_name.split("."))
+
+        # Render and then format the files of the package, unless they are cached
+        if cache is None:
+            files = package_compiler(output_package)
+        else:
+            cache_key = cache.key(output_package)
+            files = cache.get(cache_key)
+            if files is None:
+                files = package_compiler(output_package)
+                cache.put(cache_key, files)
 
-        response.file.append(
-            CodeGeneratorResponseFile(
-                name=str(output_path),
-                # Render and then format the output file
-                content=outputfile_compiler(output_file=output_package),
-            ),
-        )
+        # Add files to the response object
+        for file_name, content in files.items():
+            output_path = package_path / file_name
+            output_paths.add(output_path)
+            response.file.append(CodeGeneratorResponseFile(name=str(output_path), content=content))
 
     # Make each output directory a package with __init__ file
     init_files = {
@@ -191,7 +238,7 @@ def generate_code(request: CodeGeneratorRequest) -> CodeGeneratorResponse:
 
     response.file.append(
         CodeGeneratorResponseFile(
-            name="message_pool.py", content="import aristaproto\n\ndefault_message_pool = aristaproto.MessagePool()\n"
+            name="message_pool.py", content=message_pool_source(request_data.output_packages, settings)
         )
     )
 
@@ -201,8 +248,7 @@ def generate_code(request: CodeGeneratorRequest) -> CodeGeneratorResponse:
         response.file.append(
             CodeGeneratorResponseFile(
                 name="google_proto_descriptor_pool.py",
-                content="from google.protobuf import descriptor_pool\n\n"
-                + "default_google_proto_descriptor_pool = descriptor_pool.DescriptorPool()\n",
+                content=descriptor_pool_source(request_data.output_packages),
             )
         )
 
@@ -212,6 +258,70 @@ def generate_code(request: CodeGeneratorRequest) -> CodeGeneratorResponse:
     return response
 
 
+def message_pool_source(output_packages: dict[str, OutputTemplate], settings: Settings) -> str:
+    """
+    Returns the source of the module defining the message pool of the generated code. The pool indexes the module of
+    each message, so that the modules are only imported when the messages are looked up by type URL.
+    """
+    packages = sorted(
+        (package for package in output_packages.values() if package.messages), key=lambda package: package.package
+    )
+
+    lines = [
+        "import aristaproto",
+        "",
+        "default_message_pool = aristaproto.MessagePool()",
+        "default_message_pool.index_modules(",
+        '    __package__ or "",',
+        "    {",
+    ]
+    for package in packages:
+        lines.append(f'        "{package.package}": (')
+        lines.extend(f'            "{message_name}",' for message_name in sorted(package.messages))
+        lines.append("        ),")
+    lines.append("    },")
+
+    if settings.lazy_submodules:
+        # The messages are defined in the submodules of their package
+        lines.append("    {")
+        for package in packages:
+            lines.append(f'        "{package.package}": {{')
+            lines.extend(
+                f'            "{message_name}": "{pythonize_submodule_name(message.source_file.name)}",'
+                for message_name, message in sorted(package.messages.items())
+            )
+            lines.append("        },")
+        lines.append("    },")
+
+    lines += [")", ""]
+    return "\n".join(lines)
+
+
+def descriptor_pool_source(output_packages: dict[str, OutputTemplate]) -> str:
+    """
+    Returns the source of the module defining the descriptor pool of the generated code, for the
+    `google_protobuf_descriptors` option. The files are indexed by module, so that they can be added to the pool
+    before their modules are imported when other files depend on them.
+    """
+    lines = [
+        "from google.protobuf import descriptor_pool",
+        "",
+        "import aristaproto",
+        "",
+        "default_google_proto_descriptor_pool = descriptor_pool.DescriptorPool()",
+        "default_google_proto_descriptor_files = aristaproto.DescriptorFiles(default_google_proto_descriptor_pool)",
+        "default_google_proto_descriptor_files.index_modules(",
+        '    __package__ or "",',
+        "    {",
+    ]
+    for package in sorted(output_packages.values(), key=lambda package: package.package):
+        lines.append(f'        "{package.package}": (')
+        lines.extend(f'            "{file_name}",' for file_name in package.input_filenames)
+        lines.append("        ),")
+    lines += ["    },", ")", ""]
+    return "\n".join(lines)
+
+
 def read_protobuf_type(
     item: DescriptorProto | EnumDescriptorProto,
     path: list[int],
@@ -84,3 +84,24 @@ class Settings:
     client_async_transport: ClientAsyncTransport
     server_generation: ServerGeneration
     server_async_transport: ServerAsyncTransport
+
+    intern_strings: frozenset[str]
+    """Fully qualified names of the packages, messages and fields whose parsed strings are interned."""
+
+    codegen_codecs: bool
+    """Whether specialized encoding and decoding methods are generated for each message."""
+
+    lazy_submodules: bool
+    """Whether the types of each proto file are generated in their own submodule, imported on first access."""
+
+    lazy_enums: bool
+    """Whether the members of the enums are only created when each enum is first used."""
+
+    strip_comments: bool
+    """Whether the comments of the proto files are left out of the generated modules."""
+
+    documented_stubs: bool
+    """Whether a `.pyi` stub keeping the comments of the proto files is generated next to each module."""
+
+    cache_dir: str | None
+    """Directory of the cache of the generated files, which are reused when their inputs have not changed."""
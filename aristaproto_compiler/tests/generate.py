@@ -17,6 +17,10 @@ async def generate_test(
     reference: bool = False,
     pydantic: bool = False,
     descriptors: bool = False,
+    codecs: bool = False,
+    lazy: bool = False,
+    lazy_enums: bool = False,
+    stubs: bool = False,
     client_generation: str = "async_sync",
     server_generation: str = "async",
     client_async_transport: str | None = None,
@@ -33,6 +37,14 @@ async def generate_test(
         options.append("pydantic")
     if descriptors:
         options.append("descriptors")
+    if codecs:
+        options.append("codecs")
+    if lazy:
+        options.append("lazy")
+    if lazy_enums:
+        options.append("lazy_enums")
+    if stubs:
+        options.append("stubs")
     if client_async_transport is not None:
         options.append(f"client_async_transport_{client_async_transport}")
     if server_async_transport is not None:
@@ -49,6 +61,11 @@ async def generate_test(
         reference=reference,
         pydantic_dataclasses=pydantic,
         google_protobuf_descriptors=descriptors,
+        codegen_codecs=codecs,
+        lazy_submodules=lazy,
+        lazy_enums=lazy_enums,
+        strip_comments=stubs,
+        documented_stubs=stubs,
         client_generation=client_generation,
         server_generation=server_generation,
         client_async_transport=client_async_transport,
@@ -84,7 +101,9 @@ async def main_async():
         generate_test("casing_inner_class", semaphore),
         generate_test("casing", semaphore, reference=True),
         generate_test("casing", semaphore),
+        generate_test("columnar", semaphore),
         generate_test("compiler_lib", semaphore),
+        generate_test("conformance", semaphore, codecs=True),
         generate_test("conformance", semaphore),
         generate_test("deprecated", semaphore, reference=True),
         generate_test("deprecated", semaphore, client_generation="async"),
@@ -96,6 +115,7 @@ async def main_async():
             client_async_transport="grpcio",
         ),
         generate_test("documentation", semaphore, client_generation="async"),
+        generate_test("documentation", semaphore, client_generation="async", stubs=True),
         generate_test(
             "documentation",
             semaphore,
@@ -108,6 +128,8 @@ async def main_async():
         generate_test("double", semaphore),
         generate_test("encoding_decoding", semaphore),
         generate_test("enum", semaphore, reference=True),
+        generate_test("enum", semaphore, codecs=True),
+        generate_test("enum", semaphore, lazy_enums=True),
         generate_test("enum", semaphore),
         generate_test("example_service", semaphore, client_generation="async"),
         generate_test("features", semaphore),
@@ -128,12 +150,16 @@ async def main_async():
         generate_test("googletypes_value", semaphore, reference=True),
         generate_test("googletypes_value", semaphore),
         generate_test("googletypes", semaphore, reference=True),
+        generate_test("googletypes", semaphore, codecs=True),
+        generate_test("googletypes", semaphore, lazy=True),
         generate_test("googletypes", semaphore),
         generate_test("grpclib_reflection", semaphore, descriptors=True, client_generation="async"),
         generate_test("grpclib_reflection", semaphore, client_generation="async"),
         generate_test("import_cousin_package_same_name", semaphore, descriptors=True),
         generate_test("import_cousin_package_same_name", semaphore),
         generate_test("import_service_input_message", semaphore, client_generation="async"),
+        generate_test("import_service_input_message", semaphore, lazy=True, client_generation="async"),
+        generate_test("import_service_input_message", semaphore, lazy=True, stubs=True, client_generation="async"),
         generate_test(
             "import_service_input_message",
             semaphore,
@@ -149,6 +175,7 @@ async def main_async():
         generate_test("manual_validation", semaphore, pydantic=True),
         generate_test("manual_validation", semaphore),
         generate_test("map", semaphore, reference=True),
+        generate_test("map", semaphore, codecs=True),
         generate_test("map", semaphore),
         generate_test("mapmessage", semaphore, reference=True),
         generate_test("mapmessage", semaphore),
@@ -168,6 +195,7 @@ async def main_async():
         generate_test("oneof_enum", semaphore),
         generate_test("oneof", semaphore, pydantic=True),
         generate_test("oneof", semaphore, reference=True),
+        generate_test("oneof", semaphore, codecs=True),
         generate_test("oneof", semaphore),
         generate_test("pickling", semaphore),
         generate_test("proto3_field_presence_oneof", semaphore, reference=True),
@@ -187,6 +215,7 @@ async def main_async():
         generate_test("repeatedmessage", semaphore, reference=True),
         generate_test("repeatedmessage", semaphore),
         generate_test("repeatedpacked", semaphore, reference=True),
+        generate_test("repeatedpacked", semaphore, codecs=True),
         generate_test("repeatedpacked", semaphore),
         generate_test("rpc_empty_input_message", semaphore, client_generation="async"),
         generate_test("service_uppercase", semaphore, client_generation="async"),
@@ -1,14 +1,25 @@
 import pytest
 
-from aristaproto_compiler.lib.google.protobuf import FileDescriptorProto, MethodDescriptorProto, ServiceDescriptorProto
+from aristaproto_compiler.lib.google.protobuf import (
+    DescriptorProto,
+    FieldDescriptorProto,
+    FieldDescriptorProtoLabel,
+    FieldDescriptorProtoType,
+    FileDescriptorProto,
+    MethodDescriptorProto,
+    ServiceDescriptorProto,
+    SourceCodeInfo,
+    SourceCodeInfoLocation,
+)
 from aristaproto_compiler.lib.google.protobuf.compiler import CodeGeneratorRequest
+from aristaproto_compiler.plugin.cache import OutputCache
 from aristaproto_compiler.plugin.models import (
     OutputTemplate,
     PluginRequestCompiler,
     ServiceCompiler,
     ServiceMethodCompiler,
 )
-from aristaproto_compiler.plugin.parser import get_settings
+from aristaproto_compiler.plugin.parser import generate_code, get_settings
 from aristaproto_compiler.settings import (
     ClientAsyncTransport,
     ClientGeneration,
@@ -116,3 +127,307 @@ def test_grpcio_service_and_method_names_omit_package_when_absent():
 
     assert service.grpcio_service_name == "ThingService"
     assert method.grpcio_method_name == "ThingService.DoThing"
+
+
+def test_intern_strings_option():
+    assert get_settings([]).intern_strings == frozenset()
+
+    settings = get_settings(["intern_strings=example.Interface", "intern_strings=example.Route.vrf"])
+    assert settings.intern_strings == {"example.Interface", "example.Route.vrf"}
+
+
+def test_intern_strings_generation():
+    def string_field(name: str, number: int) -> FieldDescriptorProto:
+        return FieldDescriptorProto(
+            name=name,
+            number=number,
+            label=FieldDescriptorProtoLabel.OPTIONAL,
+            type=FieldDescriptorProtoType.STRING,
+        )
+
+    source_file = FileDescriptorProto(
+        name="example.proto",
+        package="example",
+        syntax="proto3",
+        source_code_info=SourceCodeInfo(),
+        message_type=[
+            DescriptorProto(name="Interface", field=[string_field("name", 1)]),
+            DescriptorProto(name="Route", field=[string_field("prefix", 1), string_field("vrf", 2)]),
+        ],
+    )
+    response = generate_code(
+        CodeGeneratorRequest(
+            file_to_generate=[source_file.name],
+            proto_file=[source_file],
+            parameter="intern_strings=example.Interface,intern_strings=example.Route.vrf",
+        )
+    )
+    generated = next(file.content for file in response.file if file.name == "example/__init__.py")
+
+    interface, route = generated.split("class Route")
+    assert "_aristaproto_intern_strings = True" in interface
+    assert "_aristaproto_intern_strings" not in route
+    assert 'prefix: "str" = aristaproto.field(1, aristaproto.TYPE_STRING)' in route
+    assert 'vrf: "str" = aristaproto.field(2, aristaproto.TYPE_STRING, intern=True)' in route
+
+
+def test_codegen_codecs_option():
+    assert get_settings([]).codegen_codecs is False
+    assert get_settings(["codegen_codecs"]).codegen_codecs is True
+
+
+def test_codegen_codecs_generation():
+    source_file = FileDescriptorProto(
+        name="example.proto",
+        package="example",
+        syntax="proto3",
+        source_code_info=SourceCodeInfo(),
+        message_type=[
+            DescriptorProto(
+                name="Interface",
+                field=[
+                    FieldDescriptorProto(
+                        name="mtu",
+                        number=3,
+                        label=FieldDescriptorProtoLabel.OPTIONAL,
+                        type=FieldDescriptorProtoType.SINT32,
+                    )
+                ],
+            ),
+        ],
+    )
+
+    def generate(parameter: str) -> str:
+        response = generate_code(
+            CodeGeneratorRequest(file_to_generate=[source_file.name], proto_file=[source_file], parameter=parameter)
+        )
+        return next(file.content for file in response.file if file.name == "example/__init__.py")
+
+    assert "_aristaproto_encode" not in generate("")
+
+    generated = generate("codegen_codecs")
+    assert "def _aristaproto_encode(self) -> bytes:" in generated
+    assert "def _aristaproto_decode(cls, data: bytes) -> Self:" in generated
+    assert 'output += b"\\x18"' in generated
+    assert "if tag == 24:" in generated
+
+    # The generic methods are used for the pydantic dataclasses, which are validated
+    assert "_aristaproto_encode" not in generate("codegen_codecs,pydantic_dataclasses")
+
+
+def test_lazy_submodules_option():
+    assert get_settings([]).lazy_submodules is False
+    assert get_settings(["lazy_submodules"]).lazy_submodules is True
+
+    with pytest.raises(ValueError, match="can't be used with the google_protobuf_descriptors option"):
+        get_settings(["lazy_submodules", "google_protobuf_descriptors"])
+
+
+def test_lazy_submodules_generation():
+    source_files = [
+        FileDescriptorProto(
+            name="example/interface.proto",
+            package="example",
+            syntax="proto3",
+            source_code_info=SourceCodeInfo(),
+            message_type=[DescriptorProto(name="Interface")],
+        ),
+        FileDescriptorProto(
+            name="example/device.proto",
+            package="example",
+            syntax="proto3",
+            dependency=["example/interface.proto"],
+            source_code_info=SourceCodeInfo(),
+            message_type=[
+                DescriptorProto(
+                    name="Device",
+                    field=[
+                        FieldDescriptorProto(
+                            name="interfaces",
+                            number=1,
+                            label=FieldDescriptorProtoLabel.REPEATED,
+                            type=FieldDescriptorProtoType.MESSAGE,
+                            type_name=".example.Interface",
+                        )
+                    ],
+                ),
+            ],
+        ),
+    ]
+    response = generate_code(
+        CodeGeneratorRequest(
+            file_to_generate=[source_file.name for source_file in source_files],
+            proto_file=source_files,
+            parameter="lazy_submodules",
+        )
+    )
+    files = {file.name: file.content for file in response.file}
+
+    assert {"example/__init__.py", "example/_example_interface.py", "example/_example_device.py"} <= set(files)
+    assert '"Device": "._example_device",' in files["example/__init__.py"]
+    assert '"Interface": "._example_interface",' in files["example/__init__.py"]
+    assert "from . import _example_interface" in files["example/_example_device.py"]
+    assert '"list[_example_interface.Interface]"' in files["example/_example_device.py"]
+    assert '"Device": "_example_device",' in files["message_pool.py"]
+
+
+@pytest.mark.parametrize("file_names", [("a/b.proto", "a_b.proto"), ("x-y.proto", "x_y.proto")])
+def test_lazy_submodules_name_collision(file_names: tuple[str, str]):
+    source_files = [
+        FileDescriptorProto(
+            name=file_name,
+            package="example",
+            syntax="proto3",
+            source_code_info=SourceCodeInfo(),
+            message_type=[DescriptorProto(name=f"Message{index}")],
+        )
+        for index, file_name in enumerate(file_names)
+    ]
+    request = CodeGeneratorRequest(
+        file_to_generate=list(file_names), proto_file=source_files, parameter="lazy_submodules"
+    )
+
+    with pytest.raises(ValueError, match="would both be generated in the submodule"):
+        generate_code(request)
+
+
+def test_lazy_enums_option():
+    assert get_settings([]).lazy_enums is False
+    assert get_settings(["lazy_enums"]).lazy_enums is True
+
+
+def test_strip_comments_option():
+    assert get_settings([]).strip_comments is False
+    assert get_settings(["strip_comments"]).strip_comments is True
+    assert get_settings(["strip_comments", "documented_stubs"]).documented_stubs is True
+
+    with pytest.raises(ValueError, match="can only be used with the strip_comments option"):
+        get_settings(["documented_stubs"])
+
+
+def test_documented_stubs_generation():
+    source_file = FileDescriptorProto(
+        name="example.proto",
+        package="example",
+        syntax="proto3",
+        source_code_info=SourceCodeInfo(
+            location=[SourceCodeInfoLocation(path=[4, 0], leading_comments=" Documentation of the device.\n")]
+        ),
+        message_type=[DescriptorProto(name="Device")],
+    )
+
+    def generate(parameter: str) -> dict[str, str]:
+        response = generate_code(
+            CodeGeneratorRequest(file_to_generate=[source_file.name], proto_file=[source_file], parameter=parameter)
+        )
+        return {file.name: file.content for file in response.file}
+
+    assert "Documentation of the device." in generate("")["example/__init__.py"]
+
+    files = generate("strip_comments")
+    assert "Documentation of the device." not in files["example/__init__.py"]
+    assert "example/__init__.pyi" not in files
+
+    files = generate("strip_comments,documented_stubs")
+    assert "Documentation of the device." not in files["example/__init__.py"]
+    assert "Documentation of the device." in files["example/__init__.pyi"]
+    assert "register_message" not in files["example/__init__.pyi"]
+
+    files = generate("strip_comments,documented_stubs,lazy_submodules")
+    assert "Documentation of the device." in files["example/_example.pyi"]
+
+
+def test_cache_dir_option():
+    assert get_settings([]).cache_dir is None
+    assert get_settings(["cache_dir=/tmp/cache=1"]).cache_dir == "/tmp/cache=1"
+
+
+def test_cache_reuses_generated_files(tmp_path):
+    interface_file = FileDescriptorProto(
+        name="interface.proto",
+        package="interface",
+        syntax="proto3",
+        source_code_info=SourceCodeInfo(),
+        message_type=[DescriptorProto(name="Interface")],
+    )
+    device_file = FileDescriptorProto(
+        name="device.proto",
+        package="device",
+        syntax="proto3",
+        dependency=["interface.proto"],
+        source_code_info=SourceCodeInfo(),
+        message_type=[
+            DescriptorProto(
+                name="Device",
+                field=[
+                    FieldDescriptorProto(
+                        name="interface",
+                        number=1,
+                        label=FieldDescriptorProtoLabel.OPTIONAL,
+                        type=FieldDescriptorProtoType.MESSAGE,
+                        type_name=".interface.Interface",
+                    )
+                ],
+            ),
+        ],
+    )
+
+    def generate(parameter: str = f"cache_dir={tmp_path}", serialized: bool = False) -> dict[str, str]:
+        source_files = [interface_file, device_file]
+        response = generate_code(
+            CodeGeneratorRequest(
+                file_to_generate=[source_file.name for source_file in source_files],
+                proto_file=source_files,
+                parameter=parameter,
+            ),
+            [bytes(source_file) for source_file in source_files] if serialized else None,
+        )
+        return {file.name: file.content for file in response.file}
+
+    files = generate()
+    assert files == generate("")
+    assert len(list(tmp_path.glob("*.json"))) == 2
+
+    # The cached files are returned as they are
+    for path in tmp_path.glob("*.json"):
+        path.write_text(path.read_text().replace("class ", "class Cached"))
+    assert "class CachedDevice" in generate()["device/__init__.py"]
+    assert "class CachedDevice" in generate(serialized=True)["device/__init__.py"]
+    assert "class CachedDevice" not in generate(f"cache_dir={tmp_path},strip_comments")["device/__init__.py"]
+
+    # A package is generated again when one of the files it imports changes
+    interface_file.message_type.append(DescriptorProto(name="Port"))
+    files = generate()
+    assert "class CachedDevice" not in files["device/__init__.py"]
+    assert "class Port" in files["interface/__init__.py"]
+
+
+def test_cache_matches_serialized_files_by_name(tmp_path):
+    source_files = [
+        FileDescriptorProto(name=f"{name}.proto", package=name, message_type=[DescriptorProto(name="Message")])
+        for name in ("first", "second")
+    ]
+    request = CodeGeneratorRequest(file_to_generate=["first.proto", "second.proto"], proto_file=source_files)
+    output_file = OutputTemplate(
+        parent_request=PluginRequestCompiler(plugin_request_obj=request),
+        package_proto_obj=source_files[0],
+        settings=get_settings([]),
+        input_files=[source_files[0]],
+    )
+
+    def key(serialized_proto_files: list[bytes] | None) -> str:
+        return OutputCache(str(tmp_path), source_files, get_settings([]), serialized_proto_files).key(output_file)
+
+    serialized = [bytes(source_file) for source_file in source_files]
+    assert key(serialized) == key(None)
+    assert key(serialized[::-1]) == key(None)
+
+
+@pytest.mark.parametrize("content", ["", "{", "[]", '{"__init__.py": 1}', '{"__init__.py": null}'])
+def test_cache_ignores_malformed_files(tmp_path, content: str):
+    cache = OutputCache(str(tmp_path), [], get_settings([]))
+    cache.put("key", {"__init__.py": "import aristaproto\n"})
+    assert cache.get("key") == {"__init__.py": "import aristaproto\n"}
+
+    tmp_path.joinpath("key.json").write_text(content)
+    assert cache.get("key") is None
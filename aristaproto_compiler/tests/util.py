@@ -12,6 +12,12 @@ async def protoc(
     reference: bool = False,
     pydantic_dataclasses: bool = False,
     google_protobuf_descriptors: bool = False,
+    codegen_codecs: bool = False,
+    lazy_submodules: bool = False,
+    lazy_enums: bool = False,
+    strip_comments: bool = False,
+    documented_stubs: bool = False,
+    cache_dir: str | Path | None = None,
     client_generation: str = "async_sync",
     server_generation: str = "async",
     client_async_transport: str | None = None,
@@ -40,6 +46,24 @@ async def protoc(
         if google_protobuf_descriptors:
             command.insert(3, "--python_aristaproto_opt=google_protobuf_descriptors")
 
+        if codegen_codecs:
+            command.insert(3, "--python_aristaproto_opt=codegen_codecs")
+
+        if lazy_submodules:
+            command.insert(3, "--python_aristaproto_opt=lazy_submodules")
+
+        if lazy_enums:
+            command.insert(3, "--python_aristaproto_opt=lazy_enums")
+
+        if strip_comments:
+            command.insert(3, "--python_aristaproto_opt=strip_comments")
+
+        if documented_stubs:
+            command.insert(3, "--python_aristaproto_opt=documented_stubs")
+
+        if cache_dir is not None:
+            command.insert(3, f"--python_aristaproto_opt=cache_dir={Path(cache_dir).resolve().as_posix()}")
+
         if client_async_transport is not None:
             command.insert(3, f"--python_aristaproto_opt=client_async_transport={client_async_transport}")
 